@@ -0,0 +1,256 @@
+# benchmarks/bench_page_objects.py
+"""
+页面对象基准测试 - 在本地模拟后端上测量框架自身的开销
+测量浏览器启动、上下文创建、登录，以及不同列表规模下文献列表和详情页的读取耗时，
+结果连同机器信息保存为JSON，并与基线对比，超过阈值的退化返回非0退出码
+
+用法（在src目录下执行）：
+    python -m benchmarks.bench_page_objects                       # 运行并与基线对比
+    python -m benchmarks.bench_page_objects --save-baseline       # 运行并把结果保存为新基线
+    python -m benchmarks.bench_page_objects --sizes 10 100 --repeat 3
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from playwright.sync_api import sync_playwright
+from pages.literature_detail_page import LiteratureDetailPage
+from pages.login_page import LoginPage
+from pages.weekly_literature_page import WeeklyLiteraturePage
+from utils.action_events import ActionEventLog
+from utils.browser_pool import launch_options_from_config
+from utils.config import load_config
+from utils.data_store import DataStore
+from utils.logger import Logger
+from utils.mock_server import MockBackend
+
+# 默认参数
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+DEFAULT_OUTPUT_DIR = "reports/benchmarks"
+DEFAULT_THRESHOLD = 0.2  # 中位数比基线慢20%以上视为退化
+
+
+def measure(func, repeat, setup=None):
+    """
+    多次执行并统计耗时
+    Args:
+        func: 被测函数
+        repeat: 执行次数
+        setup: 每次执行前调用的准备函数（不计入耗时）
+    Returns:
+        统计字典（毫秒）
+    """
+    durations = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+    return {
+        'repeat': repeat,
+        'min': round(durations[0], 3),
+        'median': round(statistics.median(durations), 3),
+        'mean': round(statistics.mean(durations), 3),
+        'max': round(durations[-1], 3)
+    }
+
+
+def machine_metadata(browser=None):
+    """
+    收集机器和环境信息，不同机器上的结果不可直接比较
+    Args:
+        browser: Playwright的Browser对象
+    Returns:
+        元数据字典
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        'time': datetime.now().isoformat(timespec='seconds'),
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'browser': f"{browser.browser_type.name} {browser.version}" if browser else "",
+        'commit': commit
+    }
+
+
+def run_benchmarks(config, test_data, sizes, repeat):
+    """
+    运行全部基准测试
+    Args:
+        config: Config对象
+        test_data: 测试数据（提供账号）
+        sizes: 文献列表规模
+        repeat: 每项执行次数
+    Returns:
+        (结果字典 {名称: 统计}, 机器信息)
+    """
+    results = {}
+    user = test_data['test_user']
+    launch_options = dict(launch_options_from_config(config), headless=True, slow_mo=0)
+
+    with MockBackend.from_config(config, test_data, count=max(sizes)) as backend, sync_playwright() as p:
+        launcher = getattr(p, config.browser.type)
+
+        results['browser_launch'] = measure(lambda: launcher.launch(**launch_options).close(), max(1, repeat // 2))
+
+        browser = launcher.launch(**launch_options)
+        try:
+            metadata = machine_metadata(browser)
+            results['context_create'] = measure(lambda: browser.new_context().close(), repeat)
+
+            # 登录：每次使用全新上下文，只统计填写、提交到离开登录页的耗时
+            state = {}
+
+            def open_login_page():
+                if 'context' in state:
+                    state['context'].close()
+                state['context'] = browser.new_context()
+                state['login_page'] = LoginPage(state['context'].new_page(), backend.base_url)
+                state['login_page'].goto_login_page()
+
+            def login():
+                state['login_page'].login(user['username'], user['password'])
+                state['login_page'].wait_for_login_complete()
+
+            results['login'] = measure(login, repeat, setup=open_login_page)
+            storage_state = state['context'].storage_state()
+            state['context'].close()
+
+            context = browser.new_context(storage_state=storage_state)
+            page = context.new_page()
+            weekly_page = WeeklyLiteraturePage(page, backend.base_url)
+            for size in sizes:
+                page.goto(f"{backend.base_url}/?count={size}")
+                if not weekly_page.wait_until_ready():
+                    raise RuntimeError(f"文献列表页加载超时: count={size}")
+                # 冷读取：每次丢弃快照，测量整表采集；热读取：快照未变化时只做版本检查
+                results[f'get_literature_info_by_index[{size}]'] = measure(
+                    lambda: weekly_page.get_literature_info_by_index(size - 1),
+                    repeat,
+                    setup=weekly_page.invalidate_snapshot
+                )
+                results[f'get_literature_info_by_index_cached[{size}]'] = measure(
+                    lambda: weekly_page.get_literature_info_by_index(size - 1),
+                    repeat
+                )
+                results[f'get_all_literature_titles[{size}]'] = measure(
+                    weekly_page.get_all_literature_titles,
+                    repeat,
+                    setup=weekly_page.invalidate_snapshot
+                )
+
+            # 详情页：每次重新加载页面，使提取结果的缓存失效
+            detail_page = LiteratureDetailPage(page)
+            page.goto(f"{backend.base_url}/literature/0")
+
+            def reload_detail_page():
+                page.reload()
+                detail_page.wait_for_page_load()
+
+            results['get_full_literature_info'] = measure(
+                detail_page.get_full_literature_info,
+                repeat,
+                setup=reload_detail_page
+            )
+            context.close()
+        finally:
+            browser.close()
+    return results, metadata
+
+
+def compare(results, baseline, threshold):
+    """
+    与基线对比中位数
+    Args:
+        results: 本次结果
+        baseline: 基线结果
+        threshold: 允许的变慢比例
+    Returns:
+        [(名称, 基线中位数, 本次中位数, 变化比例, 是否退化)]，按基线中的名称
+    """
+    rows = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None or not base['median']:
+            continue
+        change = current['median'] / base['median'] - 1
+        rows.append((name, base['median'], current['median'], change, change > threshold))
+    return rows
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="页面对象基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="文献列表规模")
+    parser.add_argument("--repeat", type=int, default=5, help="每项执行次数")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线文件")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="允许的变慢比例，如0.2表示20%%")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="结果保存目录")
+    parser.add_argument("--save-baseline", action="store_true", help="把本次结果保存为基线")
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    test_data = DataStore().load(config.get('mock_backend')['data_file'])
+
+    # 测量框架本身：关闭逐条日志输出和操作事件
+    Logger().configure({**config.get('logging', {}), 'level': "WARNING"})
+    ActionEventLog().configure({'enabled': False})
+
+    results, metadata = run_benchmarks(config, test_data, args.sizes, args.repeat)
+    report = {'metadata': metadata, 'results': results}
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    output = os.path.join(args.output_dir, f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"结果已保存: {output}")
+
+    for name, stats in results.items():
+        print(f"{stats['median']:>10.1f} ms  {name}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"基线已更新: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"没有基线文件 {args.baseline}，使用 --save-baseline 生成")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline['metadata'].get('host') != metadata['host']:
+        print(f"注意：基线来自另一台机器（{baseline['metadata'].get('host')}），对比结果仅供参考")
+
+    print(f"\n与基线对比（阈值 +{args.threshold:.0%}）")
+    regressions = 0
+    for name, base, current, change, regressed in compare(results, baseline['results'], args.threshold):
+        regressions += regressed
+        print(f"{'退化' if regressed else '正常'} {change:>+8.1%}  {base:>9.1f} -> {current:>9.1f} ms  {name}")
+    if regressions:
+        print(f"\n{regressions} 项超过阈值")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+# benchmarks/bench_startup.py
+"""
+启动基准测试 - 测量 pytest --collect-only 的耗时并检查收集阶段是否保持轻量
+收集用例时不应导入playwright、不应创建reports下的日志文件和目录；
+中位数超过目标耗时或检查不通过时返回非0退出码
+
+用法（在src目录下执行）：
+    python -m benchmarks.bench_startup                    # 默认执行5次
+    python -m benchmarks.bench_startup --repeat 10 --target-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# 默认参数
+DEFAULT_REPEAT = 5
+DEFAULT_TARGET_MS = 2000
+REPORTS_DIR = "reports"
+
+# 收集阶段不应加载的模块（只在浏览器fixture首次使用时导入）
+DEFERRED_MODULES = ("playwright", "playwright.sync_api", "playwright.async_api", "utils.mock_server")
+
+# pytest-html、allure插件自行创建的报告目录
+PLUGIN_REPORT_DIRS = ("html", "allure-results")
+
+COLLECT_ARGS = ["--collect-only", "-q", "-p", "no:cacheprovider"]
+
+# 在子进程中执行收集，输出收集结束后已加载的模块
+MODULE_PROBE = (
+    "import json, sys, pytest\n"
+    "code = pytest.main({args!r})\n"
+    "sys.stdout.flush()\n"
+    "print('\\n' + json.dumps({{'exit_code': int(code), 'modules': sorted(m for m in {modules!r} if m in sys.modules)}}))\n"
+)
+
+
+def _snapshot(directory):
+    """列出目录下所有文件和子目录及其修改时间、大小"""
+    paths = {}
+    for root, dirs, files in os.walk(directory):
+        for name in dirs + files:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            paths[path] = (stat.st_mtime_ns, stat.st_size)
+    return paths
+
+
+def time_collection(repeat):
+    """
+    多次在子进程中执行 pytest --collect-only（包含解释器和插件的启动时间）
+    Args:
+        repeat: 执行次数
+    Returns:
+        每次耗时列表（毫秒）
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", *COLLECT_ARGS], capture_output=True, text=True
+        )
+        durations.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"收集用例失败:\n{result.stdout}\n{result.stderr}")
+    return durations
+
+
+def probe_collection():
+    """
+    执行一次收集，返回收集后已加载的延迟模块和新产生（或被修改）的文件
+    Returns:
+        (已加载的模块列表, 新产生或被修改的路径列表)
+    """
+    before = _snapshot(REPORTS_DIR)
+    result = subprocess.run(
+        [sys.executable, "-c", MODULE_PROBE.format(args=COLLECT_ARGS, modules=DEFERRED_MODULES)],
+        capture_output=True, text=True
+    )
+    after = _snapshot(REPORTS_DIR)
+    created = sorted(path for path, signature in after.items() if before.get(path) != signature)
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    if probe['exit_code'] != 0:
+        raise RuntimeError(f"收集用例失败:\n{result.stdout}\n{result.stderr}")
+    return probe['modules'], created
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="pytest启动（收集用例）基准测试")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="执行次数")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS, help="收集耗时中位数的目标（毫秒）")
+    args = parser.parse_args(argv)
+
+    durations = time_collection(args.repeat)
+    median = statistics.median(durations)
+    print(f"pytest --collect-only  中位数 {median:.1f} ms  最小 {min(durations):.1f} ms  最大 {max(durations):.1f} ms")
+
+    failures = 0
+    if median > args.target_ms:
+        print(f"超过目标耗时 {args.target_ms:.0f} ms")
+        failures += 1
+
+    modules, created = probe_collection()
+    if modules:
+        print(f"收集阶段加载了应延迟导入的模块: {', '.join(modules)}")
+        failures += 1
+    # pytest-html/allure插件按pytest.ini的--html、--alluredir自行生成的报告不计入
+    plugin_dirs = tuple(os.path.join(REPORTS_DIR, name) for name in PLUGIN_REPORT_DIRS)
+    created = [path for path in created if not path.startswith(plugin_dirs)]
+    if created:
+        print(f"收集阶段创建了文件或目录: {', '.join(created)}")
+        failures += 1
+
+    if failures:
+        return 1
+    print("收集阶段未导入浏览器模块，未创建日志文件和目录")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,98 +4,592 @@
 Pytest配置文件 - 定义全局fixtures和钩子函数
 实现测试环境的初始化、清理和报告生成
 """
+import allure
 import pytest
-import yaml
 import os
-from playwright.sync_api import sync_playwright
-from datetime import datetime
+from contextlib import contextmanager
+from utils.action_events import ActionEventLog
+from utils.artifacts import ArtifactPolicy
+from utils.auth_state import AuthStateCache
+from utils.browser_pool import BrowserPool
+from utils.config import DEFAULT_CONFIG_FILE, load_config as load_config_file, slow_mo_warning
+from utils.data_driven import iter_data_cases, parse_shard, select_cases
+from utils.data_store import DataStore
+from utils.event_analyzer import find_event_files, format_report, load_events, summarize
+from utils.har_replay import HarReplay, MODES as HAR_MODES, MODE_RECORD
 from utils.logger import Logger
+from utils.route_profiles import RouteProfile
+from utils.tracing import TraceRecorder, MODES as TRACING_MODES
+from utils.report_merge import clear_worker_logs, merge_worker_logs, write_allure_environment
+from utils.retry import RetryPolicy, run_test_with_retries, supports_retry
+from utils.sleep_lint import lint_paths
+from utils.worker import get_worker_index
 
 # 全局配置
 CONFIG = None
+# 提供Page对象的fixture，失败截图时按顺序查找
+PAGE_FIXTURES = ('browser_context', 'logged_in_context')
+# 浏览器进程池（每个进程/xdist worker一个）
+BROWSER_POOL = None
+# 截图策略（每个进程/xdist worker一个）
+ARTIFACT_POLICY = None
+# 失败重试策略
+RETRY_POLICY = None
 LOGGER = Logger().get_logger()
 
+def pytest_addoption(parser):
+    """注册命令行参数"""
+    parser.addoption(
+        "--sweep",
+        action="store_true",
+        default=False,
+        help="运行全量扫描用例（标记为sweep，逐篇验证本周文献速递的所有详情页）"
+    )
+    parser.addoption(
+        "--har",
+        choices=HAR_MODES,
+        default=None,
+        help="HAR录制/回放模式，覆盖config.yaml中的network.har.mode：record录制线上流量，replay离线回放"
+    )
+    parser.addoption(
+        "--tracing",
+        choices=TRACING_MODES,
+        default=None,
+        help="Playwright trace模式，覆盖config.yaml中的tracing.mode"
+    )
+    parser.addoption(
+        "--mock-backend",
+        action="store_true",
+        default=False,
+        help="启动本地模拟后端，用例访问模拟后端而不是base_url"
+    )
+    parser.addoption(
+        "--mock-count",
+        type=int,
+        default=None,
+        help="模拟后端的文献数量，覆盖config.yaml中的mock_backend.literature_count"
+    )
+    parser.addoption(
+        "--mock-profile",
+        default=None,
+        help="模拟后端的延迟和错误注入配置，覆盖config.yaml中的mock_backend.profile"
+    )
+    parser.addoption(
+        "--retries",
+        type=int,
+        default=None,
+        help="基础设施类失败（网络超时、浏览器崩溃）的最多重试次数，覆盖config.yaml中的retry.max_retries，0表示不重试"
+    )
+    parser.addoption(
+        "--env",
+        default=None,
+        help="运行环境（config.yaml的environments中定义，如ci），也可用环境变量AUTOTEST_ENV指定"
+    )
+    parser.addoption(
+        "--profile",
+        default=None,
+        help="执行配置（config.yaml的profiles中定义：debug/ci/perf），也可用环境变量AUTOTEST_PROFILE指定"
+    )
+    parser.addoption(
+        "--set",
+        dest="config_overrides",
+        action="append",
+        default=[],
+        metavar="段.项=值",
+        help="覆盖config.yaml中的配置，如 --set browser.slow_mo=0，可多次指定"
+    )
+    parser.addoption(
+        "--data-tag",
+        action="append",
+        default=[],
+        help="只运行带指定标签的数据驱动用例（数据中的tags字段），可多次指定；没有定义标签的数据集不受影响"
+    )
+    parser.addoption(
+        "--data-shard",
+        default=None,
+        help="按数据id分片执行数据驱动用例，如 1/4 表示共4片中的第1片"
+    )
+
+def pytest_generate_tests(metafunc):
+    """
+    展开数据驱动用例：@pytest.mark.datafile("文件名", key=数据集字段, argname=参数名)
+    每条数据生成一个用例，用例id为数据的稳定id
+    """
+    marker = metafunc.definition.get_closest_marker("datafile")
+    if marker is None:
+        return
+    file_name = marker.args[0]
+    argname = marker.kwargs.get('argname', "case")
+    shard_option = metafunc.config.getoption("--data-shard")
+    shard = parse_shard(shard_option) if shard_option else None
+    
+    cases = select_cases(
+        iter_data_cases(file_name, marker.kwargs.get('key')),
+        tags=metafunc.config.getoption("--data-tag"),
+        shard=shard,
+        prefix=metafunc.definition.nodeid
+    )
+    metafunc.parametrize(argname, [pytest.param(case.values, id=case.id) for case in cases])
+
+def pytest_collection_modifyitems(config, items):
+    """未指定--sweep时跳过全量扫描用例"""
+    if config.getoption("--sweep"):
+        return
+    skip_sweep = pytest.mark.skip(reason="全量扫描用例，需加 --sweep 参数运行")
+    for item in items:
+        if "sweep" in item.keywords:
+            item.add_marker(skip_sweep)
+
+def _load_config_file(pytestconfig=None):
+    """
+    读取config.yaml并依次应用环境、执行配置、AUTOTEST_环境变量和命令行--set覆盖（每个进程只读取一次）
+    Args:
+        pytestconfig: pytest的Config对象，首次读取（pytest_configure）时传入以读取--env、--profile和--set
+    Returns:
+        不可变的Config对象
+    """
+    global CONFIG
+    if CONFIG is None:
+        options = pytestconfig.option if pytestconfig is not None else None
+        CONFIG = load_config_file(
+            DEFAULT_CONFIG_FILE,
+            environment=getattr(options, "env", None),
+            profile=getattr(options, "profile", None),
+            overrides=getattr(options, "config_overrides", None) or ()
+        )
+        LOGGER.info(
+            f"配置文件已加载: {DEFAULT_CONFIG_FILE}，环境: {CONFIG.environment or '默认'}，"
+            f"执行配置: {CONFIG.profile or '默认'}"
+        )
+        warning = slow_mo_warning(CONFIG)
+        if warning:
+            LOGGER.warning(warning)
+    return CONFIG
+
 def pytest_configure(config):
     """Pytest启动时的配置"""
+    # 只收集用例时日志只输出到控制台，不创建日志文件
+    collect_only = config.option.collectonly
+    if collect_only:
+        Logger().configure({'to_file': False, 'async': False})
+    
+    # 检查分片参数格式
+    if config.getoption("--data-shard"):
+        try:
+            parse_shard(config.getoption("--data-shard"))
+        except ValueError as e:
+            raise pytest.UsageError(str(e)) from None
+    
+    # 读取配置（环境、环境变量和--set覆盖有误时给出用法错误）
+    try:
+        _load_config_file(config)
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from None
+    
+    # 只收集用例时不创建目录、不写日志文件、不清理上一次执行的结果
+    if collect_only:
+        Logger().configure({**_load_config_file().get('logging', {}), 'to_file': False, 'async': False})
+        return
+    
     # 创建必要的目录
     os.makedirs("reports/screenshots", exist_ok=True)
     os.makedirs("reports/logs", exist_ok=True)
     os.makedirs("reports/html", exist_ok=True)
     
+    # 按config.yaml的logging配置设置日志级别和异步输出
+    Logger().configure(_load_config_file().get('logging'))
+    
+    # 页面操作事件：主进程清理上一次执行的事件文件，各worker写入自己的文件
+    event_log = ActionEventLog()
+    event_log.configure(CONFIG.get('events'))
+    if not hasattr(config, "workerinput"):
+        for path in find_event_files([event_log.settings['dir']]):
+            os.remove(path)
+        _get_retry_policy(config).clear_stats()
+        # worker日志为追加写入，worker启动前清理，避免合并时混入之前的执行
+        clear_worker_logs()
+    
     LOGGER.info("=" * 50)
     LOGGER.info("测试开始执行")
     LOGGER.info("=" * 50)
 
+def pytest_sessionfinish(session):
+    """xdist主进程（或串行执行）结束时合并各worker日志，补充Allure环境信息"""
+    # 截图、异步日志和操作事件先全部写入文件，再合并
+    if ARTIFACT_POLICY is not None:
+        ARTIFACT_POLICY.flush()
+    Logger().flush()
+    ActionEventLog().flush()
+    if hasattr(session.config, "workerinput") or session.config.option.collectonly:
+        return
+    
+    merged_log = merge_worker_logs()
+    if merged_log:
+        LOGGER.info(f"各worker日志已合并: {merged_log}")
+    
+    if CONFIG is not None:
+        write_allure_environment(
+            session.config.getoption("alluredir", None),
+            {
+                'environment': CONFIG.environment or 'default',
+                'profile': CONFIG.profile or 'default',
+                'base_url': CONFIG.base_url,
+                'browser': CONFIG.browser.type,
+                'headless': CONFIG.headless,
+                'har': session.config.getoption("--har") or CONFIG.get('network', {}).get('har', {}).get('mode', 'off'),
+                'workers': getattr(session.config.option, "numprocesses", None) or 1
+            }
+        )
+
 def pytest_unconfigure(config):
     """Pytest结束时的清理"""
+    global BROWSER_POOL, ARTIFACT_POLICY
+    if BROWSER_POOL is not None:
+        BROWSER_POOL.close()
+        BROWSER_POOL = None
+    if ARTIFACT_POLICY is not None:
+        ARTIFACT_POLICY.close()
+        ARTIFACT_POLICY = None
+
     LOGGER.info("=" * 50)
     LOGGER.info("测试执行完毕")
     LOGGER.info("=" * 50)
+    ActionEventLog().close()
+    Logger().shutdown()
+
+def pytest_terminal_summary(terminalreporter):
+    """在测试总结中列出test_cases中残留的固定等待，以及本次执行的页面操作耗时"""
+    findings = lint_paths(['test_cases'])
+    if findings:
+        terminalreporter.section("固定等待检查")
+        for path, lineno, code in findings:
+            terminalreporter.write_line(f"{path}:{lineno}: {code}")
+    
+    # 只收集用例或没有执行任何用例时，事件和重试统计文件是上一次执行留下的，不输出
+    if not _tests_executed(terminalreporter):
+        return
+    
+    summary = summarize(load_events([ActionEventLog().settings['dir']]))
+    if summary['by_action']:
+        terminalreporter.section("页面操作耗时")
+        terminalreporter.write_line(format_report(summary, top=5))
+        terminalreporter.write_line("完整统计: python -m utils.event_analyzer")
+    
+    retried = _get_retry_policy(terminalreporter.config).load_stats()
+    if retried:
+        terminalreporter.section("失败分类与重试")
+        selectors = {}
+        for entry in retried:
+            categories = ", ".join(failure['category'] for failure in entry['failures'])
+            result = "重试后通过（不稳定）" if entry['outcome'] == "passed" else "失败"
+            terminalreporter.write_line(f"{entry['nodeid']}: 执行{entry['attempts']}次，{result}，失败分类: {categories}")
+            for failure in entry['failures']:
+                if failure['selector']:
+                    selectors[failure['selector']] = selectors.get(failure['selector'], 0) + 1
+        for selector, count in sorted(selectors.items(), key=lambda pair: -pair[1]):
+            terminalreporter.write_line(f"失败元素 {selector}: {count}次")
+
+def _tests_executed(terminalreporter):
+    """本次会话是否执行过用例（收集阶段的错误不算）"""
+    if terminalreporter.config.option.collectonly:
+        return False
+    return any(
+        getattr(report, "when", None) in ("setup", "call", "teardown")
+        for reports in terminalreporter.stats.values()
+        for report in reports
+    )
+
+def _get_retry_policy(config):
+    """获取重试策略（每个进程一个，--retries优先于config.yaml）"""
+    global RETRY_POLICY
+    if RETRY_POLICY is None:
+        RETRY_POLICY = RetryPolicy.from_config(_load_config_file(), max_retries=config.getoption("--retries"))
+    return RETRY_POLICY
+
+def _last_failed_selector(item):
+    """用例中最近一次失败的元素操作的选择器"""
+    last_failure = ActionEventLog().last_failure
+    return last_failure[1] if last_failure and last_failure[0] == item.nodeid else None
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    执行用例，基础设施类失败（网络超时、浏览器崩溃）时重试
+    重试只重建function级fixture，浏览器进程池、登录状态缓存、模拟后端等会话级资源直接复用
+    """
+    policy = _get_retry_policy(item.config)
+    if policy.max_retries <= 0 or item.get_closest_marker("no_retry"):
+        return None
+    # --setup-only/--setup-show只展示fixture，交给pytest默认流程
+    if item.config.getoption("setuponly", False) or item.config.getoption("setupshow", False):
+        return None
+    if not supports_retry(item):
+        return None
+    
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    entry = run_test_with_retries(item, nextitem, policy, failed_selector=lambda: _last_failed_selector(item))
+    if entry['attempts'] > 1:
+        LOGGER.warning(f"用例执行了{entry['attempts']}次，最终{entry['outcome']}: {item.nodeid}")
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+def pytest_report_teststatus(report):
+    """被重试的失败在终端中显示为RERUN"""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    return None
 
 @pytest.fixture(scope="session")
-def load_config():
+def load_config(mock_backend):
     """
     加载配置文件
-    scope="session": 整个测试会话只加载一次
+    scope="session": 整个测试会话只加载一次；开启模拟后端时base_url替换为模拟后端地址
     """
-    global CONFIG
-    if CONFIG is None:
-        config_path = "config/config.yaml"
-        with open(config_path, 'r', encoding='utf-8') as f:
-            CONFIG = yaml.safe_load(f)
-        LOGGER.info(f"配置文件已加载: {config_path}")
-    return CONFIG
+    config = _load_config_file()
+    if mock_backend is not None:
+        config = config.replace(base_url=mock_backend.base_url)
+    return config
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_backend(request):
+    """
+    本地模拟后端
+    scope="session": 开启时（--mock-backend 或 mock_backend.enabled）在会话开始时启动，
+    会话结束时关闭；未开启时返回None
+    """
+    config = _load_config_file()
+    mock_config = config.get('mock_backend', {})
+    if not (request.config.getoption("--mock-backend") or mock_config.get('enabled')):
+        yield None
+        return
+
+    from utils.mock_server import MockBackend
+
+    backend = MockBackend.from_config(
+        config,
+        _read_test_data(mock_config.get('data_file', "weekly_literature_data.yaml")),
+        count=request.config.getoption("--mock-count"),
+        profile=request.config.getoption("--mock-profile")
+    ).start()
+    LOGGER.info(
+        f"模拟后端已启动: {backend.base_url}，文献 {backend.factory.count} 篇，"
+        f"配置: {backend.fault_profile.name}"
+    )
+    yield backend
+    backend.stop()
+    LOGGER.info(f"模拟后端已关闭，共处理请求 {backend.request_count} 个")
+
+def _get_artifact_policy():
+    """获取截图策略（首次使用时按配置创建）"""
+    global ARTIFACT_POLICY
+    if ARTIFACT_POLICY is None:
+        ARTIFACT_POLICY = ArtifactPolicy.from_config(_load_config_file())
+    return ARTIFACT_POLICY
+
+@pytest.fixture(scope="session")
+def artifact_policy(load_config):
+    """
+    截图策略
+    scope="session": 用例中的成功截图通过它保存，是否保存、格式和大小上限由config.yaml的screenshot配置决定
+    """
+    return _get_artifact_policy()
+
+@pytest.fixture(scope="session")
+def browser_pool(load_config):
+    """
+    浏览器进程池
+    scope="session": 整个测试会话（xdist下为每个worker）共用一组已启动的浏览器，
+    进程在pytest_unconfigure时统一关闭
+    """
+    global BROWSER_POOL
+    if BROWSER_POOL is None:
+        BROWSER_POOL = BrowserPool.from_config(load_config)
+    return BROWSER_POOL
+
+@pytest.fixture(scope="session")
+def har_replay(request, load_config):
+    """
+    HAR录制/回放
+    scope="session": 模式在整个会话内不变，--har 优先于config.yaml
+    """
+    har = HarReplay.from_config(load_config, request.config.getoption("--har"))
+    if har.enabled:
+        LOGGER.info(f"HAR模式: {har.mode}，目录: {har.har_dir}")
+    return har
+
+def _new_context(browser, config, har=None, har_name=None, **options):
+    """
+    按配置创建新的浏览器上下文
+    Args:
+        browser: Playwright的Browser对象
+        config: Config对象
+        har: HarReplay实例，开启时在上下文上录制或回放流量
+        har_name: HAR名称
+        options: 额外传给new_context()的参数，如storage_state
+    Returns:
+        BrowserContext对象
+    """
+    context = browser.new_context(viewport=config.browser.viewport.as_dict(), **options)
+    # config.yaml的timeout作为页面操作和导航的默认超时
+    context.set_default_timeout(config.timeout)
+    if har is not None:
+        try:
+            har.attach(context, har_name)
+        except Exception:
+            context.close()
+            raise
+    return context
+
+@contextmanager
+def _open_page(browser_pool, config, har=None, har_name=None, **context_options):
+    """
+    从浏览器池借出浏览器，创建全新的上下文和页面，结束后关闭上下文并归还浏览器
+    录制模式下HAR在上下文关闭时写入磁盘
+    Args:
+        browser_pool: 浏览器池
+        config: Config对象
+        har: HarReplay实例
+        har_name: HAR名称
+        context_options: 额外传给new_context()的参数
+    """
+    browser = browser_pool.acquire()
+    context = _new_context(browser, config, har, har_name, **context_options)
+    try:
+        yield context.new_page()
+    finally:
+        LOGGER.info("关闭浏览器上下文")
+        try:
+            context.close()
+        except Exception as e:
+            LOGGER.warning(f"关闭浏览器上下文失败: {str(e)}")
+        browser_pool.release(browser)
+
+@pytest.fixture(scope="session")
+def trace_recorder(request, load_config):
+    """
+    Playwright trace录制
+    scope="session": 模式在整个会话内不变，--tracing 优先于config.yaml
+    """
+    return TraceRecorder.from_config(load_config, request.config.getoption("--tracing"))
+
+def _start_tracing(request, recorder, context):
+    """
+    按trace模式开始录制当前用例
+    Returns:
+        是否在录制
+    """
+    return recorder.start(context, request.node.nodeid, getattr(request.node, "execution_count", 1))
+
+def _finish_tracing(request, recorder, context):
+    """结束当前用例的录制，保留的trace路径写入日志和Allure报告"""
+    reports = (getattr(request.node, f"rep_{when}", None) for when in ('setup', 'call'))
+    failed = any(report is not None and report.failed for report in reports)
+    try:
+        trace_path = recorder.stop(context, request.node.nodeid, failed)
+    except Exception as e:
+        LOGGER.warning(f"保存trace失败: {str(e)}")
+        return
+    if trace_path:
+        LOGGER.info(f"trace已保存: {trace_path}，查看: playwright show-trace {trace_path}")
+        allure.attach(
+            f"{os.path.abspath(trace_path)}\n\nplaywright show-trace {trace_path}",
+            name="Playwright trace",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+def _apply_routing(request, config, context):
+    """
+    按用例的routing标记（未标记时使用routing.default）在上下文上注册路由
+    Returns:
+        RouteStats
+    """
+    marker = request.node.get_closest_marker("routing")
+    profile = RouteProfile.from_config(config, marker.args[0] if marker else None)
+    return profile.apply(context, config.base_url)
+
+def _record_routing(request, stats):
+    """记录用例的请求统计：写入日志和测试报告的user_properties"""
+    summary = stats.summary()
+    request.node.user_properties.append(("routing", summary))
+    LOGGER.info(
+        f"路由统计[{summary['profile']}]: 请求 {summary['requests']} 个，"
+        f"拦截 {summary['requests_saved']} 个，估算节省 {summary['estimated_bytes_saved'] / 1024:.1f} KB"
+    )
+
+def _read_test_data(file_name):
+    """
+    读取测试数据（每个文件只解析和校验一次，文件修改后自动重新加载）
+    Args:
+        file_name: 测试数据文件名
+    Returns:
+        测试数据的只读视图
+    """
+    return DataStore().load(file_name)
 
 @pytest.fixture(scope="function")
-def browser_context(load_config):
+def browser_context(request, load_config, browser_pool, har_replay, trace_recorder):
     """
     创建浏览器上下文
-    scope="function": 每个测试函数都会创建新的浏览器实例
+    scope="function": 每个测试函数从浏览器池借出浏览器，并创建全新的、未登录的上下文和页面
+    """
+    with _open_page(browser_pool, load_config, har_replay, request.node.nodeid) as page:
+        stats = _apply_routing(request, load_config, page.context)
+        tracing = _start_tracing(request, trace_recorder, page.context)
+        yield page
+        if tracing:
+            _finish_tracing(request, trace_recorder, page.context)
+    _record_routing(request, stats)
+
+@pytest.fixture(scope="session")
+def auth_cache(load_config, har_replay):
+    """
+    登录状态缓存
+    scope="session": 每个会话（xdist下为每个worker）只通过UI登录一次
+    录制模式下先清空缓存，保证登录流量被录制下来
+    """
+    cache = AuthStateCache.from_config(load_config)
+    if har_replay.mode == MODE_RECORD:
+        cache.clear()
+    return cache
+
+@pytest.fixture(scope="function")
+def logged_in_context(request, load_config, browser_pool, auth_cache, har_replay, trace_recorder):
+    """
+    创建已登录的浏览器上下文
+    注入缓存的登录状态，跳过UI登录流程；
+    需要从干净状态开始的用例（如TestLogin）请使用browser_context
     """
     config = load_config
+    # 并行执行时按worker序号分配账号，避免多个worker共用同一账号互相影响
+    data = _read_test_data(config.get('auth')['credentials_file'])
+    users = data.get('test_users') or [data['test_user']]
+    user = users[get_worker_index() % len(users)]
     
-    LOGGER.info("启动浏览器")
-    with sync_playwright() as p:
-        # 根据配置选择浏览器类型
-        browser_type = config['browser']['type']
-        if browser_type == 'chromium':
-            browser = p.chromium.launch(
-                headless=config['headless'],
-                slow_mo=config['browser']['slow_mo']
-            )
-        elif browser_type == 'firefox':
-            browser = p.firefox.launch(
-                headless=config['headless'],
-                slow_mo=config['browser']['slow_mo']
-            )
-        else:
-            browser = p.webkit.launch(
-                headless=config['headless'],
-                slow_mo=config['browser']['slow_mo']
-            )
-        
-        # 创建上下文
-        context = browser.new_context(
-            viewport={
-                'width': config['browser']['viewport']['width'],
-                'height': config['browser']['viewport']['height']
-            }
+    browser = browser_pool.acquire()
+    try:
+        storage_state = auth_cache.get_or_login(
+            browser,
+            config.base_url,
+            user['username'],
+            user['password'],
+            lambda b: _new_context(b, config, har_replay, f"login_{user['username']}")
         )
-        
-        # 创建页面
-        page = context.new_page()
-        
+    finally:
+        browser_pool.release(browser)
+    
+    with _open_page(browser_pool, config, har_replay, request.node.nodeid, storage_state=storage_state) as page:
+        stats = _apply_routing(request, config, page.context)
+        auth_cache.watch(page, config.base_url, user['username'])
+        tracing = _start_tracing(request, trace_recorder, page.context)
         yield page
-        
-        # 测试结束后清理
-        LOGGER.info("关闭浏览器")
-        context.close()
-        browser.close()
+        if tracing:
+            _finish_tracing(request, trace_recorder, page.context)
+    _record_routing(request, stats)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def load_test_data():
     """
-    加载测试数据的工具函数
+    加载测试数据的工具函数（会话级，数据由DataStore缓存）
     Returns:
         加载测试数据的函数
     """
@@ -106,32 +600,32 @@ def load_test_data():
         Args:
             file_name: 测试数据文件名
         Returns:
-            测试数据字典
+            测试数据的只读视图
         """
-        data_path = f"test_data/{file_name}"
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        LOGGER.info(f"测试数据已加载: {data_path}")
-        return data
+        return _read_test_data(file_name)
 
     return _load_data
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    获取测试结果，用于失败时截图
+    获取测试结果，用于失败时截图和决定是否保留trace
     """
     outcome = yield
     report = outcome.get_result()
+    # 记录各阶段结果（rep_setup/rep_call/rep_teardown），供fixture清理时判断用例是否失败
+    setattr(item, f"rep_{report.when}", report)
     
     # 只在测试执行阶段（call）处理
     if report.when == 'call':
         # 测试失败时截图
         if report.failed:
-            # 获取browser_context fixture
-            if 'browser_context' in item.fixturenames:
-                page = item.funcargs['browser_context']
-                screenshot_name = f"{item.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_failed"
-                screenshot_path = f"reports/screenshots/{screenshot_name}.png"
-                page.screenshot(path=screenshot_path)
-                LOGGER.error(f"测试失败截图已保存: {screenshot_path}")
\ No newline at end of file
+            # 获取提供Page对象的fixture
+            page_fixture = next((name for name in PAGE_FIXTURES if name in item.funcargs), None)
+            if page_fixture:
+                page = item.funcargs[page_fixture]
+                # 用例中失败的元素操作，截图时只截取该元素
+                selector = _last_failed_selector(item)
+                screenshot_path = _get_artifact_policy().capture(page, f"{item.name}_failed", selector=selector)
+                if screenshot_path:
+                    LOGGER.error(f"测试失败截图已保存: {screenshot_path}")
\ No newline at end of file
@@ -0,0 +1,165 @@
+'''
+Docstring for pages.async_base_page
+异步基础页面类 - 基于playwright.async_api
+与BasePage提供相同的操作，用于在同一个浏览器中并发驱动多个页面
+'''
+
+
+from typing import TYPE_CHECKING
+from utils.dom_extract import EXTRACT_SCRIPT, FIELDS_READY_SCRIPT, build_field_specs
+from utils.locator_registry import LocatorRegistry
+from utils.logger import Logger
+
+if TYPE_CHECKING:
+    # 只用于类型标注，收集用例时不导入playwright
+    from playwright.async_api import Page
+
+
+class AsyncBasePage:
+    '''
+    Docstring for AsyncBasePage
+    异步基础页面类
+    所有方法均为协程，需在事件循环中await调用
+    '''
+
+    # 页面就绪标志 - 子类声明该选择器可见即认为页面可交互
+    READY_SELECTOR = None
+
+    # 选择器所属容器 - 子类声明后查找限定在容器内，{选择器: 容器选择器}
+    SELECTOR_SCOPES = {}
+
+    def __init__(self, page: "Page"):
+        '''
+        Docstring for __init__
+        初始化页面对象
+        :param self: Description
+        :param page: Playwright的异步Page对象
+        '''
+        self.page = page
+        self.logger = Logger().get_logger()
+        # 每个选择器只创建一次Locator
+        self.locators = LocatorRegistry(page, self.SELECTOR_SCOPES)
+
+    async def navigate_to(self, url):
+        '''
+        Docstring for navigate_to
+        导航到指定url
+        :param self: Description
+        :param url: 目标网址
+        '''
+        self.logger.info(f"导航到网页：{url}")
+        await self.page.goto(url)
+
+    async def click(self, selector):
+        '''
+        Docstring for click
+        点击元素
+        :param self: Description
+        :param selector: 元素选择器
+        '''
+        self.logger.debug("点击元素：%s", selector)
+        await self.page.click(selector)
+
+    async def fill(self, selector, text):
+        '''
+        Docstring for fill
+        填充到输入框
+        :param self: Description
+        :param selector: 元素选择器
+        :param text: 要填充的文本
+        '''
+        self.logger.debug("在%s中输入：%s", selector, text)
+        await self.page.fill(selector, text)
+
+    async def get_text(self, selector):
+        '''
+        Docstring for get_text
+        获取元素文本
+        :param self: Description
+        :param selector: 元素选择器
+        return：元素的文本内容
+        '''
+        text = await self.locators.get(selector).inner_text()
+        self.logger.debug("获取元素%s的文本：%s", selector, text)
+        return text
+
+    async def is_visible(self, selector):
+        '''
+        Docstring for is_visible
+        检查元素是否可见
+        :param self: Description
+        :param selector: 元素选择器
+        return：元素是否可见
+        '''
+        visible = await self.locators.get(selector).is_visible()
+        self.logger.debug("元素%s可见性：%s", selector, visible)
+        return visible
+
+    def get_current_url(self):
+        '''
+        Docstring for get_current_url
+        获取当前的url
+        :param self: Description
+        return：当前url
+        '''
+        return self.page.url
+
+    async def extract_fields(self, fields, root_selector=None, index=None):
+        '''
+        Docstring for extract_fields
+        在一次页面内调用中提取多个字段，规则与BasePage.extract_fields相同
+        :param self: Description
+        :param fields: {字段名: 选择器} 或 {字段名: (选择器, 模式)}
+        :param root_selector: 每行数据的根元素选择器（CSS），为空时在整个页面中查找
+        :param index: 只提取第index个根元素，为空时提取全部
+        return：(根元素数量, 每行的字段字典列表)
+        '''
+        result = await self.page.evaluate(
+            EXTRACT_SCRIPT,
+            [root_selector, index, build_field_specs(fields)]
+        )
+        self.logger.debug("批量提取%s：共%s个，提取%s行", root_selector or '页面', result['count'], len(result['rows']))
+        return result['count'], result['rows']
+
+    async def wait_for_fields(self, fields, required, dependents=None, root_selector=None, index=0, timeout=10000):
+        '''
+        Docstring for wait_for_fields
+        等待必填字段渲染出内容，规则与BasePage.wait_for_fields相同
+        :param self: Description
+        :param fields: 与extract_fields相同的字段定义
+        :param required: 必填字段组，每组中任意一个字段有内容即可
+        :param dependents: {文本字段: 标志字段}，标志为真时该文本字段也必须有内容
+        :param root_selector: 根元素选择器（CSS），为空时在整个页面中查找
+        :param index: 检查第index个根元素
+        :param timeout: 超时时间（毫秒）
+        return：是否在超时前全部渲染
+        '''
+        try:
+            await self.page.wait_for_function(
+                FIELDS_READY_SCRIPT,
+                arg=[root_selector, index, build_field_specs(fields), [list(group) for group in required],
+                     dict(dependents or {})],
+                timeout=timeout
+            )
+            return True
+        except Exception as e:
+            self.logger.warning(f"等待字段渲染超时：{str(e)}")
+            return False
+
+    async def wait_until_ready(self, timeout=10000):
+        '''
+        Docstring for wait_until_ready
+        等待页面就绪：子类声明的READY_SELECTOR可见，未声明时等待DOM加载完成
+        :param self: Description
+        :param timeout: 超时时间（毫秒）
+        return：是否就绪
+        '''
+        try:
+            if self.READY_SELECTOR:
+                await self.page.wait_for_selector(self.READY_SELECTOR, timeout=timeout)
+            else:
+                await self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            return True
+        except Exception as e:
+            self.logger.error(f"页面就绪等待超时：{str(e)}")
+            return False
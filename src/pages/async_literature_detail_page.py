@@ -0,0 +1,220 @@
+'''
+文献详情页面对象（异步） - 基于playwright.async_api
+与LiteratureDetailPage共用LiteratureDetailLocators中的定位器，
+可在同一个浏览器中并发打开多个详情页进行验证
+'''
+import asyncio
+import time
+from typing import TYPE_CHECKING, NamedTuple
+from pages.async_base_page import AsyncBasePage
+from pages.async_weekly_literature_page import resolve_detail_urls
+from pages.literature_detail_page import LiteratureDetailInfo, LiteratureDetailLocators
+from utils.dom_extract import missing_fields
+from utils.async_runner import async_browser_context, new_async_context
+from utils.route_profiles import RouteProfile
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+
+class DetailCheckResult(NamedTuple):
+    '''
+    单个详情页的验证结果
+    '''
+    index: int
+    url: str
+    loaded: bool = False
+    verification: dict = {}
+    title: str = ''
+    duration: float = 0.0
+    error: str = ''
+
+    @property
+    def passed(self):
+        '''页面加载成功且基本信息完整'''
+        return self.loaded and bool(self.verification.get('all_basic_present')) and not self.error
+
+
+class AsyncLiteratureDetailPage(LiteratureDetailLocators, AsyncBasePage):
+    """
+    Docstring for AsyncLiteratureDetailPage
+    文献详情页面类（异步）
+    """
+
+    def __init__(self, page: "Page"):
+        '''
+        Docstring for __init__
+        初始化文献详情页面
+        :param self: Description
+        :param page: Playwright的异步Page对象
+        '''
+        super().__init__(page)
+        self._detail = None
+        # 当前页面上等待必填字段已超时，之后的提取不再重复等待
+        self._fields_timed_out = False
+
+    async def open(self, url):
+        '''
+        Docstring for open
+        打开指定的文献详情页
+        :param self: Description
+        :param url: 详情页地址
+        '''
+        self._detail = None
+        self._fields_timed_out = False
+        await self.navigate_to(url)
+
+    async def wait_for_page_load(self, timeout=10000):
+        '''
+        Docstring for wait_for_page_load
+        等待页面加载完成
+        :param self: Description
+        :param timeout: 超时时间（毫秒）
+        return: 是否加载完成
+        '''
+        return await self.wait_until_ready(timeout=timeout)
+
+    async def extract_detail(self, refresh=False, timeout=10000):
+        '''
+        Docstring for extract_detail
+        等待必填字段渲染后，在一次页面内调用中提取详情页所有字段，open()之前的结果会被丢弃
+        规则与LiteratureDetailPage.extract_detail相同：不完整的结果不缓存
+        :param self: Description
+        :param refresh: 是否强制重新提取
+        :param timeout: 等待必填字段的超时时间（毫秒），同一页面只等待一次
+        return: LiteratureDetailInfo
+        '''
+        if self._detail is not None and not refresh:
+            return self._detail
+
+        if not self._fields_timed_out:
+            self._fields_timed_out = not await self.wait_for_fields(
+                self.DETAIL_FIELDS, self.REQUIRED_DETAIL_FIELDS, self.DEPENDENT_DETAIL_FIELDS, timeout=timeout
+            )
+        _, rows = await self.extract_fields(self.DETAIL_FIELDS)
+        detail = LiteratureDetailInfo(
+            **{name: '' if value is None else value for name, value in rows[0].items()}
+        )
+        if not missing_fields(rows[0], self.REQUIRED_DETAIL_FIELDS, self.DEPENDENT_DETAIL_FIELDS):
+            self._detail = detail
+        return detail
+
+    async def verify_basic_info_complete(self):
+        '''
+        Docstring for verify_basic_info_complete
+        验证基本信息是否完整
+        :param self: Description
+        return: 验证结果字典
+        '''
+        result = (await self.extract_detail()).verify_basic_info()
+        self.logger.info(f"基本信息验证结果: {result}")
+        return result
+
+
+async def validate_literature_details(context: "BrowserContext", urls, concurrency=5, timeout=10000,
+                                      on_result=None, isolate_contexts=False, context_factory=None):
+    '''
+    Docstring for validate_literature_details
+    并发打开详情页并验证基本信息
+    同时打开的页面数不超过concurrency，总耗时接近最慢的若干页面而不是所有页面之和
+    :param context: Playwright的异步BrowserContext
+    :param urls: 详情页地址列表，元素也可以是(索引, 地址)
+    :param concurrency: 最大并发页面数
+    :param timeout: 单个页面的加载超时（毫秒）
+    :param on_result: 每完成一个页面时的回调，参数为DetailCheckResult
+    :param isolate_contexts: True时每个页面使用独立的上下文（cookie等互不影响），False时共用context的标签页
+    :param context_factory: 创建独立上下文的协程函数（无参数），应与context使用相同的视口、超时和路由，
+                            如 lambda: new_async_context(browser, config, route_profile, storage_state=...)
+    return: 与urls顺序一致的DetailCheckResult列表
+    '''
+    if isolate_contexts and context_factory is None:
+        raise ValueError("isolate_contexts=True时需要提供context_factory")
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def check(index, url):
+        async with semaphore:
+            start = time.perf_counter()
+            page_context = await context_factory() if isolate_contexts else context
+            page = await page_context.new_page()
+            detail_page = AsyncLiteratureDetailPage(page)
+            try:
+                await detail_page.open(url)
+                loaded = await detail_page.wait_for_page_load(timeout=timeout)
+                # 未加载的页面不再等待字段渲染
+                info = await detail_page.extract_detail(timeout=timeout) if loaded else LiteratureDetailInfo()
+                verification = info.verify_basic_info() if loaded else {}
+                result = DetailCheckResult(
+                    index=index,
+                    url=url,
+                    loaded=loaded,
+                    verification=verification,
+                    title=info.display_title,
+                    duration=time.perf_counter() - start
+                )
+            except Exception as e:
+                result = DetailCheckResult(
+                    index=index,
+                    url=url,
+                    duration=time.perf_counter() - start,
+                    error=str(e)
+                )
+            finally:
+                await page.close()
+                if isolate_contexts:
+                    await page_context.close()
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    targets = [target if isinstance(target, tuple) else (index, target) for index, target in enumerate(urls)]
+    return list(await asyncio.gather(*(check(index, url) for index, url in targets)))
+
+
+async def sweep_literature_details(config, links, storage_state=None, on_result=None):
+    '''
+    Docstring for sweep_literature_details
+    全量扫描：在一个浏览器中并发验证列表中的所有详情页
+    没有链接的文献先通过点击解析出详情页地址
+    :param config: Config对象，使用browser、concurrency、routing和sweep配置
+    :param links: 与列表顺序一致的详情页地址，None表示需要点击解析
+    :param storage_state: 登录状态
+    :param on_result: 每完成一个页面时的回调，参数为DetailCheckResult
+    return: DetailCheckResult列表（按列表顺序）
+    '''
+    sweep_config = config.get('sweep', {})
+    concurrency = config.get('concurrency', {}).get('detail_pages', 5)
+    timeout = sweep_config.get('page_timeout', 10000)
+    isolate_contexts = sweep_config.get('isolation', 'tabs') == 'contexts'
+    context_options = {'storage_state': storage_state} if storage_state else {}
+
+    # 共享上下文和独立上下文使用同一个路由配置
+    route_profile = RouteProfile.from_config(config, sweep_config.get('routing'))
+
+    async with async_browser_context(config, route_profile, **context_options) as context:
+        missing = [index for index, link in enumerate(links) if not link]
+        resolved = {}
+        if missing:
+            resolved = await resolve_detail_urls(context, config.base_url, missing, concurrency, timeout)
+
+        targets = []
+        results = []
+        for index, link in enumerate(links):
+            url = link or resolved.get(index)
+            if url:
+                targets.append((index, url))
+            else:
+                result = DetailCheckResult(index=index, url='', error="无法获取详情页地址")
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+
+        results.extend(await validate_literature_details(
+            context,
+            targets,
+            concurrency=concurrency,
+            timeout=timeout,
+            on_result=on_result,
+            isolate_contexts=isolate_contexts,
+            context_factory=lambda: new_async_context(context.browser, config, route_profile, **context_options)
+        ))
+    return sorted(results, key=lambda result: result.index)
@@ -0,0 +1,110 @@
+'''
+本周文献速递页面对象（异步） - 基于playwright.async_api
+与WeeklyLiteraturePage共用WeeklyLiteratureLocators中的定位器
+'''
+import asyncio
+from typing import TYPE_CHECKING
+from pages.async_base_page import AsyncBasePage
+from pages.weekly_literature_page import LiteratureInfo, WeeklyLiteratureLocators
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+
+class AsyncWeeklyLiteraturePage(WeeklyLiteratureLocators, AsyncBasePage):
+    """
+    Docstring for AsyncWeeklyLiteraturePage
+    本周文献速递页面类（异步）
+    """
+
+    def __init__(self, page: "Page", base_url):
+        '''
+        Docstring for __init__
+        初始化本周文献速递页面
+        :param self: Description
+        :param page: Playwright的异步Page对象
+        :param base_url: 基础URL
+        '''
+        super().__init__(page)
+        self.base_url = base_url
+
+    async def goto_home_page(self):
+        '''
+        Docstring for goto_home_page
+        进入系统首页
+        :param self: Description
+        '''
+        self.logger.info("打开系统首页")
+        await self.navigate_to(self.base_url)
+
+    async def get_all_literature_info(self):
+        '''
+        Docstring for get_all_literature_info
+        获取列表中所有文献的信息（一次页面内调用）
+        :param self: Description
+        return: LiteratureInfo列表
+        '''
+        _, rows = await self.extract_fields(self.LITERATURE_FIELDS, root_selector=self.LITERATURE_ITEMS)
+        return [LiteratureInfo(**{name: value or '' for name, value in row.items()}) for row in rows]
+
+    async def get_detail_links(self):
+        '''
+        Docstring for get_detail_links
+        一次性收集列表中每篇文献的详情页链接
+        :param self: Description
+        return: 链接列表，与文献顺序一致，没有链接的条目为None
+        '''
+        _, rows = await self.extract_fields(self.DETAIL_LINK_FIELDS, root_selector=self.LITERATURE_ITEMS)
+        return [row['url'] for row in rows]
+
+    async def click_literature_by_index(self, index=0):
+        '''
+        Docstring for click_literature_by_index
+        点击指定索引的文献标题
+        :param self: Description
+        :param index: 文献索引（从0开始）
+        return: 是否点击成功
+        '''
+        items = self.locators.get(self.LITERATURE_ITEMS)
+        if index >= await items.count():
+            self.logger.error(f"索引 {index} 超出范围")
+            return False
+        await items.nth(index).locator(self.LITERATURE_TITLE).first.click()
+        return True
+
+
+async def resolve_detail_urls(context: "BrowserContext", base_url, indices, concurrency=5, timeout=10000):
+    '''
+    Docstring for resolve_detail_urls
+    对没有链接的文献，在独立标签页中打开首页并点击标题，记录跳转后的详情页地址
+    :param context: Playwright的异步BrowserContext
+    :param base_url: 基础URL
+    :param indices: 需要解析的文献索引
+    :param concurrency: 最大并发标签页数
+    :param timeout: 等待跳转的超时（毫秒）
+    return: {索引: 详情页地址}，解析失败的索引不包含在内
+    '''
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def resolve(index):
+        async with semaphore:
+            page = await context.new_page()
+            weekly_page = AsyncWeeklyLiteraturePage(page, base_url)
+            try:
+                await weekly_page.goto_home_page()
+                if not await weekly_page.wait_until_ready(timeout=timeout):
+                    return index, None
+                home_url = page.url
+                if not await weekly_page.click_literature_by_index(index):
+                    return index, None
+                await page.wait_for_url(lambda url: url != home_url, timeout=timeout)
+                return index, page.url
+            except Exception as e:
+                weekly_page.logger.warning(f"第 {index + 1} 篇文献详情页地址解析失败: {str(e)}")
+                return index, None
+            finally:
+                await page.close()
+
+    results = await asyncio.gather(*(resolve(index) for index in indices))
+    return {index: url for index, url in results if url}
+
@@ -5,8 +5,16 @@ Docstring for pages.base_page
 '''
 
 
-from playwright.sync_api import Page,expect
+from typing import TYPE_CHECKING
+from utils.action_events import timed_action
+from utils.dom_extract import EXTRACT_SCRIPT, FIELDS_READY_SCRIPT, build_field_specs
+from utils.locator_registry import LocatorRegistry
 from utils.logger import Logger
+from utils.performance import PERFORMANCE_SCRIPT
+
+if TYPE_CHECKING:
+    # 只用于类型标注，收集用例时不导入playwright
+    from playwright.sync_api import Page
 
 class BasePage:
     '''
@@ -14,7 +22,37 @@ class BasePage:
     基础页面类
     提供页面操作的通用方法，避免重复代码
     '''
-    def __init__(self,page:Page):
+
+    # 页面就绪标志 - 子类声明该选择器可见即认为页面可交互
+    READY_SELECTOR = None
+
+    # 选择器所属容器 - 子类声明后查找限定在容器内，{选择器: 容器选择器}
+    SELECTOR_SCOPES = {}
+
+    # 性能预算名称 - 对应测试数据performance_budgets中的key
+    PERFORMANCE_BUDGET = None
+
+    # 在页面内监听DOM变化，quiet_ms内无变化返回true，超时返回false
+    _DOM_STABLE_SCRIPT = '''([selector, quietMs, timeout]) => new Promise((resolve) => {
+        const target = document.querySelector(selector) || document.body;
+        let quietTimer = null;
+        let deadline = null;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(() => done(true), quietMs);
+        });
+        const done = (stable) => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(deadline);
+            resolve(stable);
+        };
+        observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+        quietTimer = setTimeout(() => done(true), quietMs);
+        deadline = setTimeout(() => done(false), timeout);
+    })'''
+
+    def __init__(self,page:"Page"):
         '''
         Docstring for __init__
         初始化页面对象
@@ -24,7 +62,42 @@ class BasePage:
         '''
         self.page = page
         self.logger = Logger().get_logger()
+        # 每个选择器只创建一次Locator
+        self.locators = LocatorRegistry(page, self.SELECTOR_SCOPES)
+        # 本页面对象在page上注册的事件监听，close时移除
+        self._listeners = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def on_main_frame_navigated(self, callback):
+        '''
+        Docstring for on_main_frame_navigated
+        主框架发生导航时调用callback（用于丢弃缓存的页面数据）
+        监听器在close时移除，page比页面对象存活更久时应调用close或使用with语句
+        :param self: Description
+        :param callback: 无参数的回调函数
+        '''
+        def listener(frame):
+            if frame == self.page.main_frame:
+                callback()
+        self.page.on("framenavigated", listener)
+        self._listeners.append(("framenavigated", listener))
+
+    def close(self):
+        '''
+        Docstring for close
+        移除本页面对象注册的事件监听（不关闭page）
+        :param self: Description
+        '''
+        for event, listener in self._listeners:
+            self.page.remove_listener(event, listener)
+        self._listeners = []
     
+    @timed_action("navigate")
     def navigate_to(self,url):
         '''
         Docstring for navigate_to
@@ -35,6 +108,7 @@ class BasePage:
         self.logger.info(f"导航到网页：{url}")
         self.page.goto(url)
 
+    @timed_action("click", element=True)
     def click(self,selector):
         '''
         Docstring for click
@@ -42,9 +116,10 @@ class BasePage:
         :param self: Description
         :param selector: 元素选择器
         '''
-        self.logger.info(f"点击元素：{selector}")
+        self.logger.debug("点击元素：%s", selector)
         self.page.click(selector)
     
+    @timed_action("fill", element=True)
     def fill(self,selector,text):
         '''
         Docstring for fill
@@ -53,9 +128,10 @@ class BasePage:
         :param selector: 元素选择器
         :param text: 要填充的文本
         '''
-        self.logger.info(f"在{selector}中输入：{text}")
+        self.logger.debug("在%s中输入：%s", selector, text)
         self.page.fill(selector,text)
 
+    @timed_action("get_text", element=True)
     def get_text(self,selector):
         '''
         Docstring for get_text
@@ -64,10 +140,11 @@ class BasePage:
         :param selector: 元素选择器
         return：元素的文本内容
         '''
-        text =  self.page.locator(selector).inner_text()
-        self.logger.info(f"获取元素{selector}的文本：{text}")
+        text =  self.locators.get(selector).inner_text()
+        self.logger.debug("获取元素%s的文本：%s", selector, text)
         return text
     
+    @timed_action("is_visible", element=True)
     def is_visible(self,selector):
         '''
         Docstring for is_visible
@@ -76,10 +153,11 @@ class BasePage:
         :param selector: 元素选择器
         return：元素是否可见
         '''
-        visible = self.page.locator(selector).is_visible()
-        self.logger.info(f"元素{selector}可见性：{visible}")
+        visible = self.locators.get(selector).is_visible()
+        self.logger.debug("元素%s可见性：%s", selector, visible)
         return visible
     
+    @timed_action("wait_for_url")
     def wait_for_url(self,url_pattern,timeout = 3000):
         '''
         Docstring for wait_for_url
@@ -99,16 +177,140 @@ class BasePage:
         return：当前url
         '''
         url = self.page.url
-        self.logger.info(f"当前页面的URL：{url}")
+        self.logger.debug("当前页面的URL：%s", url)
         return url
     
-    def take_screenshot(self,name):
+    def extract_fields(self, fields, root_selector=None, index=None):
+        '''
+        Docstring for extract_fields
+        在一次页面内调用中提取多个字段，替代逐个locator的多次往返
+        :param self: Description
+        :param fields: {字段名: 选择器} 或 {字段名: (选择器, 'exists')}
+        :param root_selector: 每行数据的根元素选择器（CSS），为空时在整个页面中查找
+        :param index: 只提取第index个根元素，为空时提取全部
+        return：(根元素数量, 每行的字段字典列表)，未找到的文本字段值为None
+        '''
+        result = self.page.evaluate(
+            EXTRACT_SCRIPT,
+            [root_selector, index, build_field_specs(fields)]
+        )
+        self.logger.debug("批量提取%s：共%s个，提取%s行", root_selector or '页面', result['count'], len(result['rows']))
+        return result['count'], result['rows']
+
+    def wait_for_fields(self, fields, required, dependents=None, root_selector=None, index=0, timeout=10000):
+        '''
+        Docstring for wait_for_fields
+        等待必填字段渲染出内容（字段在标题之后异步渲染时，提取前先等待）
+        :param self: Description
+        :param fields: 与extract_fields相同的字段定义
+        :param required: 必填字段组，每组中任意一个字段有内容即可
+        :param dependents: {文本字段: 标志字段}，标志为真时该文本字段也必须有内容
+        :param root_selector: 根元素选择器（CSS），为空时在整个页面中查找
+        :param index: 检查第index个根元素
+        :param timeout: 超时时间（毫秒）
+        return：是否在超时前全部渲染
+        '''
+        try:
+            self.page.wait_for_function(
+                FIELDS_READY_SCRIPT,
+                arg=[root_selector, index, build_field_specs(fields), [list(group) for group in required],
+                     dict(dependents or {})],
+                timeout=timeout
+            )
+            return True
+        except Exception as e:
+            self.logger.warning(f"等待字段渲染超时：{str(e)}")
+            return False
+
+    def wait_for_url_change(self, old_url=None, timeout=10000):
+        '''
+        Docstring for wait_for_url_change
+        等待URL发生变化（如点击链接后跳转）
+        :param self: Description
+        :param old_url: 变化前的URL，默认取当前URL
+        :param timeout: 超时时间（毫秒）
+        return：变化后的URL
+        '''
+        old_url = old_url or self.page.url
+        self.logger.info(f"等待URL变化：{old_url}")
+        self.page.wait_for_url(lambda url: url != old_url, timeout=timeout)
+        return self.page.url
+
+    def wait_for_response(self, url_pattern, action=None, timeout=10000):
+        '''
+        Docstring for wait_for_response
+        等待指定的网络响应
+        传入action时先注册监听再执行action，避免响应在监听前就已返回
+        :param self: Description
+        :param url_pattern: URL匹配模式（glob、正则或判断函数）
+        :param action: 触发请求的操作，可选
+        :param timeout: 超时时间（毫秒）
+        return：Response对象
+        '''
+        self.logger.info(f"等待网络响应：{url_pattern}")
+        if action is None:
+            return self.page.wait_for_response(url_pattern, timeout=timeout)
+        with self.page.expect_response(url_pattern, timeout=timeout) as response_info:
+            action()
+        return response_info.value
+
+    def wait_for_dom_stable(self, selector="body", quiet_ms=300, timeout=10000):
+        '''
+        Docstring for wait_for_dom_stable
+        等待DOM稳定：指定区域在quiet_ms内没有任何变化
+        :param self: Description
+        :param selector: 监听的区域选择器（CSS）
+        :param quiet_ms: 无变化持续时间（毫秒）
+        :param timeout: 超时时间（毫秒）
+        return：是否在超时前稳定
+        '''
+        self.logger.info(f"等待DOM稳定：{selector}")
+        try:
+            stable = self.page.evaluate(self._DOM_STABLE_SCRIPT, [selector, quiet_ms, timeout])
+        except Exception as e:
+            # 等待期间发生导航等情况，执行上下文被销毁
+            self.logger.warning(f"等待DOM稳定失败：{str(e)}")
+            return False
+        self.logger.info(f"DOM稳定状态：{stable}")
+        return stable
+
+    def wait_until_ready(self, timeout=10000):
+        '''
+        Docstring for wait_until_ready
+        等待页面就绪：子类声明的READY_SELECTOR可见，未声明时等待DOM加载完成
+        :param self: Description
+        :param timeout: 超时时间（毫秒）
+        return：是否就绪
+        '''
+        self.logger.info(f"等待页面就绪：{self.READY_SELECTOR}")
+        try:
+            if self.READY_SELECTOR:
+                self.page.wait_for_selector(self.READY_SELECTOR, timeout=timeout)
+            else:
+                self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            return True
+        except Exception as e:
+            self.logger.error(f"页面就绪等待超时：{str(e)}")
+            return False
+
+    def collect_performance_metrics(self, timeout=10000, hard_navigation=False):
         '''
-        Docstring for take_screenshot
-        截图保存
+        Docstring for collect_performance_metrics
+        等待load事件后采集当前页面的Navigation Timing、Paint Timing和LCP指标（毫秒）
         :param self: Description
-        :param name: 保存的文件名
+        :param timeout: 等待load事件的超时时间（毫秒）
+        :param hard_navigation: 单页应用内跳转（没有导航记录）时，是否整页重新加载当前地址后再采集
+        return：指标字典，单页应用内跳转且未重新加载时导航与绘制指标为None（soft_navigation为True）
         '''
-        path = f"reports/screenshots/{name}.png"
-        self.page.screenshot(path=path)
-        self.logger.info(f"截图已保存：{path}")
\ No newline at end of file
+        try:
+            self.page.wait_for_load_state("load", timeout=timeout)
+        except Exception as e:
+            self.logger.warning(f"等待load事件超时，load指标可能缺失：{str(e)}")
+        metrics = self.page.evaluate(PERFORMANCE_SCRIPT)
+        if metrics.get('soft_navigation') and hard_navigation:
+            self.logger.info("单页应用内跳转没有导航指标，重新加载后采集：%s", metrics['url'])
+            self.page.goto(metrics['url'], wait_until="load", timeout=timeout)
+            self.wait_until_ready(timeout=timeout)
+            metrics = self.page.evaluate(PERFORMANCE_SCRIPT)
+        self.logger.info("页面性能指标：%s", metrics)
+        return metrics
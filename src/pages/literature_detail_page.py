@@ -2,15 +2,65 @@
 文献详情页面对象 - POM模式实现
 封装文献详情页面的所有元素定位和操作
 '''
+from typing import TYPE_CHECKING, NamedTuple
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from utils.dom_extract import missing_fields
+from utils.locator_registry import audit_locators
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
-class LiteratureDetailPage(BasePage):
+
+class LiteratureDetailInfo(NamedTuple):
+    '''
+    文献详情页的完整信息
+    文本字段未找到时为空字符串
+    '''
+    title_cn: str = ''
+    title_en: str = ''
+    authors: str = ''
+    journal: str = ''
+    publish_date: str = ''
+    impact_factor: str = ''
+    citation_count: str = ''
+    ai_interpretation: str = ''
+    has_ai_interpretation: bool = False
+    has_full_text: bool = False
+    has_charts: bool = False
+    has_data: bool = False
+
+    @property
+    def display_title(self):
+        '''优先英文标题，没有时使用中文标题'''
+        return self.title_en or self.title_cn
+
+    def verify_basic_info(self):
+        '''
+        验证基本信息是否完整
+        return: 验证结果字典
+        '''
+        result = {
+            'has_title': bool(self.display_title),
+            'has_authors': bool(self.authors),
+            'has_journal': bool(self.journal),
+            'has_date': bool(self.publish_date),
+            'has_impact_factor': bool(self.impact_factor),
+            'has_citation_count': bool(self.citation_count),
+            'has_ai_interpretation': self.has_ai_interpretation
+        }
+        result['all_basic_present'] = all([
+            result['has_title'],
+            result['has_authors'],
+            result['has_journal'],
+            result['has_date']
+        ])
+        return result
+
+
+class LiteratureDetailLocators:
     """
-    Docstring for LiteratureDetailPage
-    文献详情页面类
-    封装文献详情页面的所有元素定位和操作
+    文献详情页面的定位器
+    同步与异步页面对象共用同一套定位器常量
     """
 
     # 页面元素定位器 - 集中管理，便于维护
@@ -42,7 +92,51 @@ class LiteratureDetailPage(BasePage):
     # 页面加载指示器
     LOADING_INDICATOR = '.loading, .spinner'  # 加载指示器
 
-    def __init__(self, page: Page):
+    # 页面就绪标志：英文标题或AI解读标题出现
+    READY_SELECTOR = f"{TITLE_EN}, {AI_INTERPRETATION_TITLE}"
+
+    # 详情页整页只展示一篇文献，页面没有确认过的内容容器，文本字段在整个页面中查找
+    # （与is_detail_page_loaded的整页判断一致）；确认容器（或字段的class）后再改为SELECTOR_SCOPES或CSS选择器
+    GLOBAL_TEXT_SELECTORS = (
+        AUTHORS, JOURNAL, PUBLISH_DATE, IMPACT_FACTOR, CITATION_COUNT, AI_INTERPRETATION_TITLE, KEYWORD_TAGS
+    )
+
+    # 性能预算名称
+    PERFORMANCE_BUDGET = 'literature_detail'
+
+    # 批量提取时的字段与选择器，与LiteratureDetailInfo字段一一对应
+    DETAIL_FIELDS = {
+        'title_cn': TITLE_CN,
+        'title_en': TITLE_EN,
+        'authors': AUTHORS,
+        'journal': JOURNAL,
+        'publish_date': PUBLISH_DATE,
+        'impact_factor': IMPACT_FACTOR,
+        'citation_count': CITATION_COUNT,
+        'ai_interpretation': AI_INTERPRETATION_CONTENT,
+        'has_ai_interpretation': (AI_INTERPRETATION_TITLE, 'exists'),
+        'has_full_text': (FULL_TEXT_SECTION, 'exists'),
+        'has_charts': (CHART_SECTION, 'exists'),
+        'has_data': (DATA_SECTION, 'exists')
+    }
+
+    # 提取前等待渲染的字段：每组中任意一个有内容即可（与verify_basic_info的all_basic_present一致）
+    REQUIRED_DETAIL_FIELDS = (('title_en', 'title_cn'), ('authors',), ('journal',), ('publish_date',))
+    # AI解读标题出现后，解读内容也需要等待渲染
+    DEPENDENT_DETAIL_FIELDS = {'ai_interpretation': 'has_ai_interpretation'}
+
+
+audit_locators(LiteratureDetailLocators)
+
+
+class LiteratureDetailPage(LiteratureDetailLocators, BasePage):
+    """
+    Docstring for LiteratureDetailPage
+    文献详情页面类
+    封装文献详情页面的所有元素定位和操作
+    """
+
+    def __init__(self, page: "Page"):
         '''
         Docstring for __init__
         初始化文献详情页面
@@ -50,6 +144,47 @@ class LiteratureDetailPage(BasePage):
         :param page: Playwright的Page对象
         '''
         super().__init__(page)
+        self._detail = None
+        # 当前页面上等待必填字段已超时，之后的提取不再重复等待
+        self._fields_timed_out = False
+        # 页面导航后提取结果失效
+        self.on_main_frame_navigated(self._discard_detail)
+
+    def _discard_detail(self):
+        '''丢弃已提取的详情信息'''
+        self._detail = None
+        self._fields_timed_out = False
+
+    def extract_detail(self, refresh=False, timeout=10000):
+        '''
+        Docstring for extract_detail
+        等待必填字段渲染后，在一次页面内调用中提取详情页所有字段
+        必填字段齐全的结果在当前页面（导航前）内复用，get与verify共享同一份数据；
+        不完整的结果不缓存，下次调用重新提取
+        :param self: Description
+        :param refresh: 是否强制重新提取（如页面内容异步更新后）
+        :param timeout: 等待必填字段的超时时间（毫秒），同一页面只等待一次
+        return: LiteratureDetailInfo
+        '''
+        if self._detail is not None and not refresh:
+            return self._detail
+
+        self.logger.info("提取文献详情信息")
+        if not self._fields_timed_out:
+            self._fields_timed_out = not self.wait_for_fields(
+                self.DETAIL_FIELDS, self.REQUIRED_DETAIL_FIELDS, self.DEPENDENT_DETAIL_FIELDS, timeout=timeout
+            )
+        _, rows = self.extract_fields(self.DETAIL_FIELDS)
+        missing = missing_fields(rows[0], self.REQUIRED_DETAIL_FIELDS, self.DEPENDENT_DETAIL_FIELDS)
+        # 未找到的文本字段为None，统一置为空字符串
+        detail = LiteratureDetailInfo(
+            **{name: '' if value is None else value for name, value in rows[0].items()}
+        )
+        if missing:
+            self.logger.warning(f"详情信息不完整，缺少: {missing}，结果不缓存")
+        else:
+            self._detail = detail
+        return detail
 
     def wait_for_page_load(self, timeout=10000):
         '''
@@ -60,17 +195,10 @@ class LiteratureDetailPage(BasePage):
         return: 是否加载完成
         '''
         self.logger.info("等待文献详情页加载")
-        try:
-            # 等待英文标题或AI解读标题出现
-            self.page.wait_for_selector(
-                f"{self.TITLE_EN}, {self.AI_INTERPRETATION_TITLE}",
-                timeout=timeout
-            )
+        loaded = self.wait_until_ready(timeout=timeout)
+        if loaded:
             self.logger.info("文献详情页加载完成")
-            return True
-        except Exception as e:
-            self.logger.error(f"页面加载超时: {str(e)}")
-            return False
+        return loaded
 
     def is_detail_page_loaded(self):
         '''
@@ -82,8 +210,8 @@ class LiteratureDetailPage(BasePage):
         self.logger.info("检查详情页面是否已加载")
         
         # 检查英文标题或AI解读标题是否存在
-        title_exists = self.page.locator(self.TITLE_EN).count() > 0
-        ai_title_exists = self.page.locator(self.AI_INTERPRETATION_TITLE).count() > 0
+        title_exists = self.locators.get(self.TITLE_EN).count() > 0
+        ai_title_exists = self.locators.get(self.AI_INTERPRETATION_TITLE).count() > 0
         
         is_loaded = title_exists or ai_title_exists
         self.logger.info(f"详情页面加载状态: {is_loaded}")
@@ -96,13 +224,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 英文标题文本
         '''
-        try:
-            title = self.page.locator(self.TITLE_EN).first.inner_text()
-            self.logger.info(f"英文标题: {title[:50]}...")
-            return title
-        except:
+        value = self.extract_detail().title_en
+        if value:
+            self.logger.info(f"英文标题: {value[:50]}...")
+        else:
             self.logger.warning("未找到英文标题")
-            return ""
+        return value
 
     def get_title_cn(self):
         '''
@@ -111,13 +238,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 中文标题文本
         '''
-        try:
-            title = self.page.locator(self.TITLE_CN).first.inner_text()
-            self.logger.info(f"中文标题: {title[:50]}...")
-            return title
-        except:
+        value = self.extract_detail().title_cn
+        if value:
+            self.logger.info(f"中文标题: {value[:50]}...")
+        else:
             self.logger.warning("未找到中文标题")
-            return ""
+        return value
 
     def get_authors(self):
         '''
@@ -126,13 +252,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 作者文本
         '''
-        try:
-            authors = self.page.locator(self.AUTHORS).first.inner_text()
-            self.logger.info(f"作者: {authors}")
-            return authors
-        except:
+        value = self.extract_detail().authors
+        if value:
+            self.logger.info(f"作者: {value}")
+        else:
             self.logger.warning("未找到作者信息")
-            return ""
+        return value
 
     def get_journal(self):
         '''
@@ -141,13 +266,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 期刊名称
         '''
-        try:
-            journal = self.page.locator(self.JOURNAL).first.inner_text()
-            self.logger.info(f"期刊: {journal}")
-            return journal
-        except:
+        value = self.extract_detail().journal
+        if value:
+            self.logger.info(f"期刊: {value}")
+        else:
             self.logger.warning("未找到期刊信息")
-            return ""
+        return value
 
     def get_publish_date(self):
         '''
@@ -156,13 +280,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 发表日期
         '''
-        try:
-            date = self.page.locator(self.PUBLISH_DATE).first.inner_text()
-            self.logger.info(f"发表日期: {date}")
-            return date
-        except:
+        value = self.extract_detail().publish_date
+        if value:
+            self.logger.info(f"发表日期: {value}")
+        else:
             self.logger.warning("未找到发表日期")
-            return ""
+        return value
 
     def get_impact_factor(self):
         '''
@@ -171,13 +294,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 影响因子文本
         '''
-        try:
-            if_text = self.page.locator(self.IMPACT_FACTOR).first.inner_text()
-            self.logger.info(f"影响因子: {if_text}")
-            return if_text
-        except:
+        value = self.extract_detail().impact_factor
+        if value:
+            self.logger.info(f"影响因子: {value}")
+        else:
             self.logger.warning("未找到影响因子")
-            return ""
+        return value
 
     def get_citation_count(self):
         '''
@@ -186,13 +308,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 被引次数文本
         '''
-        try:
-            citation = self.page.locator(self.CITATION_COUNT).first.inner_text()
-            self.logger.info(f"被引次数: {citation}")
-            return citation
-        except:
+        value = self.extract_detail().citation_count
+        if value:
+            self.logger.info(f"被引次数: {value}")
+        else:
             self.logger.warning("未找到被引次数")
-            return ""
+        return value
 
     def get_ai_interpretation(self):
         '''
@@ -201,13 +322,12 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: AI解读文本
         '''
-        try:
-            ai_content = self.page.locator(self.AI_INTERPRETATION_CONTENT).first.inner_text()
-            self.logger.info(f"AI解读内容长度: {len(ai_content)} 字符")
-            return ai_content
-        except:
+        value = self.extract_detail().ai_interpretation
+        if value:
+            self.logger.info(f"AI解读内容长度: {len(value)} 字符")
+        else:
             self.logger.warning("未找到AI解读内容")
-            return ""
+        return value
 
     def has_ai_interpretation(self):
         '''
@@ -216,9 +336,9 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 是否存在AI解读
         '''
-        has_ai = self.page.locator(self.AI_INTERPRETATION_TITLE).count() > 0
-        self.logger.info(f"AI解读存在: {has_ai}")
-        return has_ai
+        exists = self.extract_detail().has_ai_interpretation
+        self.logger.info(f"AI解读存在: {exists}")
+        return exists
 
     def has_full_text(self):
         '''
@@ -227,9 +347,9 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 是否存在全文
         '''
-        has_text = self.page.locator(self.FULL_TEXT_SECTION).count() > 0
-        self.logger.info(f"全文内容存在: {has_text}")
-        return has_text
+        exists = self.extract_detail().has_full_text
+        self.logger.info(f"全文内容存在: {exists}")
+        return exists
 
     def has_charts(self):
         '''
@@ -238,9 +358,9 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 是否存在图表
         '''
-        has_chart = self.page.locator(self.CHART_SECTION).count() > 0
-        self.logger.info(f"图表存在: {has_chart}")
-        return has_chart
+        exists = self.extract_detail().has_charts
+        self.logger.info(f"图表存在: {exists}")
+        return exists
 
     def has_data(self):
         '''
@@ -249,9 +369,9 @@ class LiteratureDetailPage(BasePage):
         :param self: Description
         return: 是否存在数据
         '''
-        has_data_section = self.page.locator(self.DATA_SECTION).count() > 0
-        self.logger.info(f"数据部分存在: {has_data_section}")
-        return has_data_section
+        exists = self.extract_detail().has_data
+        self.logger.info(f"数据部分存在: {exists}")
+        return exists
 
     def verify_basic_info_complete(self):
         '''
@@ -262,22 +382,7 @@ class LiteratureDetailPage(BasePage):
         '''
         self.logger.info("开始验证基本信息完整性")
         
-        result = {
-            'has_title': bool(self.get_title_en() or self.get_title_cn()),
-            'has_authors': bool(self.get_authors()),
-            'has_journal': bool(self.get_journal()),
-            'has_date': bool(self.get_publish_date()),
-            'has_impact_factor': bool(self.get_impact_factor()),
-            'has_citation_count': bool(self.get_citation_count()),
-            'has_ai_interpretation': self.has_ai_interpretation()
-        }
-        
-        result['all_basic_present'] = all([
-            result['has_title'],
-            result['has_authors'],
-            result['has_journal'],
-            result['has_date']
-        ])
+        result = self.extract_detail().verify_basic_info()
         
         self.logger.info(f"基本信息验证结果: {result}")
         return result
@@ -287,22 +392,7 @@ class LiteratureDetailPage(BasePage):
         Docstring for get_full_literature_info
         获取完整的文献信息
         :param self: Description
-        return: 包含所有文献信息的字典
+        return: LiteratureDetailInfo
         '''
         self.logger.info("获取完整文献信息")
-        
-        info = {
-            'title_cn': self.get_title_cn(),
-            'title_en': self.get_title_en(),
-            'authors': self.get_authors(),
-            'journal': self.get_journal(),
-            'publish_date': self.get_publish_date(),
-            'impact_factor': self.get_impact_factor(),
-            'citation_count': self.get_citation_count(),
-            'ai_interpretation': self.get_ai_interpretation(),
-            'has_full_text': self.has_full_text(),
-            'has_charts': self.has_charts(),
-            'has_data': self.has_data()
-        }
-        
-        return info
\ No newline at end of file
+        return self.extract_detail()
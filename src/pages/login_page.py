@@ -2,8 +2,11 @@
 登录页面对象 - POM模式实现
 将页面元素和操作封装在一起，提高代码可维护性
 '''
+from typing import TYPE_CHECKING
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 class LoginPage(BasePage):
     """
@@ -21,7 +24,7 @@ class LoginPage(BasePage):
     SUCCESS_TITLE = '.font-bold.tracking-tight' # 标题栏的文字是智库
 
 
-    def __init__(self, page:Page, base_url):
+    def __init__(self, page:"Page", base_url):
         '''
         Docstring for __init__
         初始化登录页面
@@ -82,6 +85,16 @@ class LoginPage(BasePage):
         self.input_password(password)
         self.click_login_button()
 
+    def wait_for_login_complete(self, timeout=10000):
+        '''
+        Docstring for wait_for_login_complete
+        等待登录完成（页面离开登录页）
+        :param self: Description
+        :param timeout: 超时时间（毫秒）
+        '''
+        self.logger.info("等待登录完成")
+        self.page.wait_for_url(lambda url: "/login" not in url, timeout=timeout)
+
     def get_error_message(self):
         '''
         Docstring for get_error_message
@@ -2,15 +2,79 @@
 本周文献速递页面对象 - POM模式实现
 封装本周文献速递页面的所有元素定位和操作
 '''
+from typing import TYPE_CHECKING, NamedTuple
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from utils.dom_extract import EXTRACT_SCRIPT, build_field_specs
+from utils.locator_registry import audit_locators
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
-class WeeklyLiteraturePage(BasePage):
+
+class LiteratureInfo(NamedTuple):
+    '''
+    文献列表中单篇文献的信息
+    未找到的字段为空字符串
+    '''
+    title: str = ''
+    title_cn: str = ''
+    author: str = ''
+    journal: str = ''
+    date: str = ''
+    impact_factor: str = ''
+
+    @property
+    def display_title(self):
+        '''优先英文标题，没有时使用中文标题'''
+        return self.title or self.title_cn
+
+
+class LiteratureSnapshot(NamedTuple):
+    '''
+    文献列表快照 - 一次性采集的整个列表，不可变
+    items与keys按列表顺序一一对应，version为采集时列表的DOM版本
+    '''
+    items: tuple = ()
+    keys: tuple = ()
+    version: str = ''
+
+    @property
+    def titles(self):
+        '''所有非空的英文标题'''
+        return tuple(info.title for info in self.items if info.title)
+
+    @property
+    def authors(self):
+        return tuple(info.author for info in self.items)
+
+    @property
+    def journals(self):
+        return tuple(info.journal for info in self.items)
+
+    @property
+    def dates(self):
+        return tuple(info.date for info in self.items)
+
+    @property
+    def impact_factors(self):
+        return tuple(info.impact_factor for info in self.items)
+
+    def index_of(self, key):
+        '''
+        根据稳定key查找文献在列表中的位置
+        :param key: 快照中的key
+        return: 索引，不存在时返回-1
+        '''
+        try:
+            return self.keys.index(key)
+        except ValueError:
+            return -1
+
+
+class WeeklyLiteratureLocators:
     """
-    Docstring for WeeklyLiteraturePage
-    本周文献速递页面类
-    封装本周文献速递页面的所有元素定位和操作
+    本周文献速递页面的定位器
+    同步与异步页面对象共用同一套定位器常量
     """
 
     # 页面元素定位器 - 集中管理，便于维护
@@ -32,7 +96,74 @@ class WeeklyLiteraturePage(BasePage):
     # 关键词标签
     KEYWORD_TAG = 'text=/命中关键词/'  # 命中关键词标签
 
-    def __init__(self, page: Page, base_url):
+    # 页面就绪标志：文献条目渲染出来即可交互
+    READY_SELECTOR = LITERATURE_ITEMS
+
+    # 文献信息只在文献条目内查找，避免文本/正则选择器遍历整个页面
+    SELECTOR_SCOPES = {
+        LITERATURE_TITLE: LITERATURE_ITEMS,
+        LITERATURE_TITLE_CN: LITERATURE_ITEMS,
+        LITERATURE_AUTHOR: LITERATURE_ITEMS,
+        LITERATURE_JOURNAL: LITERATURE_ITEMS,
+        LITERATURE_DATE: LITERATURE_ITEMS,
+        IMPACT_FACTOR: LITERATURE_ITEMS,
+        KEYWORD_TAG: LITERATURE_ITEMS
+    }
+
+    # 页面级的文本，需要在整个页面中查找
+    GLOBAL_TEXT_SELECTORS = (WEEKLY_SECTION_TITLE, TOTAL_COUNT_TEXT)
+
+    # 性能预算名称
+    PERFORMANCE_BUDGET = 'weekly_literature'
+
+    # 批量提取时每篇文献的字段与选择器，与LiteratureInfo字段一一对应
+    LITERATURE_FIELDS = {
+        'title': LITERATURE_TITLE,
+        'title_cn': LITERATURE_TITLE_CN,
+        'author': LITERATURE_AUTHOR,
+        'journal': LITERATURE_JOURNAL,
+        'date': LITERATURE_DATE,
+        'impact_factor': IMPACT_FACTOR
+    }
+
+    # 详情页链接：标题所在（或包含）的链接
+    DETAIL_LINK_FIELDS = {'url': (LITERATURE_TITLE, 'href')}
+
+
+audit_locators(WeeklyLiteratureLocators)
+
+
+class WeeklyLiteraturePage(WeeklyLiteratureLocators, BasePage):
+    """
+    Docstring for WeeklyLiteraturePage
+    本周文献速递页面类
+    封装本周文献速递页面的所有元素定位和操作
+    """
+
+    # 在页面内监听文献列表的DOM变化，返回 "监听实例token:变化次数" 作为列表版本
+    # 文档重新加载或列表容器被替换后token随之改变
+    _LIST_VERSION_SCRIPT = '''(listSelector) => {
+        const target = document.querySelector(listSelector) || document.body;
+        let watch = window.__literatureListWatch;
+        if (!watch || watch.target !== target) {
+            if (watch) {
+                watch.observer.disconnect();
+            }
+            watch = {token: Math.random().toString(36).slice(2), version: 0, target: target};
+            watch.observer = new MutationObserver(() => { watch.version += 1; });
+            watch.observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+            window.__literatureListWatch = watch;
+        }
+        return `${watch.token}:${watch.version}`;
+    }'''
+
+    # 一次调用同时返回列表版本和所有文献字段
+    _SNAPSHOT_SCRIPT = f'''([listSelector, rootSelector, specs]) => {{
+        const version = ({_LIST_VERSION_SCRIPT})(listSelector);
+        return Object.assign(({EXTRACT_SCRIPT})([rootSelector, null, specs]), {{version: version}});
+    }}'''
+
+    def __init__(self, page: "Page", base_url):
         '''
         Docstring for __init__
         初始化本周文献速递页面
@@ -42,6 +173,46 @@ class WeeklyLiteraturePage(BasePage):
         '''
         super().__init__(page)
         self.base_url = base_url
+        self._snapshot = None
+        # 页面导航后列表快照失效
+        self.on_main_frame_navigated(self.invalidate_snapshot)
+
+    def invalidate_snapshot(self):
+        '''
+        Docstring for invalidate_snapshot
+        手动丢弃列表快照，下次读取时重新采集
+        :param self: Description
+        '''
+        self._snapshot = None
+
+    def snapshot(self, refresh=False):
+        '''
+        Docstring for snapshot
+        获取文献列表快照
+        已有快照且列表DOM未发生变化时直接复用（只需一次轻量的版本检查），
+        否则在一次页面内调用中重新采集整个列表
+        :param self: Description
+        :param refresh: 是否强制重新采集
+        return: LiteratureSnapshot
+        '''
+        if self._snapshot is not None and not refresh:
+            version = self.page.evaluate(self._LIST_VERSION_SCRIPT, self.LITERATURE_LIST_CONTAINER)
+            if version == self._snapshot.version:
+                return self._snapshot
+            self.logger.info("文献列表已变化，重新采集快照")
+        
+        result = self.page.evaluate(
+            self._SNAPSHOT_SCRIPT,
+            [self.LITERATURE_LIST_CONTAINER, self.LITERATURE_ITEMS, build_field_specs(self.LITERATURE_FIELDS)]
+        )
+        items = tuple(self._to_info(row) for row in result['rows'])
+        self._snapshot = LiteratureSnapshot(
+            items=items,
+            keys=tuple(f"{info.display_title}|{info.date}" for info in items),
+            version=result['version']
+        )
+        self.logger.info(f"文献列表快照已采集: 共 {len(items)} 篇")
+        return self._snapshot
 
     def goto_home_page(self):
         '''
@@ -70,8 +241,7 @@ class WeeklyLiteraturePage(BasePage):
         return: 文献数量
         '''
         self.logger.info("获取文献列表数量")
-        items = self.page.locator(self.LITERATURE_ITEMS)
-        count = items.count()
+        count = len(self.snapshot().items)
         self.logger.info(f"文献列表中共有 {count} 篇文献")
         return count
 
@@ -84,7 +254,7 @@ class WeeklyLiteraturePage(BasePage):
         '''
         try:
             import re
-            text_element = self.page.locator(self.TOTAL_COUNT_TEXT).first
+            text_element = self.locators.get(self.TOTAL_COUNT_TEXT).first
             text = text_element.inner_text()
             match = re.search(r'共\s*(\d+)\s*篇', text)
             if match:
@@ -95,83 +265,42 @@ class WeeklyLiteraturePage(BasePage):
             self.logger.warning(f"无法获取文献总数: {str(e)}")
         return None
 
+    @staticmethod
+    def _to_info(row):
+        '''将页面内提取的字段字典转换为LiteratureInfo，未找到的字段置为空字符串'''
+        return LiteratureInfo(**{name: value or '' for name, value in row.items()})
+
     def get_literature_info_by_index(self, index=0):
         '''
         Docstring for get_literature_info_by_index
-        获取指定索引的文献信息
+        获取指定索引的文献信息（从列表快照读取）
         :param self: Description
         :param index: 文献索引（从0开始）
-        return: 文献信息字典
+        return: LiteratureInfo，索引超出范围时返回None
         '''
         self.logger.info(f"获取第 {index + 1} 篇文献信息")
         
-        items = self.page.locator(self.LITERATURE_ITEMS)
-        if index >= items.count():
-            self.logger.error(f"索引 {index} 超出范围")
+        items = self.snapshot().items
+        if index >= len(items):
+            self.logger.error(f"索引 {index} 超出范围（总数: {len(items)}）")
             return None
         
-        item = items.nth(index)
-        
-        info = {
-            'title': '',
-            'title_cn': '',
-            'author': '',
-            'journal': '',
-            'date': '',
-            'impact_factor': ''
-        }
-        
-        try:
-            # 获取英文标题
-            title_locator = item.locator(self.LITERATURE_TITLE).first
-            if title_locator.count() > 0:
-                info['title'] = title_locator.inner_text()
-        except:
-            pass
-        
-        try:
-            # 获取中文标题
-            title_cn_locator = item.locator(self.LITERATURE_TITLE_CN).first
-            if title_cn_locator.count() > 0:
-                info['title_cn'] = title_cn_locator.inner_text()
-        except:
-            pass
-        
-        try:
-            # 获取作者信息
-            author_locator = item.locator(self.LITERATURE_AUTHOR).first
-            if author_locator.count() > 0:
-                info['author'] = author_locator.inner_text()
-        except:
-            pass
-        
-        try:
-            # 获取期刊信息
-            journal_locator = item.locator(self.LITERATURE_JOURNAL).first
-            if journal_locator.count() > 0:
-                info['journal'] = journal_locator.inner_text()
-        except:
-            pass
-        
-        try:
-            # 获取日期
-            date_locator = item.locator(self.LITERATURE_DATE).first
-            if date_locator.count() > 0:
-                info['date'] = date_locator.inner_text()
-        except:
-            pass
-        
-        try:
-            # 获取影响因子
-            if_locator = item.locator(self.IMPACT_FACTOR).first
-            if if_locator.count() > 0:
-                info['impact_factor'] = if_locator.inner_text()
-        except:
-            pass
-        
-        self.logger.info(f"文献信息: 标题={info['title'][:50]}...")
+        info = items[index]
+        self.logger.info(f"文献信息: 标题={info.title[:50]}...")
         return info
 
+    def get_all_literature_info(self):
+        '''
+        Docstring for get_all_literature_info
+        获取列表中所有文献的信息（从列表快照读取）
+        :param self: Description
+        return: LiteratureInfo列表
+        '''
+        self.logger.info("获取所有文献信息")
+        infos = list(self.snapshot().items)
+        self.logger.info(f"共获取 {len(infos)} 篇文献信息")
+        return infos
+
     def click_literature_by_index(self, index=0):
         '''
         Docstring for click_literature_by_index
@@ -181,12 +310,11 @@ class WeeklyLiteraturePage(BasePage):
         '''
         self.logger.info(f"点击第 {index + 1} 篇文献")
         
-        items = self.page.locator(self.LITERATURE_ITEMS)
-        if index >= items.count():
+        if index >= len(self.snapshot().items):
             self.logger.error(f"索引 {index} 超出范围")
             return False
         
-        item = items.nth(index)
+        item = self.locators.get(self.LITERATURE_ITEMS).nth(index)
         title = item.locator(self.LITERATURE_TITLE).first
         
         # 点击标题
@@ -194,15 +322,30 @@ class WeeklyLiteraturePage(BasePage):
         self.logger.info("文献标题已点击")
         return True
 
-    def verify_literature_has_basic_info(self, index=0):
+    def get_detail_links(self):
+        '''
+        Docstring for get_detail_links
+        一次性收集列表中每篇文献的详情页链接
+        :param self: Description
+        return: 链接列表，与文献顺序一致，没有链接的条目为None
+        '''
+        self.logger.info("收集文献详情页链接")
+        _, rows = self.extract_fields(self.DETAIL_LINK_FIELDS, root_selector=self.LITERATURE_ITEMS)
+        links = [row['url'] for row in rows]
+        self.logger.info(f"共收集 {len([link for link in links if link])} 个详情页链接")
+        return links
+
+    def verify_literature_has_basic_info(self, index=0, info=None):
         '''
         Docstring for verify_literature_has_basic_info
         验证指定文献是否包含基本信息
         :param self: Description
         :param index: 文献索引
+        :param info: 已获取的LiteratureInfo，传入时不再重复读取页面
         return: 验证结果字典
         '''
-        info = self.get_literature_info_by_index(index)
+        if info is None:
+            info = self.get_literature_info_by_index(index)
         
         if not info:
             return {
@@ -214,10 +357,10 @@ class WeeklyLiteraturePage(BasePage):
             }
         
         result = {
-            'has_title': bool(info['title'] or info['title_cn']),
-            'has_author': bool(info['author']),
-            'has_journal': bool(info['journal']),
-            'has_date': bool(info['date']),
+            'has_title': bool(info.display_title),
+            'has_author': bool(info.author),
+            'has_journal': bool(info.journal),
+            'has_date': bool(info.date),
         }
         result['all_present'] = all(result.values())
         
@@ -232,14 +375,7 @@ class WeeklyLiteraturePage(BasePage):
         return: 标题列表
         '''
         self.logger.info("获取所有文献标题")
-        titles = []
-        items = self.page.locator(self.LITERATURE_ITEMS)
-        
-        for i in range(items.count()):
-            item = items.nth(i)
-            title_locator = item.locator(self.LITERATURE_TITLE).first
-            if title_locator.count() > 0:
-                titles.append(title_locator.inner_text())
+        titles = list(self.snapshot().titles)
         
         self.logger.info(f"共获取 {len(titles)} 个标题")
-        return titles
\ No newline at end of file
+        return titles
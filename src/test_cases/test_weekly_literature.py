@@ -2,13 +2,18 @@
 TC-02: 本周文献速递浏览与查看 - 测试用例
 测试本周文献速递功能，包括文献列表展示和详情页面查看
 '''
+import json
+import allure
 import pytest
-from pages.login_page import LoginPage
+from pages.async_literature_detail_page import sweep_literature_details
 from pages.weekly_literature_page import WeeklyLiteraturePage
 from pages.literature_detail_page import LiteratureDetailPage
 from utils.assert_helper import AssertHelper
+from utils.async_runner import run_async_streaming
 
 
+@pytest.mark.xdist_group(name="tc_02")
+@pytest.mark.routing("lean")
 class TestWeeklyLiterature:
     """
     Docstring for TestWeeklyLiterature
@@ -17,27 +22,41 @@ class TestWeeklyLiterature:
     """
 
     @pytest.fixture(autouse=True)
-    def setup(self, browser_context, load_config):
+    def setup(self, logged_in_context, load_config, load_test_data, artifact_policy):
         '''
         Docstring for setup
-        测试前置条件：登录系统并进入首页
+        测试前置条件：使用缓存的登录状态，无需每个用例都通过UI登录
         :param self: Description
-        :param browser_context: Playwright page对象
+        :param logged_in_context: 已登录的Playwright page对象
         :param load_config: 配置信息
+        :param load_test_data: 加载测试数据的函数
+        :param artifact_policy: 截图策略
         '''
-        self.page = browser_context
+        self.page = logged_in_context
+        self.artifact_policy = artifact_policy
         self.config = load_config
         self.assert_helper = AssertHelper()
-        
-        # 执行登录操作
-        login_page = LoginPage(self.page, self.config['base_url'])
-        login_page.goto_login_page()
-        
-        # 从测试数据中读取用户信息（你可以根据实际情况调整）
-        login_page.login("huangqimei", "123456")  # 需要替换为实际密码
-        
-        # 等待登录成功
-        self.page.wait_for_timeout(2000)
+        test_data = load_test_data("weekly_literature_data.yaml")
+        self.performance_budgets = test_data.get('performance_budgets', {})
+        self.required_fields = test_data['weekly_literature']['required_fields']
+
+    def assert_page_performance(self, page_object, page_name):
+        '''
+        Docstring for assert_page_performance
+        采集页面性能指标并与测试数据中的预算对比
+        点击进入的详情页是单页应用内跳转，没有导航和绘制指标，重新整页加载后测量
+        :param self: Description
+        :param page_object: 页面对象
+        :param page_name: 页面名称（用于报告）
+        '''
+        budget = self.performance_budgets.get(page_object.PERFORMANCE_BUDGET)
+        if not budget:
+            return
+        self.assert_helper.assert_within_budget(
+            page_object.collect_performance_metrics(hard_navigation=True),
+            budget,
+            page_name
+        )
 
     def test_tc_02_01_view_weekly_literature_list(self):
         '''
@@ -58,12 +77,13 @@ class TestWeeklyLiterature:
         print("=" * 50)
         
         # 初始化页面对象
-        weekly_page = WeeklyLiteraturePage(self.page, self.config['base_url'])
+        weekly_page = WeeklyLiteraturePage(self.page, self.config.base_url)
         
         # 步骤1: 进入系统首页
         print("\n【步骤1】进入系统首页")
         weekly_page.goto_home_page()
-        self.page.wait_for_timeout(2000)
+        self.assert_helper.assert_true(weekly_page.wait_until_ready(), "首页加载超时")
+        self.assert_page_performance(weekly_page, "本周文献速递")
         
         # 步骤2: 验证本周文献速递区域是否显示
         print("\n【步骤2】验证本周文献速递区域是否显示")
@@ -98,30 +118,20 @@ class TestWeeklyLiterature:
             )
             
             # 记录文献信息
-            print(f"  标题: {literature_info['title'][:50] if literature_info['title'] else literature_info['title_cn'][:50]}...")
-            print(f"  作者: {literature_info['author']}")
-            print(f"  期刊: {literature_info['journal']}")
-            print(f"  日期: {literature_info['date']}")
+            print(f"  标题: {literature_info.display_title[:50]}...")
+            print(f"  作者: {literature_info.author}")
+            print(f"  期刊: {literature_info.journal}")
+            print(f"  日期: {literature_info.date}")
             
-            # 验证信息完整性
-            verification = weekly_page.verify_literature_has_basic_info(i)
+            # 验证信息完整性（复用已获取的信息，不再重复读取页面）
+            verification = weekly_page.verify_literature_has_basic_info(i, literature_info)
             
-            self.assert_helper.assert_true(
-                verification['has_title'],
-                f"第 {i+1} 篇文献缺少标题信息"
-            )
-            self.assert_helper.assert_true(
-                verification['has_author'],
-                f"第 {i+1} 篇文献缺少作者信息"
-            )
-            self.assert_helper.assert_true(
-                verification['has_journal'],
-                f"第 {i+1} 篇文献缺少期刊信息"
-            )
-            self.assert_helper.assert_true(
-                verification['has_date'],
-                f"第 {i+1} 篇文献缺少日期信息"
-            )
+            # 必须字段来自测试数据的weekly_literature.required_fields
+            for field in self.required_fields:
+                self.assert_helper.assert_true(
+                    verification.get(f'has_{field}'),
+                    f"第 {i+1} 篇文献缺少{field}信息"
+                )
             
             print(f"✓ 第 {i+1} 篇文献信息完整")
         
@@ -138,8 +148,8 @@ class TestWeeklyLiterature:
         print("TC-02-01 测试通过：本周文献速递列表显示正常")
         print("=" * 50)
         
-        # 截图保存
-        self.page.screenshot(path="reports/screenshots/TC-02-01_success.png")
+        # 截图保存（按截图策略，默认不保存成功截图）
+        self.artifact_policy.capture(self.page, "TC-02-01_success", passed=True)
 
     def test_tc_02_02_click_literature_and_view_detail(self):
         '''
@@ -159,13 +169,13 @@ class TestWeeklyLiterature:
         print("=" * 50)
         
         # 初始化页面对象
-        weekly_page = WeeklyLiteraturePage(self.page, self.config['base_url'])
+        weekly_page = WeeklyLiteraturePage(self.page, self.config.base_url)
         detail_page = LiteratureDetailPage(self.page)
         
         # 步骤1: 确认在首页
         print("\n【步骤1】确认在系统首页")
         weekly_page.goto_home_page()
-        self.page.wait_for_timeout(2000)
+        self.assert_helper.assert_true(weekly_page.wait_until_ready(), "首页加载超时")
         
         # 确认本周文献速递区域存在
         self.assert_helper.assert_true(
@@ -181,11 +191,12 @@ class TestWeeklyLiterature:
             "无法获取文献信息"
         )
         
-        literature_title = literature_info['title'] or literature_info['title_cn']
+        literature_title = literature_info.display_title
         print(f"准备点击文献: {literature_title[:50]}...")
         
         # 步骤3: 点击第一篇文献标题
         print("\n【步骤3】点击文献标题")
+        home_url = weekly_page.get_current_url()
         click_success = weekly_page.click_literature_by_index(0)
         self.assert_helper.assert_true(
             click_success,
@@ -194,7 +205,7 @@ class TestWeeklyLiterature:
         print("✓ 成功点击文献标题")
         
         # 等待页面跳转
-        self.page.wait_for_timeout(2000)
+        weekly_page.wait_for_url_change(home_url)
         
         # 步骤4: 验证是否跳转到详情页面
         print("\n【步骤4】验证页面跳转")
@@ -208,6 +219,7 @@ class TestWeeklyLiterature:
             "未成功跳转到文献详情页面"
         )
         print("✓ 成功跳转至文献详情页面")
+        self.assert_page_performance(detail_page, "文献详情")
         
         # 步骤5: 验证详情页面基本信息
         print("\n【步骤5】验证详情页面基本信息")
@@ -216,13 +228,13 @@ class TestWeeklyLiterature:
         detail_info = detail_page.get_full_literature_info()
         
         print("\n文献详情信息:")
-        print(f"  中文标题: {detail_info['title_cn'][:50] if detail_info['title_cn'] else '无'}...")
-        print(f"  英文标题: {detail_info['title_en'][:50] if detail_info['title_en'] else '无'}...")
-        print(f"  作者: {detail_info['authors']}")
-        print(f"  期刊: {detail_info['journal']}")
-        print(f"  发表日期: {detail_info['publish_date']}")
-        print(f"  影响因子: {detail_info['impact_factor']}")
-        print(f"  被引次数: {detail_info['citation_count']}")
+        print(f"  中文标题: {detail_info.title_cn[:50] or '无'}...")
+        print(f"  英文标题: {detail_info.title_en[:50] or '无'}...")
+        print(f"  作者: {detail_info.authors}")
+        print(f"  期刊: {detail_info.journal}")
+        print(f"  发表日期: {detail_info.publish_date}")
+        print(f"  影响因子: {detail_info.impact_factor}")
+        print(f"  被引次数: {detail_info.citation_count}")
         
         # 验证基本信息完整性
         verification = detail_page.verify_basic_info_complete()
@@ -256,7 +268,7 @@ class TestWeeklyLiterature:
         
         has_ai_interpretation = detail_page.has_ai_interpretation()
         if has_ai_interpretation:
-            ai_content = detail_info['ai_interpretation']
+            ai_content = detail_info.ai_interpretation
             print(f"AI解读内容长度: {len(ai_content)} 字符")
             print(f"AI解读预览: {ai_content[:100]}...")
             self.assert_helper.assert_true(
@@ -270,23 +282,23 @@ class TestWeeklyLiterature:
         # 步骤7: 检查其他内容元素
         print("\n【步骤7】检查其他内容元素")
         
-        if detail_info['has_full_text']:
+        if detail_info.has_full_text:
             print("✓ 包含全文内容")
         
-        if detail_info['has_charts']:
+        if detail_info.has_charts:
             print("✓ 包含图表内容")
         
-        if detail_info['has_data']:
+        if detail_info.has_data:
             print("✓ 包含数据内容")
         
         print("\n" + "=" * 50)
         print("TC-02-02 测试通过：文献详情页面加载正常")
         print("=" * 50)
         
-        # 截图保存
-        self.page.screenshot(path="reports/screenshots/TC-02-02_success.png")
+        # 截图保存（按截图策略，默认不保存成功截图）
+        self.artifact_policy.capture(self.page, "TC-02-02_success", passed=True)
 
-    @pytest.mark.parametrize("literature_index", [0, 1, 2])
+    @pytest.mark.datafile("weekly_literature_data.yaml", key="detail_indices", argname="literature_index")
     def test_tc_02_03_view_multiple_literature_details(self, literature_index):
         '''
         Docstring for test_tc_02_03_view_multiple_literature_details
@@ -297,18 +309,18 @@ class TestWeeklyLiterature:
         2. 验证每篇文献详情页面加载正常
         
         :param self: Description
-        :param literature_index: 文献索引（0, 1, 2）
+        :param literature_index: 文献索引（weekly_literature_data.yaml的detail_indices）
         '''
         print("\n" + "=" * 50)
         print(f"开始执行测试用例: TC-02-03 查看第 {literature_index + 1} 篇文献详情")
         print("=" * 50)
         
-        weekly_page = WeeklyLiteraturePage(self.page, self.config['base_url'])
+        weekly_page = WeeklyLiteraturePage(self.page, self.config.base_url)
         detail_page = LiteratureDetailPage(self.page)
         
         # 确认在首页
         weekly_page.goto_home_page()
-        self.page.wait_for_timeout(2000)
+        self.assert_helper.assert_true(weekly_page.wait_until_ready(), "首页加载超时")
         
         # 获取文献总数
         total_count = weekly_page.get_literature_count()
@@ -319,17 +331,20 @@ class TestWeeklyLiterature:
         
         # 获取文献信息
         literature_info = weekly_page.get_literature_info_by_index(literature_index)
-        title = literature_info['title'] or literature_info['title_cn']
+        title = literature_info.display_title
         print(f"目标文献: {title[:50]}...")
         
         # 点击文献
+        home_url = weekly_page.get_current_url()
         click_success = weekly_page.click_literature_by_index(literature_index)
         self.assert_helper.assert_true(
             click_success,
             f"点击第 {literature_index + 1} 篇文献失败"
         )
         
-        self.page.wait_for_timeout(2000)
+        weekly_page.wait_for_url_change(home_url)
+        detail_page.wait_for_page_load()
+        self.assert_page_performance(detail_page, "文献详情")
         
         # 验证详情页加载
         self.assert_helper.assert_true(
@@ -346,15 +361,78 @@ class TestWeeklyLiterature:
         
         print(f"✓ 第 {literature_index + 1} 篇文献详情页加载正常")
         
-        # 截图
-        self.page.screenshot(
-            path=f"reports/screenshots/TC-02-03_{literature_index}_success.png"
-        )
+        # 截图（按截图策略，默认不保存成功截图）
+        self.artifact_policy.capture(self.page, f"TC-02-03_{literature_index}_success", passed=True)
         
         # 返回列表页面（为下一次测试做准备）
         self.page.go_back()
-        self.page.wait_for_timeout(1000)
+        self.assert_helper.assert_true(weekly_page.wait_until_ready(), "返回首页后页面加载超时")
         
         print("=" * 50)
         print(f"TC-02-03 测试通过：第 {literature_index + 1} 篇文献验证完成")
-        print("=" * 50)
\ No newline at end of file
+        print("=" * 50)
+
+    @pytest.mark.sweep
+    def test_tc_02_04_sweep_all_literature_details(self):
+        '''
+        Docstring for test_tc_02_04_sweep_all_literature_details
+        TC-02-04: 全量验证本周文献速递所有文献的详情页
+        
+        测试步骤:
+        1. 进入首页，一次性收集所有文献的详情页地址
+        2. 在受限数量的标签页（或上下文）中并发打开详情页并验证基本信息
+        
+        预期结果:
+        1. 所有详情页正常加载，基本信息完整
+        2. 每篇文献的验证结果实时写入报告
+        :param self: Description
+        '''
+        print("\n" + "=" * 50)
+        print("开始执行测试用例: TC-02-04 全量验证文献详情页")
+        print("=" * 50)
+        
+        weekly_page = WeeklyLiteraturePage(self.page, self.config.base_url)
+        
+        # 步骤1: 收集所有详情页地址
+        print("\n【步骤1】收集所有文献的详情页地址")
+        weekly_page.goto_home_page()
+        self.assert_helper.assert_true(weekly_page.wait_until_ready(), "首页加载超时")
+        links = weekly_page.get_detail_links()
+        self.assert_helper.assert_true(
+            len(links) > 0,
+            "本周文献速递列表为空，未显示任何文献"
+        )
+        print(f"共 {len(links)} 篇文献，其中 {len([link for link in links if not link])} 篇需要点击解析地址")
+        
+        # 步骤2: 并发验证，结果逐条写入报告
+        print("\n【步骤2】并发验证所有详情页")
+        storage_state = self.page.context.storage_state()
+        failures = []
+        
+        def report_result(result):
+            status = "✓" if result.passed else "✗"
+            print(f"{status} 第 {result.index + 1} 篇 ({result.duration:.1f}s): {result.title[:50] or result.url}")
+            with allure.step(f"{status} 第 {result.index + 1} 篇文献详情页"):
+                allure.attach(
+                    json.dumps(result._asdict(), ensure_ascii=False, indent=2),
+                    name=f"literature_{result.index + 1}",
+                    attachment_type=allure.attachment_type.JSON
+                )
+            if not result.passed:
+                failures.append(result)
+        
+        run_async_streaming(
+            lambda emit: sweep_literature_details(self.config, links, storage_state, on_result=emit),
+            report_result
+        )
+        
+        self.assert_helper.assert_true(
+            not failures,
+            "以下文献详情页验证失败: " + "; ".join(
+                f"第 {result.index + 1} 篇 {result.error or result.verification}" for result in failures
+            )
+        )
+        
+        print("\n" + "=" * 50)
+        print(f"TC-02-04 测试通过：{len(links)} 篇文献详情页全部验证完成")
+        print("=" * 50)
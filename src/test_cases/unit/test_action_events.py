@@ -0,0 +1,77 @@
+'''
+Docstring for test_cases.unit.test_action_events
+页面操作事件记录的单元测试
+'''
+
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from utils.action_events import ActionEventLog, timed_action
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    '''写到临时目录的事件日志（单例，用完恢复原配置）'''
+    log = ActionEventLog()
+    original = dict(log.settings)
+    log.configure({'dir': str(tmp_path)})
+    yield log
+    log.configure(original)
+    log.last_failure = None
+
+
+class FakePage:
+    '''使用timed_action装饰操作方法的页面替身'''
+
+    def __init__(self):
+        self.page = SimpleNamespace(url="https://example.com/home")
+
+    @timed_action("click", element=True)
+    def click(self, selector, fail=False):
+        if fail:
+            raise TimeoutError("Timeout 1000ms exceeded.\nwaiting for locator")
+        return selector
+
+    @timed_action("goto")
+    def goto(self, url):
+        return url
+
+
+def read_events(event_log):
+    '''写完并读取事件文件'''
+    event_log.flush()
+    with open(event_log.path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+class TestTimedAction:
+    '''
+    Docstring for TestTimedAction
+    每次操作记录一条事件
+    '''
+
+    def test_events(self, event_log):
+        page = FakePage()
+        assert page.click("#login") == "#login"
+        assert page.goto(url="https://example.com/login") == "https://example.com/login"
+        with pytest.raises(TimeoutError):
+            page.click("#submit", fail=True)
+
+        events = read_events(event_log)
+        assert [(event['action'], event['selector'], event['outcome']) for event in events] == [
+            ("click", "#login", "passed"),
+            ("goto", "https://example.com/login", "passed"),
+            ("click", "#submit", "failed"),
+        ]
+        assert events[2]['error'] == "TimeoutError: Timeout 1000ms exceeded."
+        assert events[0]['test_id'] == os.environ["PYTEST_CURRENT_TEST"].rsplit(" ", 1)[0]
+        assert all(event['end'] >= event['start'] and event['page'] == page.page.url for event in events)
+        assert event_log.last_failure == (events[2]['test_id'], "#submit")
+
+    def test_disabled(self, event_log, tmp_path):
+        event_log.configure({'enabled': False, 'dir': str(tmp_path / "events")})
+        assert FakePage().click("#login") == "#login"
+        assert not os.path.exists(tmp_path / "events")
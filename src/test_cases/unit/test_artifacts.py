@@ -0,0 +1,74 @@
+'''
+Docstring for test_cases.unit.test_artifacts
+截图策略的单元测试
+'''
+
+import os
+import pytest
+from utils.artifacts import ArtifactPolicy
+
+pytestmark = pytest.mark.unit
+
+
+class FakeLocator:
+    '''元素截图替身，visible为False时模拟元素不可见'''
+
+    def __init__(self, visible):
+        self.first = self
+        self.visible = visible
+
+    def screenshot(self, **options):
+        if not self.visible:
+            raise TimeoutError("Timeout 2000ms exceeded.\nwaiting for element to be visible")
+        return b"element"
+
+
+class FakePage:
+    '''记录截图参数的Page替身'''
+
+    def __init__(self, visible=True):
+        self.visible = visible
+        self.options = None
+
+    def locator(self, selector):
+        return FakeLocator(self.visible)
+
+    def screenshot(self, **options):
+        self.options = options
+        return b"page" * 4
+
+
+class TestArtifactPolicy:
+    '''
+    Docstring for TestArtifactPolicy
+    截图时机、范围、格式和总大小上限
+    '''
+
+    def test_policy(self, tmp_path):
+        policy = ArtifactPolicy(str(tmp_path), on_failure=True, on_success=False, async_write=False)
+        assert policy.capture(FakePage(), "ok", passed=True) is None
+        path = policy.capture(FakePage(), "failed")
+        assert path.endswith(".jpg") and os.path.exists(path)
+
+    def test_element_scope_fallback(self, tmp_path):
+        policy = ArtifactPolicy(str(tmp_path), async_write=False)
+        with open(policy.capture(FakePage(), "element", selector="#login"), 'rb') as f:
+            assert f.read() == b"element"
+        page = FakePage(visible=False)
+        with open(policy.capture(page, "page", selector="#login"), 'rb') as f:
+            assert f.read() == b"pagepagepagepage"
+        assert page.options == {'full_page': False, 'type': "jpeg", 'quality': 70}
+
+    def test_format(self, tmp_path):
+        assert ArtifactPolicy(str(tmp_path), image_format="jpg", async_write=False).image_format == "jpeg"
+        assert ArtifactPolicy(str(tmp_path), image_format="webp", async_write=False).image_format == "jpeg"
+        page = FakePage()
+        ArtifactPolicy(str(tmp_path), image_format="png", async_write=False).capture(page, "a")
+        assert page.options == {'full_page': False, 'type': "png"}
+
+    def test_total_size_limit(self, tmp_path):
+        # 上限只够保存两张16字节的截图
+        policy = ArtifactPolicy(str(tmp_path), max_total_mb=40 / 1024 / 1024)
+        paths = [policy.capture(FakePage(), f"shot{index}") for index in range(4)]
+        policy.close()
+        assert [os.path.exists(path) for path in paths] == [False, False, True, True]
@@ -0,0 +1,81 @@
+'''
+Docstring for test_cases.unit.test_auth_state
+登录状态缓存的单元测试
+'''
+
+import os
+import time
+from types import SimpleNamespace
+import pytest
+from utils.auth_state import AuthStateCache
+
+pytestmark = pytest.mark.unit
+
+BASE_URL = "https://example.com/"
+STATE = {'cookies': [{'name': "sid", 'value': "1", 'expires': -1}], 'origins': []}
+
+
+class FakePage:
+    '''只记录事件回调的Page替身'''
+
+    def __init__(self):
+        self.main_frame = SimpleNamespace(url="")
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+
+class TestAuthStateCache:
+    '''
+    Docstring for TestAuthStateCache
+    内存与磁盘两级缓存及失效
+    '''
+
+    def test_save_and_reload_from_disk(self, tmp_path):
+        AuthStateCache(str(tmp_path)).save(BASE_URL, "user", STATE)
+        # 新实例没有内存缓存，从磁盘读取；base_url末尾的/不影响key
+        assert AuthStateCache(str(tmp_path)).get("https://example.com", "user") == STATE
+        assert AuthStateCache(str(tmp_path)).get(BASE_URL, "other") is None
+
+    def test_ttl_expired(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path), ttl=60)
+        cache.save(BASE_URL, "user", STATE)
+        cache._memory[cache._key(BASE_URL, "user")]['created_at'] = time.time() - 120
+        assert cache.get(BASE_URL, "user") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_cookie_expired(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path), ttl=0)
+        cache.save(BASE_URL, "user", {'cookies': [{'name': "sid", 'expires': time.time() - 1}]})
+        assert cache.get(BASE_URL, "user") is None
+
+    def test_corrupt_file(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path))
+        (tmp_path / f"{cache._key(BASE_URL, 'user')}.json").write_text("{", encoding="utf-8")
+        assert cache.get(BASE_URL, "user") is None
+
+    def test_clear(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path))
+        cache.save(BASE_URL, "a", STATE)
+        cache.save(BASE_URL, "b", STATE)
+        cache.clear()
+        assert cache.get(BASE_URL, "a") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_watch_invalidates(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path))
+        page = FakePage()
+        cache.save(BASE_URL, "user", STATE)
+        cache.watch(page, BASE_URL, "user")
+
+        # 第三方域名的401不影响被测站点的登录状态
+        page.handlers['response'](SimpleNamespace(status=401, url="https://cdn.example.org/a.js"))
+        assert cache.get(BASE_URL, "user") == STATE
+        page.handlers['response'](SimpleNamespace(status=401, url="https://example.com/api/me"))
+        assert cache.get(BASE_URL, "user") is None
+
+        cache.save(BASE_URL, "user", STATE)
+        page.main_frame.url = "https://example.com/login?redirect=/"
+        page.handlers['framenavigated'](page.main_frame)
+        assert cache.get(BASE_URL, "user") is None
@@ -0,0 +1,100 @@
+'''
+Docstring for test_cases.unit.test_browser_pool
+浏览器池单元测试
+使用假的浏览器对象，不启动真实浏览器
+'''
+
+import pytest
+from utils.browser_pool import BrowserPool
+
+pytestmark = pytest.mark.unit
+
+
+class FakeBrowser:
+    '''模拟Playwright的Browser对象'''
+
+    def __init__(self, name):
+        self.name = name
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.closed = True
+        self.connected = False
+
+
+class FakePool(BrowserPool):
+    '''启动浏览器时返回FakeBrowser'''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.launched = []
+
+    def _launch(self):
+        browser = FakeBrowser(f"browser-{len(self.launched)}")
+        self.launched.append(browser)
+        return browser
+
+
+class TestBrowserPool:
+    '''
+    Docstring for TestBrowserPool
+    浏览器池的借出、共享与重启
+    '''
+
+    def test_reuse_idle_browser(self):
+        '''归还后再次借出同一个浏览器'''
+        pool = FakePool(size=1, max_uses=10)
+        browser = pool.acquire()
+        pool.release(browser)
+        assert pool.acquire() is browser
+        assert len(pool.launched) == 1
+
+    def test_shared_browser_not_recycled_while_in_use(self):
+        '''池满共享时，达到复用次数的浏览器在其他测试使用期间不会被关闭'''
+        pool = FakePool(size=1, max_uses=1)
+        first = pool.acquire()
+        second = pool.acquire()
+        assert second is first
+        assert not first.closed
+
+        pool.release(first)
+        assert not first.closed
+        pool.release(second)
+
+        # 全部归还后再借出时才重启
+        third = pool.acquire()
+        assert first.closed
+        assert third is not first
+
+    def test_release_by_one_holder_keeps_browser_in_use(self):
+        '''共享浏览器的一个测试归还后，浏览器仍视为被占用'''
+        pool = FakePool(size=1, max_uses=10)
+        browser = pool.acquire()
+        pool.acquire()
+        pool.release(browser)
+        assert pool._slots[0].in_use
+
+    def test_crashed_shared_browser_gets_temporary_browser(self):
+        '''被占用的浏览器崩溃时临时启动新浏览器，归还后关闭'''
+        pool = FakePool(size=1, max_uses=10)
+        crashed = pool.acquire()
+        crashed.connected = False
+        extra = pool.acquire()
+        assert extra is not crashed
+        assert len(pool._slots) == 2
+
+        pool.release(extra)
+        assert extra.closed
+        assert len(pool._slots) == 1
+
+    def test_crashed_idle_browser_restarted(self):
+        '''空闲的崩溃浏览器在下次借出前重启'''
+        pool = FakePool(size=1, max_uses=10)
+        browser = pool.acquire()
+        browser.connected = False
+        pool.release(browser)
+        assert pool.acquire() is not browser
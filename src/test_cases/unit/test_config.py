@@ -0,0 +1,165 @@
+'''
+Docstring for test_cases.unit.test_config
+配置加载与覆盖顺序的单元测试
+'''
+
+import dataclasses
+import os
+import pytest
+from utils.config import (
+    Config, UnknownConfigWarning, deep_merge, env_overrides, is_ci, load_config, parse_assignment,
+    slow_mo_warning
+)
+
+pytestmark = pytest.mark.unit
+
+CONFIG_YAML = '''
+base_url: "https://example.com/"
+timeout: 30000
+headless: true
+browser:
+  type: "chromium"
+  slow_mo: 0
+  viewport: {width: 1280, height: 720}
+tracing: {mode: "retain-on-failure"}
+environments:
+  staging:
+    base_url: "https://staging.example.com"
+    timeout: 20000
+    browser: {slow_mo: 10}
+profiles:
+  debug:
+    headless: false
+    timeout: 10000
+    browser: {slow_mo: 100}
+'''
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return str(path)
+
+
+class TestLoadConfig:
+    '''
+    Docstring for TestLoadConfig
+    覆盖顺序：文件 < 环境 < 执行配置 < 环境变量 < --set
+    '''
+
+    def test_base_file(self, config_file):
+        config = load_config(config_file, environ={})
+        assert config.base_url == "https://example.com"
+        assert config.headless is True
+        assert config.browser.viewport.as_dict() == {'width': 1280, 'height': 720}
+        assert config.get('tracing')['mode'] == "retain-on-failure"
+        assert config.get('environments') is None
+
+    def test_overlay_order(self, config_file):
+        environ = {'AUTOTEST_TIMEOUT': "5000", 'AUTOTEST_BROWSER__SLOW_MO': "50"}
+        config = load_config(config_file, "staging", "debug", ["browser.slow_mo=0"], environ)
+        assert config.base_url == "https://staging.example.com"  # 环境
+        assert config.headless is False  # 执行配置
+        assert config.timeout == 5000  # 环境变量覆盖执行配置和环境
+        assert config.browser.slow_mo == 0  # --set覆盖环境变量
+        assert config.browser.viewport.width == 1280  # 未覆盖的项保留
+
+    def test_selectors_from_environment(self, config_file):
+        config = load_config(config_file, environ={'AUTOTEST_ENV': "staging", 'AUTOTEST_PROFILE': "debug"})
+        assert (config.environment, config.profile) == ("staging", "debug")
+        assert config.timeout == 10000
+
+    def test_unknown_environment(self, config_file):
+        with pytest.raises(ValueError, match="未定义的环境"):
+            load_config(config_file, "prod", environ={})
+
+    def test_frozen(self, config_file):
+        config = load_config(config_file, environ={})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.timeout = 1
+        with pytest.raises(TypeError):
+            config.get('tracing')['mode'] = "on"
+        assert config.replace(base_url="http://127.0.0.1:8000").base_url == "http://127.0.0.1:8000"
+
+    def test_replace_updates_raw(self, config_file):
+        config = load_config(config_file, environ={})
+        browser = dataclasses.replace(config.browser, slow_mo=50)
+        replaced = config.replace(base_url="http://127.0.0.1:8000", browser=browser)
+        assert replaced.get('base_url') == "http://127.0.0.1:8000"
+        assert replaced.get('browser')['slow_mo'] == 50
+        assert replaced.get('browser')['viewport']['width'] == 1280
+        # 未修改的配置段保留，原配置不变
+        assert replaced.get('tracing')['mode'] == "retain-on-failure"
+        assert config.get('base_url') == "https://example.com/"
+
+
+class TestOverrides:
+    '''
+    Docstring for TestOverrides
+    覆盖项解析
+    '''
+
+    def test_parse_assignment(self):
+        assert parse_assignment("browser.slow_mo=0") == (["browser", "slow_mo"], 0)
+        assert parse_assignment("headless=false") == (["headless"], False)
+        with pytest.raises(ValueError):
+            parse_assignment("headless")
+
+    def test_env_overrides(self):
+        environ = {'AUTOTEST_BROWSER__VIEWPORT__WIDTH': "800", 'AUTOTEST_ENV': "ci", 'PATH': "/bin"}
+        assert env_overrides(environ) == [(["browser", "viewport", "width"], 800)]
+
+    def test_env_overrides_unknown_section(self):
+        environ = {'AUTOTEST_TOKEN': "secret", 'AUTOTEST_TIMEOUT': "5000"}
+        with pytest.warns(UnknownConfigWarning, match="AUTOTEST_TOKEN"):
+            overrides = env_overrides(environ, sections={'timeout': 30000, 'browser': {}})
+        assert overrides == [(["timeout"], 5000)]
+
+    def test_unknown_env_var_not_added(self, config_file):
+        with pytest.warns(UnknownConfigWarning):
+            config = load_config(config_file, environ={'AUTOTEST_TOKEN': "secret"})
+        assert config.get('token') is None
+
+    def test_deep_merge(self):
+        assert deep_merge({'a': {'b': 1, 'c': 2}}, {'a': {'c': 3}}) == {'a': {'b': 1, 'c': 3}}
+
+    def test_headless_string(self):
+        assert Config.from_dict({'base_url': "x", 'headless': "false"}).headless is False
+
+
+class TestProfiles:
+    '''
+    Docstring for TestProfiles
+    执行配置与CI中slow_mo的检查
+    '''
+
+    SHIPPED_CONFIG = os.path.join(os.path.dirname(__file__), "..", "..", "config", "config.yaml")
+
+    @pytest.mark.parametrize("profile", ["debug", "ci", "perf"])
+    def test_shipped_profiles(self, profile):
+        config = load_config(self.SHIPPED_CONFIG, profile=profile, environ={})
+        assert config.profile == profile
+        assert config.headless is (profile != "debug")
+        assert (config.browser.slow_mo == 0) is (profile != "debug")
+
+    def test_unknown_profile(self, config_file):
+        with pytest.raises(ValueError, match="未定义的执行配置"):
+            load_config(config_file, profile="fast", environ={})
+
+    @pytest.mark.parametrize("environ, expected", [
+        ({'CI': "true"}, True),
+        ({'GITHUB_ACTIONS': "true"}, True),
+        ({'CI': "false"}, False),
+        ({}, False),
+    ])
+    def test_is_ci(self, environ, expected):
+        assert is_ci(environ) is expected
+
+    def test_slow_mo_warning(self, config_file):
+        headless_slow = load_config(config_file, overrides=["browser.slow_mo=50"], environ={})
+        assert "slow_mo=50" in slow_mo_warning(headless_slow, {'CI': "1"})
+        assert slow_mo_warning(headless_slow, {}) is None
+        assert slow_mo_warning(load_config(config_file, environ={}), {'CI': "1"}) is None
+        # debug执行配置有界面，不是无头CI执行
+        assert slow_mo_warning(load_config(config_file, profile="debug", environ={}), {'CI': "1"}) is None
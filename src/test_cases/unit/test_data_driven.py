@@ -0,0 +1,85 @@
+'''
+Docstring for test_cases.unit.test_data_driven
+数据驱动（稳定id、标签筛选、分片）单元测试
+'''
+
+import pytest
+from utils.data_driven import DataCase, case_id, in_shard, parse_shard, select_cases
+
+pytestmark = pytest.mark.unit
+
+TAGGED = [
+    DataCase("valid", {'id': "valid"}, ("smoke",)),
+    DataCase("wrong_password", {'id': "wrong_password"}, ("negative",)),
+    DataCase("empty", {'id': "empty"}, ()),
+]
+
+
+class TestCaseId:
+    '''
+    Docstring for TestCaseId
+    数据的稳定id
+    '''
+
+    def test_id_fields(self):
+        assert case_id({'id': 3, 'name': "x"}) == "3"
+        assert case_id({'name': "login"}) == "login"
+
+    def test_scalar(self):
+        assert case_id(2) == "2"
+
+    def test_content_hash_independent_of_key_order(self):
+        assert case_id({'a': 1, 'b': [1, 2]}) == case_id({'b': [1, 2], 'a': 1})
+        assert case_id({'a': 1}) != case_id({'a': 2})
+
+
+class TestSelectCases:
+    '''
+    Docstring for TestSelectCases
+    标签筛选与分片
+    '''
+
+    def test_tag_filter(self):
+        assert [case.id for case in select_cases(TAGGED, tags=["smoke"])] == ["valid"]
+        assert len(list(select_cases(TAGGED))) == 3
+
+    def test_untagged_dataset_not_filtered(self):
+        '''没有定义标签的数据集（如详情页序号列表）不因--data-tag变为空'''
+        indices = [DataCase(str(index), index) for index in range(3)]
+        assert [case.values for case in select_cases(indices, tags=["smoke"])] == [0, 1, 2]
+
+    def test_accepts_generator(self):
+        assert len(list(select_cases((case for case in TAGGED), tags=["negative"]))) == 1
+
+    def test_streams_cases(self):
+        '''逐条读取：取到第一条命中的数据时不会读完整个数据集'''
+        read = []
+
+        def stream():
+            for index in range(1000):
+                read.append(index)
+                yield DataCase(str(index), index, tags=("smoke",) if index % 2 else ())
+
+        assert next(select_cases(stream())).values == 0
+        assert next(select_cases(stream(), tags=["smoke"])).values == 1
+        assert len(read) == 3
+
+    def test_shards_partition_cases(self):
+        '''各分片互不重叠且合起来覆盖全部数据'''
+        cases = [DataCase(str(index), index) for index in range(50)]
+        shards = [list(select_cases(cases, shard=(index, 4), prefix="test_x")) for index in range(4)]
+        ids = [case.id for shard in shards for case in shard]
+        assert sorted(ids, key=int) == [case.id for case in cases]
+
+    def test_shard_stable(self):
+        assert in_shard("test_x[a]", (0, 3)) == in_shard("test_x[a]", (0, 3))
+        assert in_shard("anything", None)
+
+    @pytest.mark.parametrize("text, expected", [("1/4", (0, 4)), ("4/4", (3, 4))])
+    def test_parse_shard(self, text, expected):
+        assert parse_shard(text) == expected
+
+    @pytest.mark.parametrize("text", ["0/4", "5/4", "1-4", "a/b", "1/0"])
+    def test_parse_shard_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_shard(text)
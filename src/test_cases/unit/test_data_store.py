@@ -0,0 +1,140 @@
+'''
+Docstring for test_cases.unit.test_data_store
+测试数据仓库的单元测试：结构校验、只读视图、缓存与流式读取
+'''
+
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+import pytest
+from utils import data_store
+from utils.data_store import DataSchemaError, DataStore, freeze, validate
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def store(tmp_path):
+    '''指向临时目录的数据仓库（单例，用完恢复原数据目录）'''
+    data_store = DataStore()
+    original = data_store.data_dir
+    data_store.data_dir = str(tmp_path)
+    data_store.clear()
+    yield data_store
+    data_store.data_dir = original
+    data_store.clear()
+
+
+def write(directory, name, text):
+    '''写入数据文件'''
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+class TestValidate:
+    '''
+    Docstring for TestValidate
+    按结构定义校验
+    '''
+
+    SCHEMA = {'name': 'str', 'count?': 'int', 'tags': ['str'], '*': 'any'}
+
+    def test_valid(self):
+        validate({'name': "a", 'tags': ["x"], 'extra': 1}, self.SCHEMA)
+        validate({'name': "a", 'count': 2, 'tags': []}, self.SCHEMA)
+
+    @pytest.mark.parametrize("data, message", [
+        ({'tags': []}, "缺少字段 name"),
+        ({'name': 1, 'tags': []}, "name: 应为str"),
+        ({'name': "a", 'count': True, 'tags': []}, "count: 应为int"),
+        ({'name': "a", 'tags': ["x", 2]}, "tags[1]: 应为str"),
+        ([], "<根>: 应为字典"),
+    ])
+    def test_invalid(self, data, message):
+        with pytest.raises(DataSchemaError, match=re.escape(message)):
+            validate(data, self.SCHEMA)
+
+    def test_unknown_type(self):
+        with pytest.raises(DataSchemaError, match="未知的类型"):
+            validate(1, 'number')
+
+
+class TestFreeze:
+    '''
+    Docstring for TestFreeze
+    只读视图
+    '''
+
+    def test_nested(self):
+        view = freeze({'cases': [{'id': 1}]})
+        assert isinstance(view, MappingProxyType)
+        assert isinstance(view['cases'], tuple)
+        with pytest.raises(TypeError):
+            view['cases'][0]['id'] = 2
+
+
+class TestDataStore:
+    '''
+    Docstring for TestDataStore
+    加载、缓存与流式读取
+    '''
+
+    def test_load_cached_until_modified(self, store, tmp_path):
+        path = write(tmp_path, "cases.yaml", "cases:\n  - id: 1\n")
+        first = store.load("cases.yaml")
+        assert store.load("cases.yaml") is first
+        write(tmp_path, "cases.yaml", "cases:\n  - id: 1\n  - id: 2\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert len(store.load("cases.yaml")['cases']) == 2
+
+    def test_schema_error_not_cached(self, store, tmp_path):
+        write(tmp_path, "schemas.yaml", "cases.yaml:\n  cases: [{id: int}]\n")
+        write(tmp_path, "cases.yaml", "cases:\n  - id: one\n")
+        with pytest.raises(DataSchemaError, match=r"cases.yaml: cases\[0\].id"):
+            store.load("cases.yaml")
+        with pytest.raises(DataSchemaError):
+            store.load("cases.yaml")
+
+    def test_schema_change_revalidates(self, store, tmp_path):
+        write(tmp_path, "schemas.yaml", "cases.yaml:\n  cases: [{id: any}]\n")
+        write(tmp_path, "cases.yaml", "cases:\n  - id: one\n")
+        store.load("cases.yaml")
+        write(tmp_path, "schemas.yaml", "cases.yaml:\n  cases: [{id: int}]\n")
+        with pytest.raises(DataSchemaError, match=r"cases\[0\].id"):
+            store.load("cases.yaml")
+
+    def test_concurrent_load_parses_once(self, store, tmp_path, monkeypatch):
+        write(tmp_path, "cases.yaml", "cases:\n  - id: 1\n")
+        parsed = []
+        original_load = data_store.yaml.load
+        start = threading.Barrier(4)
+        never = threading.Event()
+
+        def slow_load(stream, Loader):
+            parsed.append(stream.name)
+            # 放大解析耗时，让其他线程在解析期间调用load
+            never.wait(0.05)
+            return original_load(stream, Loader=Loader)
+
+        def load(_):
+            start.wait()
+            return store.load("cases.yaml")
+
+        monkeypatch.setattr(data_store.yaml, "load", slow_load)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            views = list(executor.map(load, range(4)))
+        assert len(parsed) == 1
+        assert all(view is views[0] for view in views)
+
+    def test_iter_cases(self, store, tmp_path):
+        write(tmp_path, "rows.csv", "id,name\n1,a\n2,b\n")
+        write(tmp_path, "rows.jsonl", '{"id": 1}\n\n{"id": 2}\n')
+        write(tmp_path, "rows.yaml", "cases:\n  - id: 1\n---\ncases:\n  - id: 2\n")
+        assert [row['name'] for row in store.iter_cases("rows.csv")] == ["a", "b"]
+        assert [row['id'] for row in store.iter_cases("rows.jsonl")] == [1, 2]
+        assert [row['id'] for row in store.iter_cases("rows.yaml", key="cases")] == [1, 2]
@@ -0,0 +1,127 @@
+'''
+Docstring for test_cases.unit.test_dom_extract
+页面内批量提取与详情页提取缓存的单元测试
+使用假的Page对象，不启动真实浏览器
+'''
+
+import pytest
+from pages.literature_detail_page import LiteratureDetailPage
+from utils.dom_extract import build_field_specs, missing_fields, selector_to_spec
+
+pytestmark = pytest.mark.unit
+
+REQUIRED = LiteratureDetailPage.REQUIRED_DETAIL_FIELDS
+DEPENDENTS = LiteratureDetailPage.DEPENDENT_DETAIL_FIELDS
+
+COMPLETE_ROW = {
+    'title_en': 'Title', 'title_cn': None, 'authors': 'S. Rai et al', 'journal': 'ENVIRONMENTAL SCIENCE',
+    'publish_date': '2026-01-02', 'impact_factor': None, 'citation_count': None, 'ai_interpretation': None,
+    'has_ai_interpretation': False, 'has_full_text': False, 'has_charts': False, 'has_data': False
+}
+
+
+class FakeDetailPage:
+    '''模拟详情页：wait_for_function超时或成功，evaluate依次返回预设的行'''
+
+    def __init__(self, rows, ready=True):
+        self.main_frame = object()
+        self.rows = list(rows)
+        self.ready = ready
+        self.waits = 0
+        self.evaluations = 0
+
+    def on(self, event, listener):
+        pass
+
+    def remove_listener(self, event, listener):
+        pass
+
+    def wait_for_function(self, script, arg=None, timeout=None):
+        self.waits += 1
+        if not self.ready:
+            raise TimeoutError("Timeout exceeded")
+
+    def evaluate(self, script, arg=None):
+        self.evaluations += 1
+        row = self.rows.pop(0) if len(self.rows) > 1 else self.rows[0]
+        return {'count': 1, 'rows': [row]}
+
+
+class TestSelectorSpec:
+    '''
+    Docstring for TestSelectorSpec
+    选择器转换为页面内查找描述
+    '''
+
+    @pytest.mark.parametrize("selector, kind, value", [
+        ('text=/IF:|Q1/', 'regex', 'IF:|Q1'),
+        ('text=AI解读', 'text', 'AI解读'),
+        ('text="AI解读"', 'text', 'AI解读'),
+        ('h1, h2', 'css', 'h1, h2'),
+        ('a[href*="/literature/"]', 'css', 'a[href*="/literature/"]'),
+    ])
+    def test_selector_kinds(self, selector, kind, value):
+        '''CSS、text=文本、text=/正则/ 分别转换'''
+        spec = selector_to_spec(selector)
+        assert spec['kind'] == kind
+        assert spec['value'] == value
+
+    def test_unsupported_selector(self):
+        '''xpath等引擎不支持页面内提取'''
+        with pytest.raises(ValueError):
+            selector_to_spec('xpath=//div')
+
+    def test_specs_cached(self):
+        '''同一组字段只转换一次'''
+        fields = {'title': 'h1', 'has_chart': ('.charts', 'exists')}
+        assert build_field_specs(fields) is build_field_specs(dict(fields))
+        assert build_field_specs(fields)['has_chart']['mode'] == 'exists'
+
+
+class TestMissingFields:
+    '''
+    Docstring for TestMissingFields
+    必填字段检查
+    '''
+
+    def test_complete_row(self):
+        assert missing_fields(COMPLETE_ROW, REQUIRED, DEPENDENTS) == []
+
+    def test_title_alternatives(self):
+        '''英文或中文标题任意一个有内容即可'''
+        row = {**COMPLETE_ROW, 'title_en': '  ', 'title_cn': '中文标题'}
+        assert missing_fields(row, REQUIRED, DEPENDENTS) == []
+
+    def test_missing_text_field(self):
+        row = {**COMPLETE_ROW, 'authors': None, 'journal': ''}
+        assert missing_fields(row, REQUIRED, DEPENDENTS) == [('authors',), ('journal',)]
+
+    def test_dependent_field(self):
+        '''AI解读标题出现但内容为空时视为缺失'''
+        row = {**COMPLETE_ROW, 'has_ai_interpretation': True}
+        assert missing_fields(row, REQUIRED, DEPENDENTS) == [('ai_interpretation',)]
+
+
+class TestDetailExtraction:
+    '''
+    Docstring for TestDetailExtraction
+    详情页提取：先等待必填字段，不完整的结果不缓存
+    '''
+
+    def test_complete_detail_cached(self):
+        page = FakeDetailPage([COMPLETE_ROW])
+        detail_page = LiteratureDetailPage(page)
+        first = detail_page.extract_detail()
+        assert detail_page.extract_detail() is first
+        assert page.waits == 1
+        assert page.evaluations == 1
+
+    def test_incomplete_detail_not_cached(self):
+        '''等待超时后返回已渲染的字段，下次调用重新提取但不再等待'''
+        incomplete = {**COMPLETE_ROW, 'authors': None}
+        page = FakeDetailPage([incomplete, COMPLETE_ROW], ready=False)
+        detail_page = LiteratureDetailPage(page)
+        assert detail_page.extract_detail().authors == ''
+        assert detail_page.extract_detail().authors == 'S. Rai et al'
+        assert page.waits == 1
+        assert page.evaluations == 2
@@ -0,0 +1,65 @@
+'''
+Docstring for test_cases.unit.test_event_analyzer
+操作事件分析单元测试
+'''
+
+import json
+import pytest
+from utils.event_analyzer import display_width, format_report, load_events, percentile, summarize
+
+pytestmark = pytest.mark.unit
+
+
+def event(action, selector, duration_ms, outcome="passed"):
+    return {'action': action, 'selector': selector, 'duration_ms': duration_ms, 'outcome': outcome}
+
+
+class TestEventAnalyzer:
+    '''
+    Docstring for TestEventAnalyzer
+    分位数与分组统计
+    '''
+
+    @pytest.mark.parametrize("percent, expected", [(50, 50), (95, 95), (99, 99), (100, 100), (1, 1), (0, 1)])
+    def test_percentile_nearest_rank(self, percent, expected):
+        '''最近秩法：1~100的第ceil(p%*n)个值'''
+        assert percentile(list(range(1, 101)), percent) == expected
+
+    def test_percentile_small_sample(self):
+        assert percentile([10.0, 20.0, 30.0], 50) == 20.0
+        assert percentile([10.0, 20.0, 30.0], 95) == 30.0
+        assert percentile([], 95) == 0.0
+
+    def test_summarize(self):
+        summary = summarize([
+            event("click", "#login", 30.0),
+            event("click", "#login", 10.0, "failed"),
+            event("click", "#next", 20.0),
+            event("fill", "#user", 5.0),
+        ])
+        click = summary['by_action']['click']
+        assert click['count'] == 3
+        assert click['failed'] == 1
+        assert click['p50'] == 20.0
+        assert click['max'] == 30.0
+        assert click['total'] == 60.0
+        assert summary['by_selector'][("click", "#login")]['count'] == 2
+
+    def test_load_events_skips_broken_lines(self, tmp_path):
+        '''写入中断的最后一行和空行被跳过，轮转文件也会读取'''
+        (tmp_path / "actions_master.jsonl").write_text(
+            json.dumps(event("click", "#a", 1.0)) + "\n\n{\"action\": \"cli", encoding="utf-8"
+        )
+        (tmp_path / "actions_master.jsonl.1").write_text(json.dumps(event("fill", "#b", 2.0)) + "\n", encoding="utf-8")
+        assert [e['action'] for e in load_events([str(tmp_path)])] == ["click", "fill"]
+
+    def test_format_report_aligned(self):
+        '''表头与数据行按显示宽度对齐，中文按2列计算'''
+        assert display_width("次数") == 4
+        assert display_width("p95") == 3
+        lines = format_report(summarize([event("click", "#login", 1234.5, "failed")])).splitlines()
+        header, row = lines[1], lines[2]
+        # 数据行为ASCII，数值列结束位置应与表头显示宽度一致
+        assert row[display_width(header):] == "  click"
+        assert header.split() == ["次数", "失败", "p50", "p95", "p99", "最大"]
+        assert row.startswith(" " * 7 + "1 ")
@@ -0,0 +1,60 @@
+'''
+Docstring for test_cases.unit.test_har_replay
+HAR录制/回放的单元测试
+'''
+
+import os
+import pytest
+from utils.har_replay import MODE_OFF, MODE_RECORD, MODE_REPLAY, HarReplay
+
+pytestmark = pytest.mark.unit
+
+
+class FakeContext:
+    '''记录route_from_har调用的BrowserContext替身'''
+
+    def __init__(self):
+        self.calls = []
+
+    def route_from_har(self, path, **options):
+        self.calls.append((path, options))
+
+
+class TestHarReplay:
+    '''
+    Docstring for TestHarReplay
+    按模式开启录制或回放
+    '''
+
+    def test_har_path(self, tmp_path):
+        har = HarReplay(MODE_REPLAY, str(tmp_path))
+        assert har.har_path("test_cases/test_a.py::test_a[case 1]") == os.path.join(
+            str(tmp_path), "test_cases_test_a.py_test_a_case_1.har.zip"
+        )
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="未知的HAR模式"):
+            HarReplay("live")
+
+    def test_off(self, tmp_path):
+        context = FakeContext()
+        assert HarReplay(MODE_OFF, str(tmp_path)).attach(context, "test_a") is None
+        assert context.calls == []
+
+    def test_record(self, tmp_path):
+        har = HarReplay(MODE_RECORD, str(tmp_path / "har"), url_filter="**/api/**")
+        context = FakeContext()
+        path = har.attach(context, "test_a")
+        assert os.path.isdir(tmp_path / "har")
+        assert context.calls == [(path, {
+            'url': "**/api/**", 'update': True, 'update_content': "attach", 'update_mode': "minimal"
+        })]
+
+    def test_replay(self, tmp_path):
+        har = HarReplay(MODE_REPLAY, str(tmp_path))
+        context = FakeContext()
+        with pytest.raises(FileNotFoundError, match="--har record"):
+            har.attach(context, "test_a")
+        open(har.har_path("test_a"), 'wb').close()
+        assert har.attach(context, "test_a") == har.har_path("test_a")
+        assert context.calls == [(har.har_path("test_a"), {'not_found': "abort"})]
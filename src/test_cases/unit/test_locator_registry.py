@@ -0,0 +1,80 @@
+'''
+Docstring for test_cases.unit.test_locator_registry
+定位器注册表与文本选择器检查的单元测试
+'''
+
+import warnings
+import pytest
+from pages.literature_detail_page import LiteratureDetailLocators
+from pages.weekly_literature_page import WeeklyLiteratureLocators
+from utils.locator_registry import ExpensiveSelectorWarning, LocatorRegistry, audit_locators
+
+pytestmark = pytest.mark.unit
+
+
+class FakeLocator:
+    '''记录选择器链'''
+
+    def __init__(self, chain):
+        self.chain = chain
+
+    def locator(self, selector):
+        return FakeLocator(self.chain + (selector,))
+
+
+class FakePage:
+    def __init__(self):
+        self.created = 0
+
+    def locator(self, selector):
+        self.created += 1
+        return FakeLocator((selector,))
+
+
+class TestAuditLocators:
+    '''
+    Docstring for TestAuditLocators
+    未限定范围的文本选择器检查
+    '''
+
+    @pytest.mark.parametrize("locators_cls", [LiteratureDetailLocators, WeeklyLiteratureLocators])
+    def test_page_locators_clean(self, locators_cls):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ExpensiveSelectorWarning)
+            assert audit_locators(locators_cls) == []
+
+    def test_detail_selectors_page_wide(self):
+        '''详情页没有确认过的内容容器，文本字段在整个页面中查找，不限定在猜测的容器内'''
+        assert not getattr(LiteratureDetailLocators, 'SELECTOR_SCOPES', None)
+        assert LiteratureDetailLocators.AUTHORS in LiteratureDetailLocators.GLOBAL_TEXT_SELECTORS
+
+    def test_unscoped_text_selector_warns(self):
+        class Locators:
+            CONTAINER = '.card'
+            NAME = 'text=/姓名/'
+            DATE = 'text=/2026-/'
+            TITLE = 'text=标题'
+            SELECTOR_SCOPES = {NAME: CONTAINER}
+            GLOBAL_TEXT_SELECTORS = (TITLE,)
+
+        with pytest.warns(ExpensiveSelectorWarning, match="Locators.DATE"):
+            findings = audit_locators(Locators)
+        assert [name for name, _, _ in findings] == ["DATE"]
+
+
+class TestLocatorRegistry:
+    '''
+    Docstring for TestLocatorRegistry
+    定位器缓存与容器限定
+    '''
+
+    def test_scoped_and_cached(self):
+        page = FakePage()
+        registry = LocatorRegistry(page, WeeklyLiteratureLocators.SELECTOR_SCOPES)
+        author = registry.get(WeeklyLiteratureLocators.LITERATURE_AUTHOR)
+        assert author.chain == (WeeklyLiteratureLocators.LITERATURE_ITEMS, WeeklyLiteratureLocators.LITERATURE_AUTHOR)
+        assert registry.get(WeeklyLiteratureLocators.LITERATURE_AUTHOR) is author
+        registry.get(WeeklyLiteratureLocators.WEEKLY_SECTION_TITLE)
+        # 容器Locator也只创建一次
+        registry.get(WeeklyLiteratureLocators.LITERATURE_JOURNAL)
+        assert page.created == 2
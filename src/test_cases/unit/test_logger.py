@@ -0,0 +1,78 @@
+'''
+Docstring for test_cases.unit.test_logger
+日志工具单元测试
+'''
+
+import logging
+import queue
+import threading
+import pytest
+from utils.logger import Logger, _DeferredQueueHandler, _LazyFileHandler
+
+pytestmark = pytest.mark.unit
+
+
+class TestLogger:
+    '''
+    Docstring for TestLogger
+    日志不阻塞用例线程、文件延迟创建
+    '''
+
+    def test_propagated_to_pytest(self, caplog):
+        '''AutoTest日志仍由pytest的caplog/log_cli/HTML报告收集'''
+        with caplog.at_level(logging.INFO, logger="AutoTest"):
+            Logger().get_logger().info("报告中可见: %s", "首页")
+        assert "报告中可见: 首页" in caplog.messages
+
+    def test_debug_not_formatted_at_info(self):
+        '''INFO级别下DEBUG日志在logger上被过滤，不会格式化参数'''
+        class Probe:
+            def __str__(self):
+                raise AssertionError("DEBUG日志不应被格式化")
+
+        logger = Logger().get_logger()
+        if logger.isEnabledFor(logging.DEBUG):
+            pytest.skip("当前日志级别为DEBUG")
+        logger.debug("点击元素：%s", Probe())
+
+    def test_formatting_deferred_to_listener(self):
+        '''放入队列时不格式化，消息和异常堆栈在后台线程中格式化'''
+        log_queue = queue.SimpleQueue()
+        handler = _DeferredQueueHandler(log_queue)
+        record = logging.LogRecord("AutoTest", logging.ERROR, __file__, 1, "值: %s", (42,), None)
+        handler.handle(record)
+        queued = log_queue.get_nowait()
+        assert queued is record
+        assert queued.args == (42,)
+        assert queued.exc_text is None
+
+    def test_format_runs_on_listener_thread(self):
+        '''异步模式下Formatter在后台线程中调用'''
+        threads = []
+
+        class RecordingFormatter(logging.Formatter):
+            def format(self, record):
+                threads.append(threading.current_thread().name)
+                return super().format(record)
+
+        logger = Logger()
+        saved = logger._settings
+        logger.configure({'to_file': False, 'async': True, 'console': True})
+        try:
+            for handler in logger._handlers:
+                handler.setFormatter(RecordingFormatter())
+            logger.get_logger().warning("后台格式化")
+            logger.flush()
+        finally:
+            logger.configure(saved)
+        assert threads
+        assert threading.current_thread().name not in threads
+
+    def test_lazy_file_handler(self, tmp_path):
+        '''首次写日志时才创建目录和文件'''
+        path = tmp_path / "logs" / "test.log"
+        handler = _LazyFileHandler(str(path))
+        assert not path.parent.exists()
+        handler.emit(logging.LogRecord("AutoTest", logging.INFO, __file__, 1, "hello", (), None))
+        handler.close()
+        assert path.read_text(encoding="utf-8").strip() == "hello"
@@ -0,0 +1,130 @@
+'''
+Docstring for test_cases.unit.test_mock_server
+本地模拟后端单元测试
+在本进程内启动模拟后端，通过HTTP请求验证各路由，不需要浏览器
+'''
+
+import json
+import urllib.error
+import urllib.request
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    '''不跟随重定向，便于检查302'''
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+OPENER = urllib.request.build_opener(_NoRedirect)
+
+
+def request(backend, path, token=None, data=None):
+    '''
+    发送请求
+    return: (状态码, 响应文本)
+    '''
+    from utils.mock_server import SESSION_COOKIE
+
+    headers = {"Cookie": f"{SESSION_COOKIE}={token}"} if token else {}
+    body = None
+    if data is not None:
+        body = json.dumps(data).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    req = urllib.request.Request(backend.base_url + path, data=body, headers=headers)
+    try:
+        with OPENER.open(req, timeout=5) as response:
+            return response.status, response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, e.read().decode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def mock_server():
+    '''
+    用例执行时才导入utils.mock_server
+    模块级导入会在收集阶段加载模拟后端，违反bench_startup的延迟导入检查
+    '''
+    return pytest.importorskip("utils.mock_server")
+
+
+@pytest.fixture(scope="module")
+def backend(mock_server):
+    factory = mock_server.LiteratureFactory(["Water treatment"], count=50)
+    with mock_server.MockBackend({'tester': "secret"}, factory) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def token(backend):
+    return backend.login('tester', "secret")
+
+
+class TestMockBackend:
+    '''
+    Docstring for TestMockBackend
+    登录、列表和详情路由
+    '''
+
+    def test_login_api(self, backend):
+        status, body = request(backend, "/api/login", data={'username': 'tester', 'password': "wrong"})
+        assert status == 200 and json.loads(body)['code'] == 1
+        status, body = request(backend, "/api/login", data={'username': 'tester', 'password': "secret"})
+        assert json.loads(body)['code'] == 0
+
+    def test_pages_require_login(self, backend):
+        assert request(backend, "/")[0] == 302
+        assert request(backend, "/api/literature")[0] == 401
+
+    def test_home_page_count(self, backend, token):
+        status, body = request(backend, "/?count=3", token)
+        assert status == 200
+        assert body.count('class="literature-item"') == 3
+        assert "共 3 篇" in body
+
+    def test_detail_beyond_default_count(self, backend, token):
+        '''列表页用 ?count= 展示的任何一篇都能打开详情，不受默认数量50限制'''
+        status, body = request(backend, "/?count=10000", token)
+        assert status == 200
+        assert "/literature/9999" in body
+        status, body = request(backend, "/literature/9999", token)
+        assert status == 200
+        assert "case study 10000" in body
+        assert request(backend, "/api/literature/9999", token)[0] == 200
+
+    def test_detail_out_of_range(self, mock_server, backend, token):
+        assert request(backend, f"/literature/{mock_server.MAX_LITERATURE_COUNT}", token)[0] == 404
+        assert request(backend, "/literature/abc", token)[0] == 404
+
+    def test_api_paging(self, backend, token):
+        status, body = request(backend, "/api/literature?offset=48&limit=5", token)
+        payload = json.loads(body)
+        assert payload['total'] == 50
+        assert [item['id'] for item in payload['items']] == [48, 49]
+
+    def test_fault_injection(self, mock_server):
+        '''error_rate为1时API路径全部返回错误状态码'''
+        fault = mock_server.FaultProfile("broken", error_rate=1.0, error_status=503)
+        with mock_server.MockBackend({'tester': "secret"}, mock_server.LiteratureFactory(), fault) as server:
+            token = server.login('tester', "secret")
+            assert request(server, "/api/literature", token)[0] == 503
+            assert request(server, "/login")[0] == 200
+
+
+class TestLiteratureFactory:
+    '''
+    Docstring for TestLiteratureFactory
+    文献数据由序号决定
+    '''
+
+    def test_deterministic(self, mock_server):
+        factory = mock_server.LiteratureFactory(["A"])
+        assert factory.get(7) == mock_server.LiteratureFactory(["A"]).get(7)
+
+    def test_clamp_count(self, mock_server):
+        factory = mock_server.LiteratureFactory
+        assert factory.clamp_count(-1) == 0
+        assert factory.clamp_count(mock_server.MAX_LITERATURE_COUNT + 1) == mock_server.MAX_LITERATURE_COUNT
@@ -0,0 +1,56 @@
+'''
+Docstring for test_cases.unit.test_page_listeners
+页面对象事件监听单元测试
+使用假的Page对象，不启动真实浏览器
+'''
+
+import pytest
+from pages.literature_detail_page import LiteratureDetailPage
+from pages.weekly_literature_page import WeeklyLiteraturePage
+
+pytestmark = pytest.mark.unit
+
+
+class FakePage:
+    '''模拟Playwright Page的事件注册'''
+
+    def __init__(self):
+        self.main_frame = object()
+        self.listeners = {}
+
+    def on(self, event, listener):
+        self.listeners.setdefault(event, []).append(listener)
+
+    def remove_listener(self, event, listener):
+        self.listeners[event].remove(listener)
+
+    def navigate(self, frame=None):
+        for listener in list(self.listeners.get("framenavigated", [])):
+            listener(frame or self.main_frame)
+
+
+class TestPageListeners:
+    '''
+    Docstring for TestPageListeners
+    页面对象注册的framenavigated监听在close后移除
+    '''
+
+    def test_close_removes_listener(self):
+        '''同一个page上反复创建页面对象，close后监听器不会累积'''
+        page = FakePage()
+        for _ in range(5):
+            with WeeklyLiteraturePage(page, "http://localhost"):
+                pass
+        assert page.listeners["framenavigated"] == []
+
+    def test_main_frame_navigation_discards_cache(self):
+        '''主框架导航丢弃缓存，子框架导航不影响'''
+        page = FakePage()
+        detail_page = LiteratureDetailPage(page)
+        detail_page._detail = "cached"
+        page.navigate(frame=object())
+        assert detail_page._detail == "cached"
+        page.navigate()
+        assert detail_page._detail is None
+        detail_page.close()
+        assert page.listeners["framenavigated"] == []
@@ -0,0 +1,88 @@
+'''
+Docstring for test_cases.unit.test_performance
+性能预算与历史趋势的单元测试
+'''
+
+import pytest
+from pages.literature_detail_page import LiteratureDetailPage
+from utils.performance import METRICS, PerformanceHistory, check_budget
+
+pytestmark = pytest.mark.unit
+
+
+class TestCheckBudget:
+    '''
+    Docstring for TestCheckBudget
+    指标与预算对比
+    '''
+
+    def test_check_budget(self):
+        metrics = {'ttfb': 120, 'load': 2500, 'largest_contentful_paint': None}
+        result = check_budget(metrics, {'ttfb': 200, 'load': 2000, 'largest_contentful_paint': 2500})
+        assert result['ttfb'] == {'measured': 120, 'budget': 200, 'passed': True}
+        assert result['load']['passed'] is False
+        # 未采集到的指标（如firefox/webkit的LCP）不判定
+        assert result['largest_contentful_paint']['passed'] is None
+
+    def test_no_budget(self):
+        assert check_budget({'ttfb': 120}, None) == {}
+
+
+class TestPerformanceHistory:
+    '''
+    Docstring for TestPerformanceHistory
+    历史记录与趋势
+    '''
+
+    def test_trend(self, tmp_path):
+        history = PerformanceHistory(str(tmp_path / "history.jsonl"), keep=2)
+        for load in (100, 200, 300):
+            history.record("test_a|home", {'load': load})
+        history.record("test_b|home", {'load': 999})
+        with open(history.path, 'a', encoding='utf-8') as f:
+            f.write("{broken\n")
+        trend = history.trend("test_a|home")
+        assert set(trend) == set(METRICS)
+        assert trend['load'] == [200, 300]
+        assert trend['ttfb'] == [None, None]
+
+    def test_trend_without_file(self, tmp_path):
+        assert PerformanceHistory(str(tmp_path / "missing.jsonl")).trend("x")['load'] == []
+
+
+class FakePage:
+    '''第一次采集为单页应用内跳转，重新加载后有导航指标'''
+
+    def __init__(self):
+        self.url = "https://example.com/literature/3"
+        self.navigations = []
+
+    def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    def wait_for_selector(self, selector, timeout=None):
+        pass
+
+    def on(self, event, callback):
+        pass
+
+    def goto(self, url, **options):
+        self.navigations.append(url)
+
+    def evaluate(self, script):
+        soft = not self.navigations
+        return {'url': self.url, 'soft_navigation': soft, 'load': None if soft else 800}
+
+
+class TestCollectPerformanceMetrics:
+    '''
+    Docstring for TestCollectPerformanceMetrics
+    单页应用内跳转的详情页重新整页加载后测量
+    '''
+
+    def test_soft_navigation(self):
+        page = FakePage()
+        assert LiteratureDetailPage(page).collect_performance_metrics()['load'] is None
+        metrics = LiteratureDetailPage(page).collect_performance_metrics(hard_navigation=True)
+        assert page.navigations == [page.url]
+        assert (metrics['soft_navigation'], metrics['load']) == (False, 800)
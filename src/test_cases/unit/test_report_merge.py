@@ -0,0 +1,56 @@
+'''
+Docstring for test_cases.unit.test_report_merge
+并行日志合并单元测试
+'''
+
+import pytest
+from utils.report_merge import clear_worker_logs, merge_worker_logs, write_allure_environment
+
+pytestmark = pytest.mark.unit
+
+
+def write_log(path, lines):
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+
+
+class TestReportMerge:
+    '''
+    Docstring for TestReportMerge
+    worker日志的清理与按时间合并
+    '''
+
+    def test_merge_sorted_by_time(self, tmp_path):
+        '''各worker的记录按时间合并，多行记录（异常堆栈）保持完整'''
+        write_log(tmp_path / "test_20260101_gw0.log", [
+            "2026-01-01 10:00:00 - AutoTest[gw0] - INFO - a",
+            "2026-01-01 10:00:02 - AutoTest[gw0] - ERROR - c",
+            "Traceback (most recent call last):",
+        ])
+        write_log(tmp_path / "test_20260101_gw1.log", [
+            "2026-01-01 10:00:01 - AutoTest[gw1] - INFO - b",
+        ])
+        merged = merge_worker_logs(str(tmp_path), date="20260101")
+        lines = open(merged, encoding="utf-8").read().splitlines()
+        assert [line[-1] for line in lines[:3]] == ["a", "b", "c"]
+        assert lines[3] == "Traceback (most recent call last):"
+
+    def test_clear_removes_stale_worker_logs(self, tmp_path):
+        '''会话开始时清理之前执行的worker日志，合并结果只包含本次执行'''
+        write_log(tmp_path / "test_20260101_gw0.log", ["2026-01-01 09:00:00 - AutoTest[gw0] - INFO - stale"])
+        write_log(tmp_path / "test_20260101.log", ["2026-01-01 09:00:00 - AutoTest - INFO - master"])
+        assert clear_worker_logs(str(tmp_path)) == 1
+        assert (tmp_path / "test_20260101.log").exists()
+
+        write_log(tmp_path / "test_20260101_gw0.log", ["2026-01-01 10:00:00 - AutoTest[gw0] - INFO - fresh"])
+        merged = merge_worker_logs(str(tmp_path))
+        content = open(merged, encoding="utf-8").read()
+        assert "fresh" in content
+        assert "stale" not in content
+
+    def test_no_worker_logs(self, tmp_path):
+        assert merge_worker_logs(str(tmp_path)) is None
+
+    def test_allure_environment(self, tmp_path):
+        write_allure_environment(str(tmp_path / "allure"), {'browser': 'chromium', 'workers': 2})
+        content = (tmp_path / "allure" / "environment.properties").read_text(encoding="utf-8")
+        assert content == "browser=chromium\nworkers=2\n"
@@ -0,0 +1,155 @@
+'''
+Docstring for test_cases.unit.test_retry
+失败分类与重试策略的单元测试
+'''
+
+from types import SimpleNamespace
+import pytest
+from utils.config import Config
+from utils.retry import (
+    CATEGORY_ASSERTION, CATEGORY_BROWSER_CRASH, CATEGORY_NETWORK_TIMEOUT, CATEGORY_OTHER,
+    CATEGORY_SELECTOR_MISSING, RetryPolicy, classify_failure
+)
+
+pytestmark = pytest.mark.unit
+pytest_plugins = ["pytester"]
+
+
+def report(text):
+    '''只包含失败信息的TestReport替身'''
+    return SimpleNamespace(longreprtext=text)
+
+
+class TestClassifyFailure:
+    '''
+    Docstring for TestClassifyFailure
+    按失败信息分类
+    '''
+
+    @pytest.mark.parametrize("text, category", [
+        ("playwright._impl._errors.TargetClosedError: Target page, context or browser has been closed",
+         CATEGORY_BROWSER_CRASH),
+        ("Error: Page crashed", CATEGORY_BROWSER_CRASH),
+        ("TimeoutError: Locator.click: Timeout 30000ms exceeded.\n  - waiting for locator(\"#login\")",
+         CATEGORY_SELECTOR_MISSING),
+        ("Error: page.goto: net::ERR_CONNECTION_RESET at https://example.com", CATEGORY_NETWORK_TIMEOUT),
+        ("TimeoutError: Page.goto: Timeout 30000ms exceeded.\n  - navigating to \"https://example.com\"",
+         CATEGORY_NETWORK_TIMEOUT),
+        # 断言信息中的"超时"是页面对象的自定义文字，不当作网络超时重试
+        ("AssertionError: 断言失败: 期望为 True, 实际为 False. 首页加载超时", CATEGORY_ASSERTION),
+        ("AssertionError: 断言失败: 期望 智库", CATEGORY_ASSERTION),
+        ("AssertionError: Timeout 30000ms exceeded", CATEGORY_ASSERTION),
+        ("KeyError: 'title'", CATEGORY_OTHER),
+        ("", CATEGORY_OTHER),
+    ])
+    def test_categories(self, text, category):
+        assert classify_failure(report(text)) == category
+
+
+class TestRetryPolicy:
+    '''
+    Docstring for TestRetryPolicy
+    重试判断与统计文件
+    '''
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry(CATEGORY_NETWORK_TIMEOUT, 1)
+        assert policy.should_retry(CATEGORY_BROWSER_CRASH, 2)
+        assert not policy.should_retry(CATEGORY_NETWORK_TIMEOUT, 3)
+        assert not policy.should_retry(CATEGORY_ASSERTION, 1)
+        assert not policy.should_retry(CATEGORY_SELECTOR_MISSING, 1)
+
+    def test_from_config(self):
+        config = Config.from_dict({'base_url': "x", 'retry': {'max_retries': 3, 'retry_on': ["assertion"]}})
+        policy = RetryPolicy.from_config(config)
+        assert policy.max_retries == 3
+        assert policy.retry_on == {"assertion"}
+        assert RetryPolicy.from_config(config, max_retries=0).max_retries == 0
+
+    def test_stats_roundtrip(self, tmp_path):
+        policy = RetryPolicy(stats_dir=str(tmp_path / "retry"))
+        policy.record({'nodeid': "test_a", 'attempts': 2, 'outcome': "passed", 'failures': []})
+        policy.record({'nodeid': "test_b", 'attempts': 2, 'outcome': "failed", 'failures': []})
+        assert [entry['nodeid'] for entry in policy.load_stats()] == ["test_a", "test_b"]
+        policy.clear_stats()
+        assert policy.load_stats() == []
+
+
+RETRY_CONFTEST = '''
+import pytest
+from utils.retry import RetryPolicy, run_test_with_retries, supports_retry
+
+POLICY = RetryPolicy(max_retries=1, stats_dir={stats_dir!r})
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not supports_retry(item):
+        return None
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    run_test_with_retries(item, nextitem, POLICY)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report):
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {{}})
+'''
+
+RETRY_TESTS = '''
+import pytest
+
+CALLS = {'browser': 0, 'page': 0, 'page_teardown': 0, 'flaky': 0}
+
+
+@pytest.fixture(scope="session")
+def browser():
+    CALLS['browser'] += 1
+    return object()
+
+
+@pytest.fixture
+def page(browser):
+    CALLS['page'] += 1
+    yield object()
+    CALLS['page_teardown'] += 1
+
+
+def test_flaky(page):
+    CALLS['flaky'] += 1
+    if CALLS['flaky'] == 1:
+        raise TimeoutError("Page.goto: Timeout 30000ms exceeded.")
+
+
+def test_assertion(page):
+    assert False, "首页加载超时"
+
+
+def test_fixture_reuse():
+    # 重试时只重建function级fixture，会话级fixture复用
+    assert CALLS == {'browser': 1, 'page': 3, 'page_teardown': 3, 'flaky': 2}
+'''
+
+
+class TestRunWithRetries:
+    '''
+    Docstring for TestRunWithRetries
+    在子会话中执行用例，验证重试流程
+    '''
+
+    def test_retry_protocol(self, pytester, tmp_path):
+        pytester.makeconftest(RETRY_CONFTEST.format(stats_dir=str(tmp_path / "retry")))
+        pytester.makepyfile(test_inner=RETRY_TESTS)
+        result = pytester.runpytest_inprocess("-p", "no:cacheprovider")
+        outcomes = result.parseoutcomes()
+        assert (outcomes.get('passed'), outcomes.get('failed'), outcomes.get('rerun')) == (2, 1, 1)
+
+        stats = RetryPolicy(stats_dir=str(tmp_path / "retry")).load_stats()
+        assert [(entry['nodeid'].split("::")[-1], entry['attempts'], entry['outcome']) for entry in stats] == [
+            ("test_flaky", 2, "passed"),
+            ("test_assertion", 1, "failed"),
+        ]
+        assert stats[0]['failures'][0]['category'] == CATEGORY_NETWORK_TIMEOUT
+        assert stats[1]['failures'][0]['category'] == CATEGORY_ASSERTION
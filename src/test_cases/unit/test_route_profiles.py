@@ -0,0 +1,152 @@
+'''
+Docstring for test_cases.unit.test_route_profiles
+网络路由配置与异步上下文创建的单元测试
+使用假的浏览器和上下文，不启动真实浏览器
+'''
+
+import asyncio
+import pytest
+from pages.async_literature_detail_page import validate_literature_details
+from utils.async_runner import new_async_context
+from utils.config import Config
+from utils.route_profiles import ACTION_BLOCK, ACTION_CONTINUE, ACTION_STUB, RouteProfile
+
+pytestmark = pytest.mark.unit
+
+BASE_URL = "https://www.example.com"
+
+CONFIG = Config.from_dict({
+    'base_url': BASE_URL,
+    'timeout': 12345,
+    'browser': {'viewport': {'width': 1024, 'height': 600}},
+    'routing': {
+        'default': "full",
+        'first_party_hosts': ["*.example-cdn.com.cn"],
+        'profiles': {
+            'full': {},
+            'minimal': {
+                'block_resource_types': ["image"],
+                'block_third_party': True,
+                'stub_url_patterns': ["*/analytics/*"]
+            }
+        }
+    }
+})
+
+
+class FakePage:
+    '''打开页面即失败，只用于检查上下文的创建和关闭'''
+
+    async def goto(self, url):
+        raise RuntimeError("offline")
+
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    '''记录创建参数、默认超时和注册的路由'''
+
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.timeout = None
+        self.routes = []
+        self.closed = False
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    def on(self, event, listener):
+        pass
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+
+class TestRouteProfile:
+    '''
+    Docstring for TestRouteProfile
+    请求的处理方式
+    '''
+
+    def test_decide(self):
+        profile = RouteProfile.from_config(CONFIG, "minimal")
+        assert profile.decide(f"{BASE_URL}/analytics/hit", "xhr", BASE_URL) == ACTION_STUB
+        assert profile.decide(f"{BASE_URL}/logo.png", "image", BASE_URL) == ACTION_BLOCK
+        assert profile.decide("https://cdn.other.net/app.js", "script", BASE_URL) == ACTION_BLOCK
+        assert profile.decide(f"{BASE_URL}/api/list", "fetch", BASE_URL) == ACTION_CONTINUE
+        assert profile.decide("https://api.www.example.com/list", "fetch", BASE_URL) == ACTION_CONTINUE
+
+    def test_first_party_hosts(self):
+        '''同一公共后缀（如.com.cn）下的其他站点不视为站点自身，只认配置的主机'''
+        profile = RouteProfile.from_config(CONFIG, "minimal")
+        site = "https://lib.example.edu.cn"
+        assert profile.decide("https://static.example-cdn.com.cn/app.js", "script", site) == ACTION_CONTINUE
+        assert profile.decide("https://tracker.other.edu.cn/t.js", "script", site) == ACTION_BLOCK
+        assert profile.decide("https://ads.example.com.cn/a.js", "script", site) == ACTION_BLOCK
+
+    def test_default_profile(self):
+        profile = RouteProfile.from_config(CONFIG)
+        assert profile.name == "full"
+        assert profile.is_passthrough
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            RouteProfile.from_config(CONFIG, "missing")
+
+
+class TestAsyncContexts:
+    '''
+    Docstring for TestAsyncContexts
+    共享上下文与独立上下文使用相同的视口、超时和路由
+    '''
+
+    def test_new_async_context(self):
+        browser = FakeBrowser()
+        profile = RouteProfile.from_config(CONFIG, "minimal")
+        context = asyncio.run(new_async_context(browser, CONFIG, profile, storage_state={'cookies': []}))
+        assert context.options == {'viewport': {'width': 1024, 'height': 600}, 'storage_state': {'cookies': []}}
+        assert context.timeout == 12345
+        assert context.routes == ["**/*"]
+
+    def test_isolated_contexts_use_factory(self):
+        '''独立上下文模式下每个页面通过context_factory创建上下文，结束后关闭'''
+        browser = FakeBrowser()
+        profile = RouteProfile.from_config(CONFIG, "minimal")
+
+        async def sweep():
+            shared = await new_async_context(browser, CONFIG, profile)
+            return await validate_literature_details(
+                shared,
+                [f"{BASE_URL}/literature/0", f"{BASE_URL}/literature/1"],
+                isolate_contexts=True,
+                context_factory=lambda: new_async_context(browser, CONFIG, profile)
+            )
+
+        results = asyncio.run(sweep())
+        assert [result.error for result in results] == ["offline", "offline"]
+        isolated = browser.contexts[1:]
+        assert len(isolated) == 2
+        assert all(context.routes == ["**/*"] and context.timeout == 12345 for context in isolated)
+        assert all(context.closed for context in isolated)
+
+    def test_isolation_requires_factory(self):
+        with pytest.raises(ValueError):
+            asyncio.run(validate_literature_details(FakeContext(FakeBrowser(), {}), [], isolate_contexts=True))
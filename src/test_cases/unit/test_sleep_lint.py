@@ -0,0 +1,47 @@
+'''
+Docstring for test_cases.unit.test_sleep_lint
+固定等待检查工具的单元测试
+'''
+
+import pytest
+from utils.sleep_lint import lint_paths, main
+
+pytestmark = pytest.mark.unit
+
+SOURCE = '''import time
+from time import sleep
+
+
+def test_a(page):
+    page.wait_for_timeout(1000)
+    time.sleep(1)
+    sleep(0.5)
+    page.wait_for_selector("#ready")
+    text = "time.sleep(1)"
+'''
+
+
+class TestSleepLint:
+    '''
+    Docstring for TestSleepLint
+    找出固定等待调用
+    '''
+
+    def test_findings(self, tmp_path):
+        (tmp_path / "test_a.py").write_text(SOURCE, encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("time.sleep(1)", encoding="utf-8")
+        findings = lint_paths([str(tmp_path)])
+        assert sorted((lineno, code) for _, lineno, code in findings) == [
+            (6, "page.wait_for_timeout(1000)"),
+            (7, "time.sleep(1)"),
+            (8, "sleep(0.5)"),
+        ]
+
+    def test_main_exit_code(self, tmp_path, capsys):
+        clean = tmp_path / "test_clean.py"
+        clean.write_text("def test_a(page):\n    page.wait_for_selector('#ready')\n", encoding="utf-8")
+        assert main([str(clean)]) == 0
+        dirty = tmp_path / "test_dirty.py"
+        dirty.write_text(SOURCE, encoding="utf-8")
+        assert main([str(dirty)]) == 1
+        assert "共发现 3 处固定等待" in capsys.readouterr().out
@@ -0,0 +1,85 @@
+'''
+Docstring for test_cases.unit.test_tracing
+trace录制模式的单元测试
+'''
+
+import os
+import pytest
+from utils.config import Config
+from utils.tracing import MODE_OFF, MODE_ON, MODE_ON_FIRST_RETRY, MODE_RETAIN_ON_FAILURE, TraceRecorder
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTracing:
+    '''记录调用的context.tracing替身，stop_chunk传入path时写出文件'''
+
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **options):
+        self.calls.append('start')
+
+    def start_chunk(self, title=None):
+        self.calls.append('start_chunk')
+
+    def stop_chunk(self, path=None):
+        self.calls.append(('stop_chunk', path is not None))
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(b"PK")
+
+    def stop(self):
+        self.calls.append('stop')
+
+
+class FakeContext:
+    '''只有tracing属性的BrowserContext替身'''
+
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+class TestTraceRecorder:
+    '''
+    Docstring for TestTraceRecorder
+    按模式决定录制和保留
+    '''
+
+    @pytest.mark.parametrize("mode, attempts", [
+        (MODE_OFF, []),
+        (MODE_ON, [1, 2, 3]),
+        (MODE_RETAIN_ON_FAILURE, [1, 2, 3]),
+        (MODE_ON_FIRST_RETRY, [2]),
+    ])
+    def test_should_record(self, mode, attempts):
+        recorder = TraceRecorder(mode)
+        assert [attempt for attempt in (1, 2, 3) if recorder.should_record(attempt)] == attempts
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="未知的trace模式"):
+            TraceRecorder("always")
+
+    def test_from_config(self):
+        config = Config.from_dict({'base_url': "x", 'tracing': {'mode': MODE_ON, 'sources': True}})
+        assert TraceRecorder.from_config(config).mode == MODE_ON
+        assert TraceRecorder.from_config(config).sources is True
+        assert TraceRecorder.from_config(config, mode=MODE_OFF).mode == MODE_OFF
+
+    @pytest.mark.parametrize("failed", [False, True])
+    def test_retain_on_failure(self, tmp_path, failed):
+        recorder = TraceRecorder(MODE_RETAIN_ON_FAILURE, str(tmp_path))
+        context = FakeContext()
+        assert recorder.start(context, "test_cases/test_a.py::test_a[case 1]")
+        path = recorder.stop(context, "test_cases/test_a.py::test_a[case 1]", failed)
+        assert context.tracing.calls == ['start', 'start_chunk', ('stop_chunk', failed), 'stop']
+        if failed:
+            assert os.path.basename(path).startswith("test_cases_test_a.py_test_a_case_1_")
+        else:
+            assert path is None
+
+    def test_off_does_not_start(self, tmp_path):
+        context = FakeContext()
+        assert not TraceRecorder(MODE_OFF, str(tmp_path)).start(context, "test_a")
+        assert context.tracing.calls == []
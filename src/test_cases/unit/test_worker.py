@@ -0,0 +1,29 @@
+'''
+Docstring for test_cases.unit.test_worker
+xdist worker识别与路径隔离的单元测试
+'''
+
+import os
+import pytest
+from utils.worker import MASTER, get_worker_id, get_worker_index, is_xdist_worker, worker_path
+
+pytestmark = pytest.mark.unit
+
+
+class TestWorker:
+    '''
+    Docstring for TestWorker
+    按worker隔离的命名空间
+    '''
+
+    def test_master(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        assert (get_worker_id(), get_worker_index(), is_xdist_worker()) == (MASTER, 0, False)
+        assert worker_path(str(tmp_path / "shots"), "a.jpg") == os.path.join(str(tmp_path / "shots"), "a.jpg")
+        assert os.path.isdir(tmp_path / "shots")
+
+    def test_worker(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        assert (get_worker_id(), get_worker_index(), is_xdist_worker()) == ("gw3", 3, True)
+        assert worker_path(str(tmp_path)) == os.path.join(str(tmp_path), "gw3")
+        assert os.path.isdir(tmp_path / "gw3")
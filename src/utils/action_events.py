@@ -0,0 +1,176 @@
+# utils/action_events.py
+"""
+页面操作事件 - 为BasePage的每个操作记录一条结构化事件（JSONL）
+事件包含用例id、worker id、选择器、起止时间、耗时和结果，
+由utils.event_analyzer统计各操作和选择器的耗时分位数
+"""
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from utils.worker import get_worker_id
+
+# 默认事件配置，config.yaml中的events配置会覆盖这些值
+DEFAULT_SETTINGS = {
+    'enabled': True,
+    'dir': "reports/events",
+    'max_bytes': 10 * 1024 * 1024,  # 单个事件文件的最大字节数，超过后轮转
+    'backup_count': 5  # 保留的轮转文件数量
+}
+
+
+def current_test_id():
+    """
+    获取当前正在执行的用例id
+    Returns:
+        pytest nodeid，不在用例中执行时返回空字符串
+    """
+    # pytest在执行用例时设置该环境变量，格式为 "nodeid (setup|call|teardown)"
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+
+
+class ActionEventLog:
+    """
+    操作事件日志（单例模式）
+    与Logger一样在后台线程中写文件，第一次记录事件时才创建文件
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """单例模式实现"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """初始化事件日志"""
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.path = None
+        self._logger = logging.getLogger('AutoTest.events')
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._listener = None
+        self._file_handler = None
+        # 最近一次失败的元素操作 (用例id, 选择器)，失败截图时用于截取该元素
+        self.last_failure = None
+
+    @property
+    def enabled(self):
+        """是否记录事件"""
+        return self.settings['enabled']
+
+    def configure(self, settings=None):
+        """
+        按配置重新设置事件日志，文件在下次记录事件时创建
+        Args:
+            settings: config.yaml中的events配置
+        """
+        self.close()
+        self.settings = {**DEFAULT_SETTINGS, **(settings or {})}
+
+    def _start(self):
+        """创建事件文件和后台写入线程"""
+        os.makedirs(self.settings['dir'], exist_ok=True)
+        self.path = os.path.join(self.settings['dir'], f"actions_{get_worker_id()}.jsonl")
+        self._file_handler = RotatingFileHandler(
+            self.path,
+            maxBytes=self.settings['max_bytes'],
+            backupCount=self.settings['backup_count'],
+            encoding='utf-8'
+        )
+        self._file_handler.setFormatter(logging.Formatter('%(message)s'))
+        event_queue = queue.SimpleQueue()
+        self._listener = QueueListener(event_queue, self._file_handler)
+        self._listener.start()
+        self._logger.addHandler(QueueHandler(event_queue))
+
+    def emit(self, event):
+        """
+        记录一条事件
+        Args:
+            event: 事件字典
+        """
+        if not self.enabled:
+            return
+        if self._listener is None:
+            self._start()
+        self._logger.info(json.dumps(event, ensure_ascii=False))
+
+    def flush(self):
+        """把已记录的事件全部写入文件"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._file_handler.flush()
+            self._listener.start()
+
+    def close(self):
+        """写完剩余事件并关闭文件"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+
+
+def timed_action(action, element=False):
+    """
+    装饰页面操作方法，每次调用记录一条操作事件
+    方法的第一个参数（选择器、URL或文件名）记录为事件的selector
+    Args:
+        action: 操作类型，如click/fill
+        element: 第一个参数是否为元素选择器，是则失败时记入last_failure
+    """
+
+    def decorator(func):
+        target_param = list(inspect.signature(func).parameters)[1]
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            event_log = ActionEventLog()
+            if not event_log.enabled:
+                return func(self, *args, **kwargs)
+
+            start = time.time()
+            start_counter = time.perf_counter()
+            selector = str(args[0] if args else kwargs.get(target_param, ''))
+            outcome = "passed"
+            error = None
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                outcome = "failed"
+                error = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+                if element:
+                    event_log.last_failure = (current_test_id(), selector)
+                raise
+            finally:
+                elapsed = time.perf_counter() - start_counter
+                event_log.emit({
+                    'test_id': current_test_id(),
+                    'worker': get_worker_id(),
+                    'action': action,
+                    'selector': selector,
+                    'page': self.page.url,
+                    'start': round(start, 6),
+                    'end': round(start + elapsed, 6),
+                    'duration_ms': round(elapsed * 1000, 3),
+                    'outcome': outcome,
+                    'error': error
+                })
+
+        return wrapper
+
+    return decorator
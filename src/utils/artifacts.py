@@ -0,0 +1,164 @@
+# utils/artifacts.py
+"""
+截图策略 - 按配置决定何时截图、截什么、以什么格式保存
+默认只在失败时截图；优先截取失败操作对应的元素而不是整个页面；
+JPEG压缩后在后台线程写盘，并限制单次执行的截图总大小，超出时删除最早的截图
+"""
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from utils.logger import Logger
+from utils.worker import worker_path
+
+# Playwright支持的截图格式
+SUPPORTED_FORMATS = ('png', 'jpeg')
+
+
+class ArtifactPolicy:
+    """
+    截图策略
+    每个进程（xdist下每个worker）一个实例，截图总大小按进程统计
+    """
+
+    def __init__(self, directory="reports/screenshots", on_failure=True, on_success=False, image_format="jpeg",
+                 quality=70, full_page=False, element_scope=True, async_write=True, max_total_mb=200):
+        """
+        初始化截图策略
+        Args:
+            directory: 截图目录
+            on_failure: 失败时是否截图
+            on_success: 用例中的成功截图是否保存
+            image_format: png/jpeg，webp不受Playwright支持，按jpeg保存
+            quality: JPEG质量（0-100）
+            full_page: 是否截取整个可滚动页面（否则只截视口）
+            element_scope: 知道失败的元素时只截取该元素
+            async_write: 是否在后台线程写盘
+            max_total_mb: 单次执行的截图总大小上限（MB），0表示不限制
+        """
+        self.logger = Logger().get_logger()
+        self.directory = directory
+        self.on_failure = on_failure
+        self.on_success = on_success
+        if image_format == 'jpg':
+            image_format = 'jpeg'
+        if image_format not in SUPPORTED_FORMATS:
+            self.logger.warning(f"Playwright不支持{image_format}格式截图，改用jpeg")
+            image_format = 'jpeg'
+        self.image_format = image_format
+        self.quality = quality
+        self.full_page = full_page
+        self.element_scope = element_scope
+        self.max_total_bytes = int((max_total_mb or 0) * 1024 * 1024)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts") if async_write else None
+        self._pending = []
+        self._written = deque()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        根据config.yaml的screenshot配置创建，并行执行时每个worker使用独立的目录
+        Args:
+            config: Config对象
+        Returns:
+            ArtifactPolicy实例
+        """
+        screenshot_config = config.get('screenshot', {})
+        return cls(
+            directory=worker_path(screenshot_config.get('path', "reports/screenshots")),
+            on_failure=screenshot_config.get('on_failure', True),
+            on_success=screenshot_config.get('on_success', False),
+            image_format=screenshot_config.get('format', "jpeg"),
+            quality=screenshot_config.get('quality', 70),
+            full_page=screenshot_config.get('full_page', False),
+            element_scope=screenshot_config.get('element_scope', True),
+            async_write=screenshot_config.get('async_write', True),
+            max_total_mb=screenshot_config.get('max_total_mb', 200)
+        )
+
+    def _screenshot_options(self):
+        """截图参数"""
+        options = {'type': self.image_format}
+        if self.image_format == 'jpeg':
+            options['quality'] = self.quality
+        return options
+
+    def _grab(self, page, selector=None):
+        """
+        截图并返回图片数据，元素截图失败（元素已不存在或不可见）时退回页面截图
+        Args:
+            page: Playwright的Page对象
+            selector: 需要截取的元素
+        Returns:
+            图片字节
+        """
+        if selector and self.element_scope:
+            try:
+                return page.locator(selector).first.screenshot(timeout=2000, **self._screenshot_options())
+            except Exception as e:
+                self.logger.info(f"元素截图失败，改为页面截图：{str(e).splitlines()[0]}")
+        return page.screenshot(full_page=self.full_page, **self._screenshot_options())
+
+    def capture(self, page, name, passed=False, selector=None):
+        """
+        按策略截图
+        Args:
+            page: Playwright的Page对象
+            name: 文件名（不含扩展名），会追加时间戳
+            passed: 是否为成功截图
+            selector: 失败操作对应的元素选择器
+        Returns:
+            截图路径，按策略不截图时返回None
+        """
+        if not (self.on_success if passed else self.on_failure):
+            return None
+
+        data = self._grab(page, selector)
+        extension = 'jpg' if self.image_format == 'jpeg' else 'png'
+        file_name = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.{extension}"
+        path = os.path.join(self.directory, file_name)
+        if self._executor is None:
+            self._write(path, data)
+        else:
+            with self._lock:
+                self._pending = [future for future in self._pending if not future.done()]
+                self._pending.append(self._executor.submit(self._write, path, data))
+        return path
+
+    def _write(self, path, data):
+        """写入截图，超过总大小上限时删除本次执行最早的截图"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        with self._lock:
+            self._written.append((path, len(data)))
+            self._total_bytes += len(data)
+            evicted = []
+            while self.max_total_bytes and self._total_bytes > self.max_total_bytes and len(self._written) > 1:
+                old_path, size = self._written.popleft()
+                self._total_bytes -= size
+                evicted.append(old_path)
+
+        for old_path in evicted:
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                pass
+            self.logger.info(f"截图总大小超过上限，已删除最早的截图：{old_path}")
+
+    def flush(self):
+        """等待后台写入全部完成"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait(pending)
+
+    def close(self):
+        """写完剩余截图并停止后台线程"""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
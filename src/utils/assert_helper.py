@@ -4,7 +4,11 @@ Docstring for utils.assert_helper
 断言助手类 - 封装常用断言逻辑
 实现断言与测试代码分离，提供更友好的断言失败信息
 '''
+import json
+import allure
+from utils.action_events import current_test_id
 from utils.logger import Logger
+from utils.performance import PerformanceHistory, check_budget
 
 class AssertHelper:
     '''
@@ -26,7 +30,7 @@ class AssertHelper:
         '''
         try:
             assert actual == expected, f"断言失败：期望{expected}'，实际{actual}.{message}'"
-            self.logger.info(f"✓ 断言通过: {actual} == {expected}")
+            self.logger.info("✓ 断言通过: %s == %s", actual, expected)
         except AssertionError as e:
             self.logger.error(f'x {str(e)}')
             raise
@@ -42,7 +46,7 @@ class AssertHelper:
         '''
         try: 
             assert actual != expected,  f"断言失败: 不应该等于 '{expected}', 但实际为 '{actual}'. {message}"
-            self.logger.info(f"✓ 断言通过: {actual} != {expected}")
+            self.logger.info("✓ 断言通过: %s != %s", actual, expected)
         except AssertionError as e:
             self.logger.error(f"x {str(e)}")
             raise
@@ -57,7 +61,7 @@ class AssertHelper:
         '''
         try:
             assert condition is True,  f"断言失败: 期望为 True, 实际为 {condition}. {message}"
-            self.logger.info(f"✓ 断言通过: 条件为 True")
+            self.logger.info("✓ 断言通过: 条件为 True")
         except AssertionError as e:
             self.logger.error(f"x {str(e)}")
             raise
@@ -72,7 +76,7 @@ class AssertHelper:
         '''
         try:
             assert condition is False, f"断言失败：期望为False，实际为{condition}.{message}"
-            self.logger.info(f"✓ 断言通过: 条件为 False")
+            self.logger.info("✓ 断言通过: 条件为 False")
         except AssertionError as e:
             self.logger.error(f"x {str(e)}")
        
@@ -86,7 +90,7 @@ class AssertHelper:
         """
         try:
             assert substring in text, f"断言失败: '{text}' 不包含 '{substring}'. {message}"
-            self.logger.info(f"✓ 断言通过: '{text}' 包含 '{substring}'")
+            self.logger.info("✓ 断言通过: '%s' 包含 '%s'", text, substring)
         except AssertionError as e:
             self.logger.error(f"✗ {str(e)}")
             raise
@@ -100,7 +104,46 @@ class AssertHelper:
         """
         try:
             assert value, f"断言失败: 值为空. {message}"
-            self.logger.info(f"✓ 断言通过: 值不为空")
+            self.logger.info("✓ 断言通过: 值不为空")
+        except AssertionError as e:
+            self.logger.error(f"✗ {str(e)}")
+            raise
+
+    def assert_within_budget(self, metrics, budget, page_name="", message=""):
+        """
+        断言页面性能指标不超过预算
+        实测值、预算和最近几次的趋势会作为附件写入Allure报告，
+        没有采集到的指标（如单页应用内跳转的导航指标）只记录不判定
+        Args:
+            metrics: collect_performance_metrics()的返回值
+            budget: {指标: 上限毫秒}，来自测试数据的performance_budgets
+            page_name: 页面名称
+            message: 自定义断言失败信息
+        """
+        results = check_budget(metrics, budget)
+        key = f"{current_test_id()}|{page_name}"
+        history = PerformanceHistory()
+        trend = history.trend(key)
+        history.record(key, metrics)
+        for name, result in results.items():
+            result['trend'] = trend.get(name, []) + [result['measured']]
+
+        allure.attach(
+            json.dumps({'page': page_name, 'url': metrics.get('url'), 'metrics': results}, ensure_ascii=False, indent=2),
+            name=f"性能指标-{page_name}",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+        breaches = [
+            f"{name}={result['measured']}ms(预算{result['budget']}ms)"
+            for name, result in results.items() if result['passed'] is False
+        ]
+        try:
+            assert not breaches, f"断言失败: {page_name}性能超出预算 {', '.join(breaches)}. {message}"
+            self.logger.info(
+                "✓ 断言通过: %s性能在预算内 %s", page_name,
+                {name: result['measured'] for name, result in results.items()}
+            )
         except AssertionError as e:
             self.logger.error(f"✗ {str(e)}")
             raise
@@ -0,0 +1,128 @@
+# utils/async_runner.py
+"""
+异步执行工具 - 在同步测试中运行基于playwright.async_api的协程
+同步Playwright在主线程中维护自己的事件循环，异步部分放到独立线程的新事件循环中执行，
+两者互不干扰
+"""
+import asyncio
+import queue
+import threading
+from contextlib import asynccontextmanager
+from utils.browser_pool import launch_options_from_config
+
+
+def run_async(coro):
+    """
+    在独立线程的事件循环中运行协程并等待结果
+    Args:
+        coro: 协程对象
+    Returns:
+        协程的返回值（协程抛出的异常会原样抛出）
+    """
+    outcome = {}
+
+    def runner():
+        try:
+            outcome['result'] = asyncio.run(coro)
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=runner, name="async-playwright")
+    thread.start()
+    thread.join()
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+def run_async_streaming(coro_factory, on_item):
+    """
+    在独立线程中运行协程，并在调用线程中逐个处理协程产生的中间结果
+    适合需要把每条结果实时写入报告（allure、日志）的场景，这些操作只在主线程中执行
+    Args:
+        coro_factory: 接收emit回调、返回协程的函数，协程内调用emit(item)推送结果
+        on_item: 在调用线程中处理每条结果的函数
+    Returns:
+        协程的返回值
+    """
+    items = queue.Queue()
+    finished = object()
+    outcome = {}
+
+    def runner():
+        try:
+            outcome['result'] = asyncio.run(coro_factory(items.put))
+        except BaseException as e:
+            outcome['error'] = e
+        finally:
+            items.put(finished)
+
+    thread = threading.Thread(target=runner, name="async-playwright")
+    thread.start()
+    while True:
+        item = items.get()
+        if item is finished:
+            break
+        on_item(item)
+    thread.join()
+
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+async def new_async_context(browser, config, route_profile=None, **context_options):
+    """
+    按配置创建异步浏览器上下文：视口、默认超时和网络路由
+    共享上下文和每个页面独立的上下文都通过这里创建，保证设置一致
+    Args:
+        browser: Playwright的异步Browser对象
+        config: Config对象
+        route_profile: RouteProfile，为空时不注册路由
+        context_options: 额外传给new_context()的参数，如storage_state
+    Returns:
+        BrowserContext对象
+    """
+    context = await browser.new_context(viewport=config.browser.viewport.as_dict(), **context_options)
+    # config.yaml的timeout作为页面操作和导航的默认超时
+    context.set_default_timeout(config.timeout)
+    if route_profile is not None:
+        try:
+            await route_profile.apply_async(context, config.base_url)
+        except Exception:
+            await context.close()
+            raise
+    return context
+
+
+@asynccontextmanager
+async def async_browser_context(config, route_profile=None, **context_options):
+    """
+    按配置启动异步浏览器并创建上下文，退出时关闭
+    Args:
+        config: Config对象
+        route_profile: RouteProfile，为空时不注册路由
+        context_options: 额外传给new_context()的参数，如storage_state
+    """
+    # 首次使用时才导入playwright.async_api
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser_type = config.browser.type
+        if browser_type == 'chromium':
+            launcher = p.chromium
+        elif browser_type == 'firefox':
+            launcher = p.firefox
+        else:
+            launcher = p.webkit
+
+        browser = await launcher.launch(**launch_options_from_config(config))
+        try:
+            context = await new_async_context(browser, config, route_profile, **context_options)
+            try:
+                yield context
+            finally:
+                await context.close()
+        finally:
+            await browser.close()
@@ -0,0 +1,208 @@
+# utils/auth_state.py
+"""
+登录状态缓存 - 缓存Playwright的storage state（cookies + localStorage）
+每个会话（或xdist worker）只通过UI真正登录一次，之后的用例直接注入登录状态
+"""
+import hashlib
+import json
+import os
+import time
+from utils.logger import Logger
+from utils.worker import worker_path
+
+
+class AuthStateCache:
+    """
+    登录状态缓存
+    以 base_url + username 为key，内存和磁盘两级缓存；
+    过期、收到401或被重定向回登录页时自动失效
+    """
+
+    def __init__(self, cache_dir="reports/.auth", ttl=3600):
+        """
+        初始化登录状态缓存
+        Args:
+            cache_dir: 磁盘缓存目录
+            ttl: 登录状态有效期（秒），0表示只依赖cookie自身的过期时间
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.logger = Logger().get_logger()
+        self._memory = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        根据config.yaml的auth配置创建缓存，并行执行时每个worker使用独立的缓存目录
+        Args:
+            config: Config对象
+        Returns:
+            AuthStateCache实例
+        """
+        auth_config = config.get('auth', {})
+        return cls(
+            cache_dir=worker_path(auth_config.get('cache_dir', "reports/.auth")),
+            ttl=auth_config.get('ttl', 3600)
+        )
+
+    @staticmethod
+    def _key(base_url, username):
+        """生成缓存key"""
+        raw = f"{base_url.rstrip('/')}|{username}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+    def _path(self, key):
+        """缓存文件路径"""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _is_expired(self, entry):
+        """检查缓存条目是否过期"""
+        now = time.time()
+        if self.ttl and now - entry['created_at'] > self.ttl:
+            return True
+        # cookie自带过期时间（-1表示会话cookie）
+        for cookie in entry['storage_state'].get('cookies', []):
+            expires = cookie.get('expires', -1)
+            if expires and expires > 0 and expires < now:
+                return True
+        return False
+
+    def get(self, base_url, username):
+        """
+        读取有效的登录状态
+        Args:
+            base_url: 基础URL
+            username: 用户名
+        Returns:
+            storage state字典，不存在或已过期时返回None
+        """
+        key = self._key(base_url, username)
+        entry = self._memory.get(key)
+
+        if entry is None:
+            path = self._path(key)
+            if os.path.exists(path):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        entry = json.load(f)
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"登录状态缓存读取失败: {str(e)}")
+                    entry = None
+
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            self.logger.info(f"登录状态已过期: {username}")
+            self.invalidate(base_url, username)
+            return None
+
+        self._memory[key] = entry
+        return entry['storage_state']
+
+    def save(self, base_url, username, storage_state):
+        """
+        保存登录状态到内存和磁盘
+        Args:
+            base_url: 基础URL
+            username: 用户名
+            storage_state: context.storage_state()的返回值
+        """
+        key = self._key(base_url, username)
+        entry = {
+            'base_url': base_url,
+            'username': username,
+            'created_at': time.time(),
+            'storage_state': storage_state
+        }
+        self._memory[key] = entry
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self.logger.info(f"登录状态已缓存: {username}")
+
+    def invalidate(self, base_url, username):
+        """
+        使登录状态失效
+        Args:
+            base_url: 基础URL
+            username: 用户名
+        """
+        key = self._key(base_url, username)
+        self._memory.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+        self.logger.info(f"登录状态已失效: {username}")
+
+    def clear(self):
+        """清空内存和磁盘中的所有登录状态，下次使用时重新通过UI登录"""
+        self._memory.clear()
+        if os.path.isdir(self.cache_dir):
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.endswith(".json"):
+                    os.remove(os.path.join(self.cache_dir, file_name))
+        self.logger.info("登录状态缓存已清空")
+
+    def get_or_login(self, browser, base_url, username, password, context_factory):
+        """
+        获取登录状态，缓存无效时通过UI登录一次并缓存
+        Args:
+            browser: Playwright的Browser对象
+            base_url: 基础URL
+            username: 用户名
+            password: 密码
+            context_factory: 创建干净上下文的函数，接收browser返回BrowserContext
+        Returns:
+            storage state字典
+        """
+        storage_state = self.get(base_url, username)
+        if storage_state is not None:
+            return storage_state
+
+        # 延迟导入，避免utils依赖pages造成循环引用
+        from pages.login_page import LoginPage
+
+        self.logger.info(f"登录状态缓存未命中，执行UI登录: {username}")
+        context = context_factory(browser)
+        try:
+            page = context.new_page()
+            login_page = LoginPage(page, base_url)
+            login_page.goto_login_page()
+            login_page.login(username, password)
+            login_page.wait_for_login_complete()
+            storage_state = context.storage_state()
+        finally:
+            context.close()
+
+        self.save(base_url, username, storage_state)
+        return storage_state
+
+    def watch(self, page, base_url, username):
+        """
+        监听页面，检测到401响应或被重定向回登录页时使缓存失效
+        当前用例仍会失败，但后续用例会重新登录
+        Args:
+            page: Playwright的Page对象
+            base_url: 基础URL
+            username: 用户名
+        """
+        base_url = base_url.rstrip('/')
+        login_url = f"{base_url}/login"
+
+        def on_response(response):
+            if response.status == 401 and response.url.startswith(base_url):
+                self.logger.warning(f"收到401响应，登录状态失效: {response.url}")
+                self.invalidate(base_url, username)
+
+        def on_navigated(frame):
+            if frame == page.main_frame and frame.url.startswith(login_url):
+                self.logger.warning("页面被重定向到登录页，登录状态失效")
+                self.invalidate(base_url, username)
+
+        page.on("response", on_response)
+        page.on("framenavigated", on_navigated)
@@ -0,0 +1,179 @@
+# utils/browser_pool.py
+"""
+浏览器进程池 - 会话级别复用已启动的浏览器进程
+每个测试仍然获得全新的BrowserContext和Page，隔离性不变，
+只是省去了每个用例重复启动浏览器进程的开销
+"""
+from utils.logger import Logger
+
+
+def launch_options_from_config(config):
+    """
+    根据配置生成浏览器启动参数（同步与异步API通用）
+    Args:
+        config: Config对象
+    Returns:
+        传给browser_type.launch()的参数字典
+    """
+    return {
+        'headless': config.headless,
+        'slow_mo': config.browser.slow_mo
+    }
+
+
+class _PooledBrowser:
+    """池中的单个浏览器槽位"""
+
+    __slots__ = ("browser", "uses", "holders")
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.uses = 0
+        # 当前借用该浏览器的测试数（池满时多个测试共享同一个进程）
+        self.holders = 0
+
+    @property
+    def in_use(self):
+        """是否有测试正在使用"""
+        return self.holders > 0
+
+
+class BrowserPool:
+    """
+    浏览器进程池
+    pytest会话（或xdist的每个worker进程）内只创建一个实例，
+    按需启动浏览器，达到最大复用次数或进程崩溃后自动重启
+    """
+
+    def __init__(self, browser_type="chromium", size=1, max_uses=50, launch_options=None):
+        """
+        初始化浏览器池
+        Args:
+            browser_type: 浏览器类型 chromium/firefox/webkit
+            size: 池中最多常驻的浏览器数量
+            max_uses: 单个浏览器最多被借出的次数，0或None表示不限制
+            launch_options: 传给browser_type.launch()的参数
+        """
+        self.browser_type = browser_type
+        self.size = max(1, int(size or 1))
+        self.max_uses = max_uses or 0
+        self.launch_options = launch_options or {}
+        self.logger = Logger().get_logger()
+        self._playwright = None
+        self._slots = []
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        根据config.yaml的配置创建浏览器池
+        Args:
+            config: Config对象
+        Returns:
+            BrowserPool实例
+        """
+        return cls(
+            browser_type=config.browser.type,
+            size=config.browser.pool.size,
+            max_uses=config.browser.pool.max_uses,
+            launch_options=launch_options_from_config(config)
+        )
+
+    def _launch(self):
+        """启动一个新的浏览器进程"""
+        if self._playwright is None:
+            # 首次启动浏览器时才导入playwright，收集用例时不加载
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+
+        if self.browser_type == 'chromium':
+            launcher = self._playwright.chromium
+        elif self.browser_type == 'firefox':
+            launcher = self._playwright.firefox
+        else:
+            launcher = self._playwright.webkit
+
+        self.logger.info(f"启动浏览器: {self.browser_type}")
+        return launcher.launch(**self.launch_options)
+
+    def _is_healthy(self, slot):
+        """检查槽位中的浏览器是否还能继续使用"""
+        if not slot.browser.is_connected():
+            self.logger.warning("浏览器进程已断开，准备重启")
+            return False
+        if self.max_uses and slot.uses >= self.max_uses:
+            self.logger.info(f"浏览器已复用 {slot.uses} 次，准备重启")
+            return False
+        return True
+
+    def _close_browser(self, browser):
+        """关闭浏览器进程，失败时只记录日志"""
+        try:
+            if browser.is_connected():
+                browser.close()
+        except Exception as e:
+            self.logger.warning(f"关闭浏览器失败: {str(e)}")
+
+    def _recycle(self, slot):
+        """关闭旧浏览器并在同一槽位启动新浏览器（只用于空闲槽位）"""
+        self._close_browser(slot.browser)
+        slot.browser = self._launch()
+        slot.uses = 0
+
+    def acquire(self):
+        """
+        从池中借出一个浏览器
+        优先使用空闲的浏览器（需要时先重启）；池未满时启动新浏览器；
+        池已满且全部被占用时，与使用次数最少的测试共享同一个进程（上下文依然隔离）。
+        其他测试仍在使用的浏览器不会被重启，达到复用次数后在空闲时再重启；
+        被占用的浏览器全部崩溃时临时多启动一个，归还后关闭
+        Returns:
+            Playwright的Browser对象
+        """
+        slot = next((s for s in self._slots if not s.in_use), None)
+        if slot is not None and not self._is_healthy(slot):
+            self._recycle(slot)
+        if slot is None and len(self._slots) < self.size:
+            slot = _PooledBrowser(self._launch())
+            self._slots.append(slot)
+        if slot is None:
+            connected = [s for s in self._slots if s.browser.is_connected()]
+            if connected:
+                slot = min(connected, key=lambda s: s.uses)
+            else:
+                self.logger.warning("池中浏览器均被占用且已崩溃，临时启动一个新浏览器")
+                slot = _PooledBrowser(self._launch())
+                self._slots.append(slot)
+
+        slot.uses += 1
+        slot.holders += 1
+        return slot.browser
+
+    def release(self, browser):
+        """
+        归还浏览器，崩溃的浏览器会在下次借出前重启
+        Args:
+            browser: acquire()返回的Browser对象
+        """
+        for slot in self._slots:
+            if slot.browser is browser:
+                slot.holders = max(0, slot.holders - 1)
+                if slot.in_use:
+                    return
+                # 超出池大小的临时浏览器空闲后关闭
+                if len(self._slots) > self.size:
+                    self._slots.remove(slot)
+                    self._close_browser(browser)
+                elif not browser.is_connected():
+                    self.logger.warning("归还的浏览器已崩溃，将在下次使用时重启")
+                return
+
+    def close(self):
+        """关闭池中所有浏览器并停止Playwright"""
+        for slot in self._slots:
+            self._close_browser(slot.browser)
+        self._slots = []
+
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+        self.logger.info("浏览器池已关闭")
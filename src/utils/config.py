@@ -0,0 +1,288 @@
+# utils/config.py
+"""
+配置对象 - config.yaml解析为不可变的Config，每个进程只加载一次
+覆盖顺序（后者优先）：config.yaml < environments中选择的环境 < profiles中选择的执行配置
+< AUTOTEST_环境变量 < 命令行 --set
+常用配置（base_url、timeout、headless、browser）为类型化字段；
+其余配置段由各工具的from_config通过config.get(段名)读取，均为只读视图
+"""
+import os
+import warnings
+from dataclasses import asdict, dataclass, field, replace
+from types import MappingProxyType
+import yaml
+from utils.data_store import YAML_LOADER, freeze
+
+# 默认配置文件
+DEFAULT_CONFIG_FILE = "config/config.yaml"
+
+# 环境变量：AUTOTEST_ENV选择环境，AUTOTEST_PROFILE选择执行配置，AUTOTEST_<段>__<项>=值 覆盖配置（值按YAML解析）
+ENV_PREFIX = "AUTOTEST_"
+ENV_SELECTOR = "AUTOTEST_ENV"
+PROFILE_SELECTOR = "AUTOTEST_PROFILE"
+
+# 判断是否在CI中运行的环境变量（GitHub Actions、GitLab CI、Jenkins等）
+CI_ENV_VARS = ("CI", "JENKINS_URL", "BUILD_ID", "GITLAB_CI", "GITHUB_ACTIONS")
+
+
+class UnknownConfigWarning(UserWarning):
+    """AUTOTEST_环境变量不对应config.yaml中的任何配置段"""
+
+
+@dataclass(frozen=True, slots=True)
+class Viewport:
+    """浏览器视口"""
+    width: int = 1280
+    height: int = 720
+
+    def as_dict(self):
+        """传给new_context(viewport=...)的参数"""
+        return {'width': self.width, 'height': self.height}
+
+
+@dataclass(frozen=True, slots=True)
+class PoolSettings:
+    """浏览器进程池"""
+    size: int = 1
+    max_uses: int = 50
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserSettings:
+    """浏览器配置"""
+    type: str = "chromium"
+    viewport: Viewport = field(default_factory=Viewport)
+    slow_mo: int = 0
+    pool: PoolSettings = field(default_factory=PoolSettings)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    测试配置（不可变）
+    修改配置请使用replace生成新对象，如 config.replace(base_url=...)
+    """
+    base_url: str
+    timeout: int = 30000
+    headless: bool = True
+    browser: BrowserSettings = field(default_factory=BrowserSettings)
+    environment: str = ""
+    profile: str = ""
+    raw: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_dict(cls, data, environment="", profile=""):
+        """
+        由配置字典创建
+        Args:
+            data: 合并覆盖后的配置字典
+            environment: 使用的环境名称
+            profile: 使用的执行配置名称
+        Returns:
+            Config实例
+        """
+        browser = data.get('browser') or {}
+        viewport = browser.get('viewport') or {}
+        pool = browser.get('pool') or {}
+        return cls(
+            base_url=str(data['base_url']).rstrip('/'),
+            timeout=int(data.get('timeout', 30000)),
+            headless=_to_bool(data.get('headless', True)),
+            browser=BrowserSettings(
+                type=browser.get('type', "chromium"),
+                viewport=Viewport(int(viewport.get('width', 1280)), int(viewport.get('height', 720))),
+                slow_mo=int(browser.get('slow_mo') or 0),
+                pool=PoolSettings(int(pool.get('size', 1)), int(pool.get('max_uses', 50)))
+            ),
+            environment=environment or "",
+            profile=profile or "",
+            raw=freeze(data)
+        )
+
+    def get(self, name, default=None):
+        """
+        读取配置段（只读视图），供各工具的from_config使用
+        Args:
+            name: 配置段名称，如tracing
+            default: 不存在时的返回值
+        Returns:
+            配置段
+        """
+        value = self.raw.get(name)
+        return default if value is None else value
+
+    def replace(self, **changes):
+        """
+        生成修改了部分字段的新配置
+        类型化字段（base_url、timeout、headless、browser）的修改同步写入raw，
+        config.get(...)与字段读取的值保持一致
+        Args:
+            changes: 需要修改的字段
+        Returns:
+            新的Config实例
+        """
+        overlay = {
+            name: asdict(value) if name == 'browser' else value
+            for name, value in changes.items() if name in _TYPED_FIELDS
+        }
+        if overlay and 'raw' not in changes:
+            changes['raw'] = freeze(deep_merge(_thaw(self.raw), overlay))
+        return replace(self, **changes)
+
+
+# 同时保存在raw中的类型化字段
+_TYPED_FIELDS = ('base_url', 'timeout', 'headless', 'browser')
+
+
+def _thaw(value):
+    """只读视图转换回可修改的dict/list"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _to_bool(value):
+    """把配置值转换为布尔值（环境变量中的"false"/"0"视为False）"""
+    if isinstance(value, str):
+        return value.strip().lower() not in ('', '0', 'false', 'no', 'off')
+    return bool(value)
+
+
+def deep_merge(base, overlay):
+    """
+    递归合并配置，overlay中的值覆盖base
+    Args:
+        base: 基础配置字典
+        overlay: 覆盖配置字典
+    Returns:
+        新的配置字典
+    """
+    merged = dict(base)
+    for key, value in (overlay or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _set_path(data, path, value):
+    """按路径（如 browser.slow_mo）生成覆盖字典"""
+    overlay = value
+    for key in reversed(path):
+        overlay = {key: overlay}
+    return deep_merge(data, overlay)
+
+
+def parse_assignment(text):
+    """
+    解析覆盖项
+    Args:
+        text: "browser.slow_mo=0"，值按YAML解析（0为整数，true为布尔值）
+    Returns:
+        (路径列表, 值)
+    """
+    key, separator, value = text.partition('=')
+    if not separator or not key.strip():
+        raise ValueError(f"配置覆盖项格式应为 段.项=值，如 browser.slow_mo=0: {text}")
+    return [part for part in key.strip().split('.') if part], yaml.safe_load(value)
+
+
+def env_overrides(environ=None, sections=None):
+    """
+    从环境变量读取覆盖项
+    AUTOTEST_HEADLESS=true、AUTOTEST_BROWSER__SLOW_MO=0（双下划线表示下一级）
+    Args:
+        environ: 环境变量字典，默认os.environ
+        sections: config.yaml中已有的配置段（顶层key），指定时只接受这些段的覆盖，
+                  其他AUTOTEST_变量（如AUTOTEST_TOKEN）忽略并给出警告
+    Returns:
+        [(路径列表, 值)]
+    """
+    environ = os.environ if environ is None else environ
+    known = None if sections is None else set(sections)
+    overrides = []
+    for name, value in sorted(environ.items()):
+        if not name.startswith(ENV_PREFIX) or name in (ENV_SELECTOR, PROFILE_SELECTOR):
+            continue
+        path = [part.lower() for part in name[len(ENV_PREFIX):].split('__') if part]
+        if not path:
+            continue
+        if known is not None and path[0] not in known:
+            warnings.warn(
+                f"环境变量{name}不对应config.yaml中的配置段（{path[0]}），已忽略", UnknownConfigWarning, stacklevel=2
+            )
+            continue
+        overrides.append((path, yaml.safe_load(value)))
+    return overrides
+
+
+def _select_overlay(data, section, name, kind):
+    """取出config.yaml中指定段（environments/profiles）里名为name的覆盖配置"""
+    overlays = data.pop(section, None) or {}
+    if not name:
+        return {}
+    if name not in overlays:
+        raise ValueError(f"未定义的{kind}: {name}，可选: {', '.join(overlays)}")
+    return overlays[name] or {}
+
+
+def load_config(path=DEFAULT_CONFIG_FILE, environment=None, profile=None, overrides=(), environ=None):
+    """
+    加载配置并按顺序应用覆盖
+    Args:
+        path: 配置文件
+        environment: 环境名称（config.yaml的environments中定义），默认取AUTOTEST_ENV
+        profile: 执行配置名称（config.yaml的profiles中定义，如debug/ci/perf），默认取AUTOTEST_PROFILE
+        overrides: 命令行覆盖项，如["browser.slow_mo=0"]
+        environ: 环境变量字典，默认os.environ
+    Returns:
+        Config实例
+    """
+    environ = os.environ if environ is None else environ
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=YAML_LOADER) or {}
+
+    environment = environment or environ.get(ENV_SELECTOR) or data.get('environment') or ""
+    profile = profile or environ.get(PROFILE_SELECTOR) or data.get('profile') or ""
+    environment_overlay = _select_overlay(data, 'environments', environment, "环境")
+    profile_overlay = _select_overlay(data, 'profiles', profile, "执行配置")
+    data = deep_merge(deep_merge(data, environment_overlay), profile_overlay)
+
+    for key_path, value in env_overrides(environ, sections=data):
+        data = _set_path(data, key_path, value)
+    for assignment in overrides or ():
+        data = _set_path(data, *parse_assignment(assignment))
+    return Config.from_dict(data, environment, profile)
+
+
+def is_ci(environ=None):
+    """
+    是否在CI中运行
+    Args:
+        environ: 环境变量字典，默认os.environ
+    Returns:
+        是否设置了常见CI系统的环境变量
+    """
+    environ = os.environ if environ is None else environ
+    return any(_to_bool(environ.get(name, "")) for name in CI_ENV_VARS)
+
+
+def slow_mo_warning(config, environ=None):
+    """
+    检查无头CI执行中是否仍设置了slow_mo（每个页面操作都会被人为放慢）
+    Args:
+        config: Config对象
+        environ: 环境变量字典，默认os.environ
+    Returns:
+        警告信息，没有问题时返回None
+    """
+    in_ci = is_ci(environ) or 'ci' in (config.profile, config.environment)
+    if config.headless and config.browser.slow_mo and in_ci:
+        return (
+            f"无头CI执行中browser.slow_mo={config.browser.slow_mo}，每个页面操作都会额外等待"
+            f"{config.browser.slow_mo}毫秒；请使用 --profile ci 或 --set browser.slow_mo=0"
+        )
+    return None
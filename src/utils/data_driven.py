@@ -0,0 +1,162 @@
+# utils/data_driven.py
+"""
+数据驱动 - 收集用例时把test_data中的数据集展开为参数化用例
+用例标记 @pytest.mark.datafile("文件名", key=..., argname=...) 后，由conftest的pytest_generate_tests展开；
+每条数据有稳定的id（不随顺序变化），可按标签筛选，也可按id分片到多台机器执行
+"""
+import hashlib
+import json
+import os
+import zlib
+from collections.abc import Mapping
+from typing import NamedTuple
+from utils.data_store import DataStore
+
+# 逐行流式读取的数据格式
+STREAM_EXTENSIONS = ('.csv', '.jsonl')
+
+# 数据中表示id和标签的字段
+ID_FIELDS = ('id', 'name')
+TAGS_FIELD = 'tags'
+
+
+class DataCase(NamedTuple):
+    '''
+    一条参数化数据
+    id在数据不变时保持稳定，用作pytest用例id
+    '''
+    id: str
+    values: object
+    tags: tuple = ()
+
+
+def _plain(value):
+    """只读视图转换为可序列化的普通结构"""
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_plain(item) for item in value]
+    return value
+
+
+def case_id(values, index=None):
+    """
+    生成数据的稳定id
+    字典优先使用id/name字段，标量使用其本身，其余使用内容摘要（与在数据集中的位置无关）
+    Args:
+        values: 一条数据
+        index: 在数据集中的位置（仅用于无法序列化的数据）
+    Returns:
+        id字符串
+    """
+    if isinstance(values, Mapping):
+        for field in ID_FIELDS:
+            if values.get(field) not in (None, ''):
+                return str(values[field])
+    elif isinstance(values, (str, int, float, bool)):
+        return str(values)
+    try:
+        content = json.dumps(_plain(values), sort_keys=True, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return f"case{index}"
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()[:10]
+
+
+def _tags(values):
+    """数据中的标签"""
+    if isinstance(values, Mapping):
+        tags = values.get(TAGS_FIELD) or ()
+        return (tags,) if isinstance(tags, str) else tuple(tags)
+    return ()
+
+
+def iter_data_cases(file_name, key=None):
+    """
+    读取数据集
+    CSV/JSON Lines逐行读取；YAML按schemas.yaml校验后读取，key指定数据集所在的字段，
+    数据集为字典时每个key是一条命名数据（key即id），为列表时每个元素是一条数据
+    Args:
+        file_name: test_data下的数据文件名
+        key: YAML中数据集所在的字段
+    Returns:
+        DataCase生成器
+    """
+    store = DataStore()
+    if os.path.splitext(file_name)[1].lower() in STREAM_EXTENSIONS:
+        for index, values in enumerate(store.iter_cases(file_name)):
+            yield DataCase(case_id(values, index), values, _tags(values))
+        return
+
+    data = store.load(file_name)
+    if key is not None:
+        data = data[key]
+    if isinstance(data, Mapping):
+        for name, values in data.items():
+            yield DataCase(str(name), values, _tags(values))
+    else:
+        for index, values in enumerate(data):
+            yield DataCase(case_id(values, index), values, _tags(values))
+
+
+def parse_shard(text):
+    """
+    解析分片参数
+    Args:
+        text: 如"1/4"，表示共4片中的第1片（从1开始）
+    Returns:
+        (片序号（从0开始）, 总片数)
+    """
+    try:
+        index, total = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise ValueError(f"分片参数格式应为 序号/总数，如 1/4: {text}") from None
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"分片序号应在1到{total}之间: {text}")
+    return index - 1, total
+
+
+def in_shard(stable_id, shard):
+    """
+    按稳定id判断数据是否属于当前分片
+    Args:
+        stable_id: 用例函数与数据id组成的稳定id
+        shard: (片序号, 总片数)，为None时不分片
+    Returns:
+        是否属于当前分片
+    """
+    if shard is None:
+        return True
+    index, total = shard
+    return zlib.crc32(stable_id.encode('utf-8')) % total == index
+
+
+def select_cases(cases, tags=None, shard=None, prefix=""):
+    """
+    按标签和分片逐条筛选数据，不把整个数据集读入内存
+    数据集中没有任何数据定义标签时（如序号列表）不按标签筛选：指定了标签时，
+    第一条带标签的数据之前的无标签数据暂存在内存中，直到确定数据集是否定义了标签
+    （带标签的数据集中这部分数据随即丢弃；完全没有标签的数据集在结束时全部返回）
+    Args:
+        cases: DataCase可迭代对象
+        tags: 需要的标签，命中任意一个即保留，为空时不筛选
+        shard: (片序号, 总片数)
+        prefix: 稳定id前缀（用例函数名），使同一数据在不同用例中分散到不同分片
+    Returns:
+        DataCase生成器
+    """
+    wanted = set(tags or ())
+    pending = []
+    tagged = False
+    for case in cases:
+        if not in_shard(f"{prefix}[{case.id}]", shard):
+            continue
+        if not wanted:
+            yield case
+        elif case.tags:
+            tagged = True
+            pending.clear()
+            if wanted & set(case.tags):
+                yield case
+        elif not tagged:
+            pending.append(case)
+    yield from pending
@@ -0,0 +1,239 @@
+# utils/data_store.py
+"""
+测试数据仓库 - 会话级缓存test_data下的数据文件
+每个文件只解析一次（有libyaml时使用C实现的CSafeLoader），按test_data/schemas.yaml校验结构，
+返回只读视图；文件修改时间变化后自动重新加载；大数据集可逐条流式读取
+"""
+import csv
+import json
+import os
+import threading
+from types import MappingProxyType
+import yaml
+
+# 优先使用libyaml的C加速解析器
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# 默认数据目录与结构定义文件
+DEFAULT_DATA_DIR = "test_data"
+SCHEMA_FILE = "schemas.yaml"
+
+# 结构定义中的类型名称
+_TYPES = {
+    'str': str,
+    'int': int,
+    'float': (int, float),
+    'bool': bool,
+    'list': (list, tuple),
+    'dict': dict,
+    'any': object
+}
+
+
+class DataSchemaError(ValueError):
+    """测试数据不符合结构定义"""
+
+
+def freeze(value):
+    """
+    转换为只读结构：dict转为MappingProxyType，list转为tuple
+    Args:
+        value: 解析得到的数据
+    Returns:
+        只读数据
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def validate(data, schema, path=""):
+    """
+    按结构定义校验数据
+    结构定义为YAML：类型名（str/int/float/bool/list/dict/any）、嵌套字典或单元素列表（列表元素的结构）；
+    字典的key以?结尾表示可选，key为*表示匹配其余所有key
+    Args:
+        data: 待校验数据
+        schema: 结构定义
+        path: 当前位置（用于错误信息）
+    Raises:
+        DataSchemaError: 不符合结构定义
+    """
+    where = path or "<根>"
+    if isinstance(schema, str):
+        expected = _TYPES.get(schema)
+        if expected is None:
+            raise DataSchemaError(f"{where}: 未知的类型 {schema}")
+        # bool是int的子类，int/float字段不接受true/false
+        if not isinstance(data, expected) or (schema in ('int', 'float') and isinstance(data, bool)):
+            raise DataSchemaError(f"{where}: 应为{schema}，实际为{type(data).__name__}")
+        return
+    if isinstance(schema, list):
+        if not isinstance(data, list):
+            raise DataSchemaError(f"{where}: 应为列表，实际为{type(data).__name__}")
+        for index, item in enumerate(data):
+            validate(item, schema[0], f"{path}[{index}]")
+        return
+    if not isinstance(data, dict):
+        raise DataSchemaError(f"{where}: 应为字典，实际为{type(data).__name__}")
+    declared = set()
+    for key, sub_schema in schema.items():
+        if key == '*':
+            continue
+        name = key.rstrip('?')
+        declared.add(name)
+        if name in data:
+            validate(data[name], sub_schema, f"{path}.{name}" if path else name)
+        elif not key.endswith('?'):
+            raise DataSchemaError(f"{where}: 缺少字段 {name}")
+    if '*' in schema:
+        for name, item in data.items():
+            if name not in declared:
+                validate(item, schema['*'], f"{path}.{name}" if path else name)
+
+
+class DataStore:
+    """
+    测试数据仓库（单例模式）
+    load返回的数据为只读视图，多个用例共享同一份解析结果
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """单例模式实现"""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """初始化数据仓库"""
+        if self._initialized:
+            return
+        self._initialized = True
+        self.data_dir = DEFAULT_DATA_DIR
+        self._cache = {}
+        # 已通过校验的文件：{文件名: (数据文件签名, 结构定义文件签名)}
+        self._validated = {}
+        # 可重入：load持有锁时还会调用_read和schema
+        self._lock = threading.RLock()
+
+    def _path(self, file_name):
+        """数据文件路径"""
+        return os.path.join(self.data_dir, file_name)
+
+    def _signature(self, file_name):
+        """
+        文件签名（修改时间和大小）
+        Args:
+            file_name: 数据文件名
+        Returns:
+            签名，文件不存在时返回None
+        """
+        try:
+            stat = os.stat(self._path(file_name))
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read(self, file_name):
+        """
+        读取并解析文件（检查修改时间，未变化时返回缓存）
+        Args:
+            file_name: 数据文件名
+        Returns:
+            (文件签名, 解析得到的原始数据, 只读视图)
+        """
+        path = self._path(file_name)
+        with self._lock:
+            signature = self._signature(file_name)
+            if signature is None:
+                raise FileNotFoundError(f"数据文件不存在: {path}")
+            cached = self._cache.get(file_name)
+            if cached is not None and cached[0] == signature:
+                return cached
+            with open(path, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=YAML_LOADER)
+            cached = (signature, data, freeze(data))
+            self._cache[file_name] = cached
+        return cached
+
+    def schema(self, file_name):
+        """
+        获取数据文件的结构定义
+        Args:
+            file_name: 数据文件名
+        Returns:
+            结构定义，未声明时返回None
+        """
+        if file_name == SCHEMA_FILE or not os.path.exists(self._path(SCHEMA_FILE)):
+            return None
+        return (self._read(SCHEMA_FILE)[1] or {}).get(file_name)
+
+    def load(self, file_name):
+        """
+        加载数据文件（每个文件只解析和校验一次，文件修改后重新加载）
+        Args:
+            file_name: 数据文件名
+        Returns:
+            只读数据（MappingProxyType/tuple）
+        Raises:
+            DataSchemaError: 不符合test_data/schemas.yaml中的结构定义
+        """
+        # 读取与校验在同一把锁内完成，并发加载同一文件时只解析和校验一次
+        with self._lock:
+            signature, data, view = self._read(file_name)
+            # 结构定义文件修改后也重新校验
+            key = (signature, None if file_name == SCHEMA_FILE else self._signature(SCHEMA_FILE))
+            if self._validated.get(file_name) != key:
+                schema = self.schema(file_name)
+                if schema is not None:
+                    try:
+                        validate(data, schema)
+                    except DataSchemaError as e:
+                        # 校验失败的数据不缓存，修正文件后可重新加载
+                        self._cache.pop(file_name, None)
+                        self._validated.pop(file_name, None)
+                        raise DataSchemaError(f"{file_name}: {e}") from None
+                self._validated[file_name] = key
+        return view
+
+    def iter_cases(self, file_name, key=None):
+        """
+        逐条读取大数据集，不把整个文件保留在内存中
+        支持CSV（每行一条，按表头生成字典）、JSON Lines（每行一条）、
+        多文档YAML（---分隔，每个文档一条或一个列表）；普通YAML按key取列表
+        Args:
+            file_name: 数据文件名
+            key: YAML中数据集所在的key，为空时整个文档即为数据集
+        Returns:
+            只读数据的生成器
+        """
+        path = self._path(file_name)
+        extension = os.path.splitext(file_name)[1].lower()
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if extension == '.csv':
+                for row in csv.DictReader(f):
+                    yield freeze(row)
+            elif extension == '.jsonl':
+                for line in f:
+                    if line.strip():
+                        yield freeze(json.loads(line))
+            else:
+                for document in yaml.load_all(f, Loader=YAML_LOADER):
+                    if key is not None:
+                        document = (document or {}).get(key, ())
+                    if isinstance(document, list):
+                        for item in document:
+                            yield freeze(item)
+                    elif document is not None:
+                        yield freeze(document)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._cache.clear()
+            self._validated.clear()
@@ -0,0 +1,150 @@
+# utils/dom_extract.py
+"""
+页面内批量提取工具 - 一次evaluate调用取回多个字段
+将页面对象中的选择器常量（CSS、text=文本、text=/正则/）转换为页面内可执行的描述，
+在浏览器中按与Playwright定位器一致的规则查找元素，避免逐字段的IPC往返
+"""
+import re
+
+# text=/正则/标志
+_REGEX_SELECTOR = re.compile(r'^text=/(.*)/([a-z]*)$', re.S)
+
+# 字段模式：取文本 / 判断是否存在 / 取元素所在（或包含的）链接地址
+MODE_TEXT = 'text'
+MODE_EXISTS = 'exists'
+MODE_HREF = 'href'
+
+# 已转换的字段描述，页面对象的字段常量不变，每组只需转换一次
+_SPEC_CACHE = {}
+
+
+def selector_to_spec(selector, mode=MODE_TEXT):
+    """
+    将选择器转换为页面内查找描述
+    Args:
+        selector: 页面对象中的选择器常量
+        mode: text取第一个匹配元素的innerText，exists判断是否存在匹配元素，
+              href取第一个匹配元素所在或包含的链接地址
+    Returns:
+        查找描述字典
+    """
+    match = _REGEX_SELECTOR.match(selector)
+    if match:
+        return {'kind': 'regex', 'value': match.group(1), 'flags': match.group(2), 'mode': mode}
+    if selector.startswith('text='):
+        return {'kind': 'text', 'value': selector[len('text='):].strip('"\''), 'mode': mode}
+    if '=' in selector.split('[')[0] or selector.startswith(('//', 'xpath')):
+        raise ValueError(f"不支持页面内批量提取的选择器: {selector}")
+    return {'kind': 'css', 'value': selector, 'mode': mode}
+
+
+def build_field_specs(fields):
+    """
+    批量转换字段选择器
+    Args:
+        fields: {字段名: 选择器} 或 {字段名: (选择器, 模式)}
+    Returns:
+        {字段名: 查找描述}（同一组字段只转换一次，返回的字典不应修改）
+    """
+    key = tuple(fields.items())
+    specs = _SPEC_CACHE.get(key)
+    if specs is None:
+        specs = {}
+        for name, selector in fields.items():
+            if isinstance(selector, tuple):
+                specs[name] = selector_to_spec(*selector)
+            else:
+                specs[name] = selector_to_spec(selector)
+        _SPEC_CACHE[key] = specs
+    return specs
+
+
+# 页面内执行的提取脚本
+# 文本匹配规则与Playwright的text引擎一致：空白归一化后匹配，返回自身匹配但子元素不匹配的最小元素
+EXTRACT_SCRIPT = '''([rootSelector, index, specs]) => {
+    const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'HEAD', 'TEMPLATE']);
+    const normalize = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+    const matchers = {};
+    for (const [name, spec] of Object.entries(specs)) {
+        if (spec.kind === 'regex') {
+            const re = new RegExp(spec.value, spec.flags);
+            matchers[name] = (text) => { re.lastIndex = 0; return re.test(text); };
+        } else if (spec.kind === 'text') {
+            const needle = normalize(spec.value).toLowerCase();
+            matchers[name] = (text) => text.toLowerCase().includes(needle);
+        }
+    }
+    const findByText = (scope, matcher) => {
+        const matches = (el) => !SKIP.has(el.nodeName) && matcher(normalize(el.textContent));
+        const walker = document.createTreeWalker(scope, NodeFilter.SHOW_ELEMENT, {
+            acceptNode: (el) => matches(el) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT
+        });
+        let el;
+        while ((el = walker.nextNode())) {
+            if (!Array.from(el.children).some(matches)) {
+                return el;
+            }
+        }
+        return null;
+    };
+    const find = (scope, name, spec) => spec.kind === 'css'
+        ? scope.querySelector(spec.value)
+        : findByText(scope, matchers[name]);
+    const link = (el) => {
+        const anchor = el.closest('a[href]') || el.querySelector('a[href]');
+        return anchor === null ? null : anchor.href;
+    };
+    const extract = (scope) => {
+        const row = {};
+        for (const [name, spec] of Object.entries(specs)) {
+            const el = find(scope, name, spec);
+            if (spec.mode === 'exists') {
+                row[name] = el !== null;
+            } else if (el === null) {
+                row[name] = null;
+            } else {
+                row[name] = spec.mode === 'href' ? link(el) : el.innerText;
+            }
+        }
+        return row;
+    };
+    const roots = rootSelector ? Array.from(document.querySelectorAll(rootSelector)) : [document.body];
+    if (index === null) {
+        return {count: roots.length, rows: roots.map(extract)};
+    }
+    return {count: roots.length, rows: index < roots.length ? [extract(roots[index])] : []};
+}'''
+
+
+def missing_fields(row, required=(), dependents=None):
+    """
+    检查提取结果中尚未渲染的必填字段（与FIELDS_READY_SCRIPT规则一致）
+    Args:
+        row: extract_fields返回的一行字段字典
+        required: 必填字段组，每组中任意一个字段有内容即可，如 (('title_en', 'title_cn'), ('authors',))
+        dependents: {文本字段: 标志字段}，标志为真时该文本字段也必须有内容
+    Returns:
+        缺失的字段组列表（每项为字段名元组）
+    """
+    def present(name):
+        value = row.get(name)
+        return value is True or (isinstance(value, str) and value.strip() != '')
+
+    missing = [group for group in required if not any(present(name) for name in group)]
+    for name, flag in (dependents or {}).items():
+        if row.get(flag) and not present(name):
+            missing.append((name,))
+    return missing
+
+
+# 必填字段全部有内容时返回true，供page.wait_for_function轮询
+FIELDS_READY_SCRIPT = f'''([rootSelector, index, specs, required, dependents]) => {{
+    const result = ({EXTRACT_SCRIPT})([rootSelector, index, specs]);
+    if (result.rows.length === 0) {{
+        return false;
+    }}
+    const row = result.rows[0];
+    const present = (name) => row[name] === true || (typeof row[name] === 'string' && row[name].trim() !== '');
+    return required.every((group) => group.some(present))
+        && Object.entries(dependents).every(([name, flag]) => !row[flag] || present(name));
+}}'''
@@ -0,0 +1,187 @@
+# utils/event_analyzer.py
+"""
+操作事件分析 - 统计JSONL操作事件中各操作类型和选择器的耗时分位数
+用法: python -m utils.event_analyzer [事件目录或文件...] [--top N] [--json]
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import unicodedata
+
+# 默认统计的事件目录
+DEFAULT_EVENT_DIR = "reports/events"
+
+
+def percentile(sorted_values, percent):
+    """
+    计算分位数（最近秩法）
+    Args:
+        sorted_values: 升序排列的数值列表
+        percent: 百分位，如95
+    Returns:
+        分位数，列表为空时返回0
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def find_event_files(paths):
+    """
+    展开事件目录，包含轮转后的文件
+    Args:
+        paths: 目录或文件路径列表
+    Returns:
+        事件文件路径列表
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.jsonl*"))))
+        elif os.path.exists(path):
+            files.append(path)
+    return files
+
+
+def load_events(paths):
+    """
+    读取事件，跳过无法解析的行（如写入中断的最后一行）
+    Args:
+        paths: 目录或文件路径列表
+    Returns:
+        事件字典的生成器
+    """
+    for file_path in find_event_files(paths):
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def _stats(durations, failures):
+    """计算一组耗时的统计值"""
+    durations = sorted(durations)
+    return {
+        'count': len(durations),
+        'failed': failures,
+        'p50': percentile(durations, 50),
+        'p95': percentile(durations, 95),
+        'p99': percentile(durations, 99),
+        'max': durations[-1] if durations else 0.0,
+        'total': round(sum(durations), 3)
+    }
+
+
+def summarize(events):
+    """
+    按操作类型、以及按操作类型+选择器统计耗时
+    Args:
+        events: 事件字典的可迭代对象
+    Returns:
+        {'by_action': {操作: 统计}, 'by_selector': {(操作, 选择器): 统计}}，耗时单位为毫秒
+    """
+    by_action = {}
+    by_selector = {}
+    for event in events:
+        failed = event.get('outcome') == "failed"
+        for groups, key in ((by_action, event['action']), (by_selector, (event['action'], event['selector']))):
+            group = groups.setdefault(key, [[], 0])
+            group[0].append(event['duration_ms'])
+            group[1] += failed
+
+    return {
+        'by_action': {key: _stats(*group) for key, group in by_action.items()},
+        'by_selector': {key: _stats(*group) for key, group in by_selector.items()}
+    }
+
+
+def display_width(text):
+    """
+    计算文本在终端中的显示宽度（全角/宽字符按2列计算）
+    Args:
+        text: 文本
+    Returns:
+        显示列数
+    """
+    return sum(2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1 for char in text)
+
+
+def pad_left(text, width):
+    """
+    按显示宽度右对齐文本
+    Args:
+        text: 文本
+        width: 目标显示列数
+    Returns:
+        左侧补齐空格后的文本
+    """
+    text = str(text)
+    return " " * max(0, width - display_width(text)) + text
+
+
+def format_report(summary, top=10):
+    """
+    生成文本报告
+    Args:
+        summary: summarize()的返回值
+        top: 按p95列出最慢的选择器数量
+    Returns:
+        报告文本
+    """
+    # 表头与数据行共用同一组列宽，中文表头按显示宽度补齐
+    columns = (("次数", 8, "d"), ("失败", 6, "d"), ("p50", 9, ".1f"), ("p95", 9, ".1f"), ("p99", 9, ".1f"), ("最大", 9, ".1f"))
+    keys = ('count', 'failed', 'p50', 'p95', 'p99', 'max')
+    header = " ".join(pad_left(title, width) for title, width, _ in columns)
+
+    def row(name, stats):
+        cells = " ".join(pad_left(format(stats[key], spec), width) for key, (_, width, spec) in zip(keys, columns))
+        return f"{cells}  {name}"
+
+    lines = ["按操作类型统计（毫秒）", header]
+    for action, stats in sorted(summary['by_action'].items(), key=lambda item: -item[1]['p95']):
+        lines.append(row(action, stats))
+
+    lines += ["", f"最慢的选择器（按p95，前{top}个）", header]
+    slowest = sorted(summary['by_selector'].items(), key=lambda item: -item[1]['p95'])[:top]
+    for (action, selector), stats in slowest:
+        lines.append(row(f"{action} {selector}", stats))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="统计页面操作事件的耗时分位数")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_EVENT_DIR], help="事件目录或JSONL文件")
+    parser.add_argument("--top", type=int, default=10, help="列出最慢的选择器数量")
+    parser.add_argument("--json", action="store_true", help="以JSON格式输出")
+    args = parser.parse_args(argv)
+
+    summary = summarize(load_events(args.paths))
+    if not summary['by_action']:
+        print("没有找到操作事件")
+        return 1
+
+    if args.json:
+        print(json.dumps({
+            'by_action': summary['by_action'],
+            'by_selector': [
+                {'action': action, 'selector': selector, **stats}
+                for (action, selector), stats in summary['by_selector'].items()
+            ]
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(summary, args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# utils/har_replay.py
+"""
+HAR录制/回放 - 把被测站点的接口和页面流量录制到磁盘，之后脱离网络从磁盘回放
+record: 用例照常访问线上环境，同时把流量写入HAR（上下文关闭时落盘）
+replay: 所有请求从HAR返回，HAR中没有的请求直接中止，不访问网络，结果可重复
+"""
+import os
+import re
+
+# 运行模式
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+MODES = (MODE_OFF, MODE_RECORD, MODE_REPLAY)
+
+
+class HarReplay:
+    """
+    HAR录制/回放
+    每个用例（以及每个账号的登录过程）对应一个HAR文件，
+    使用zip格式保存，响应体作为独立条目压缩存放
+    """
+
+    def __init__(self, mode=MODE_OFF, har_dir="test_data/har", url_filter=None):
+        """
+        初始化HAR录制/回放
+        Args:
+            mode: off/record/replay
+            har_dir: HAR文件目录
+            url_filter: 录制时只记录匹配该通配符的请求，如 "**/api/**"，为空时记录全部
+        """
+        if mode not in MODES:
+            raise ValueError(f"未知的HAR模式: {mode}，可选: {', '.join(MODES)}")
+        self.mode = mode
+        self.har_dir = har_dir
+        self.url_filter = url_filter
+
+    @classmethod
+    def from_config(cls, config, mode=None):
+        """
+        根据config.yaml的network.har配置创建
+        Args:
+            config: Config对象
+            mode: 命令行指定的模式，优先于配置文件
+        Returns:
+            HarReplay实例
+        """
+        har_config = config.get('network', {}).get('har', {})
+        return cls(
+            mode=mode or har_config.get('mode', MODE_OFF),
+            har_dir=har_config.get('dir', "test_data/har"),
+            url_filter=har_config.get('url_filter')
+        )
+
+    @property
+    def enabled(self):
+        """是否开启录制或回放"""
+        return self.mode != MODE_OFF
+
+    def har_path(self, name):
+        """
+        HAR文件路径
+        Args:
+            name: 用例nodeid或其他标识，非法字符会被替换
+        Returns:
+            文件路径
+        """
+        safe_name = re.sub(r"[^\w.-]+", "_", name).strip("_")
+        return os.path.join(self.har_dir, f"{safe_name}.har.zip")
+
+    def attach(self, context, name):
+        """
+        在上下文上开启录制或回放，必须在其他路由（如路由配置）之前注册，
+        这样其他路由放行（fallback）的请求才会交给HAR处理
+        Args:
+            context: Playwright的同步BrowserContext
+            name: HAR名称
+        Returns:
+            HAR文件路径，未开启时返回None
+        """
+        if not self.enabled:
+            return None
+
+        path = self.har_path(name)
+        if self.mode == MODE_RECORD:
+            os.makedirs(self.har_dir, exist_ok=True)
+            context.route_from_har(
+                path,
+                url=self.url_filter,
+                update=True,
+                update_content="attach",
+                update_mode="minimal"
+            )
+            return path
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"没有可回放的HAR文件: {path}，请先使用 --har record 录制")
+        context.route_from_har(path, not_found="abort")
+        return path
@@ -0,0 +1,102 @@
+# utils/locator_registry.py
+"""
+定位器注册表 - 每个页面对象只创建一次Locator，并把文本/正则选择器限定在所属容器内
+text=和text=/正则/选择器需要遍历整棵DOM匹配文本，定位器类导入时检查未限定范围的文本选择器并给出提示
+"""
+import re
+import warnings
+
+# 文本引擎选择器（text=文本、text=/正则/）
+_TEXT_SELECTOR = re.compile(r'^text=')
+_REGEX_SELECTOR = re.compile(r'^text=/.*/[a-z]*$', re.S)
+
+
+class ExpensiveSelectorWarning(UserWarning):
+    """未限定范围的文本选择器（会遍历整个页面的DOM）"""
+
+
+def is_text_selector(selector):
+    """
+    是否为文本引擎选择器
+    Args:
+        selector: 选择器
+    Returns:
+        是否以text=开头
+    """
+    return isinstance(selector, str) and bool(_TEXT_SELECTOR.match(selector))
+
+
+def _suggestion(name, selector, containers):
+    """生成选择器优化建议"""
+    kind = "正则文本" if _REGEX_SELECTOR.match(selector) else "文本"
+    hint = f"限定在容器内（SELECTOR_SCOPES中声明，如 {containers[0]}）" if containers else "在SELECTOR_SCOPES中声明所属容器"
+    return (
+        f"{name} = '{selector}' 是未限定范围的{kind}选择器，每次查找都会遍历整个页面的DOM；"
+        f"建议改为基于class/属性的CSS选择器，或{hint}；"
+        f"确实需要在整个页面查找时加入GLOBAL_TEXT_SELECTORS"
+    )
+
+
+def audit_locators(locators_cls):
+    """
+    检查定位器类中未限定范围的文本选择器，每个问题发出一次ExpensiveSelectorWarning
+    定位器类可声明：
+        SELECTOR_SCOPES: {选择器: 所属容器选择器}，查找时限定在容器内
+        GLOBAL_TEXT_SELECTORS: 确认需要在整个页面查找的文本选择器（如页面标题）
+    Args:
+        locators_cls: 定位器类
+    Returns:
+        [(常量名, 选择器, 建议)]
+    """
+    scopes = getattr(locators_cls, 'SELECTOR_SCOPES', {})
+    allowed = set(getattr(locators_cls, 'GLOBAL_TEXT_SELECTORS', ()))
+    containers = sorted(set(scopes.values()))
+    findings = []
+    for name, selector in vars(locators_cls).items():
+        if not name.isupper() or not is_text_selector(selector):
+            continue
+        if selector in scopes or selector in allowed:
+            continue
+        advice = _suggestion(f"{locators_cls.__name__}.{name}", selector, containers)
+        findings.append((name, selector, advice))
+        warnings.warn(advice, ExpensiveSelectorWarning, stacklevel=2)
+    return findings
+
+
+class LocatorRegistry:
+    """
+    页面对象的定位器缓存
+    Locator是惰性的（每次操作时才在页面中查找），同一选择器的Locator可在页面导航后继续使用，
+    因此每个页面对象只需创建一次；同步和异步Page均适用
+    """
+
+    def __init__(self, page, scopes=None):
+        """
+        初始化定位器缓存
+        Args:
+            page: Playwright的Page对象（同步或异步）
+            scopes: {选择器: 所属容器选择器}
+        """
+        self.page = page
+        self.scopes = dict(scopes or {})
+        self._locators = {}
+
+    def get(self, selector, scope=None):
+        """
+        获取选择器对应的Locator（首次调用时创建）
+        Args:
+            selector: 选择器
+            scope: 容器选择器，默认使用SELECTOR_SCOPES中声明的容器
+        Returns:
+            Locator
+        """
+        scope = scope or self.scopes.get(selector)
+        key = (scope, selector)
+        locator = self._locators.get(key)
+        if locator is None:
+            if scope:
+                locator = self.get(scope).locator(selector)
+            else:
+                locator = self.page.locator(selector)
+            self._locators[key] = locator
+        return locator
@@ -2,10 +2,52 @@
 """
 日志工具类 - 统一日志输出格式
 支持文件和控制台双输出，便于调试和追踪问题
+默认异步输出：用例线程只把日志放入队列，格式化、写文件和控制台在后台线程中完成
+日志仍向上传递给root logger，pytest的log_cli、caplog和HTML报告照常收集；
+逐步页面操作日志为DEBUG级别且使用%参数，log_cli_level=INFO时不会被格式化
 """
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from utils.worker import get_worker_id, is_xdist_worker
+
+# 默认日志配置，config.yaml中的logging配置会覆盖这些值
+DEFAULT_SETTINGS = {
+    'level': "INFO",
+    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    'async': True,  # 异步写日志：用例线程只把日志放入队列，由后台线程写文件和控制台
+    'buffer_size': 200,  # 异步模式下日志文件的批量写入条数，ERROR及以上立即写入
+    'console': True,  # 是否输出到控制台
+    'to_file': True  # 是否写日志文件（--collect-only时关闭）
+}
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    把日志记录原样放入队列，格式化（包括异常堆栈）留给后台线程
+    队列只在本进程内使用，不需要像QueueHandler.prepare那样预先格式化以便序列化
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """
+    首次写日志时才创建日志目录并打开文件
+    只收集用例（--collect-only）时不会产生目录和文件句柄
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename, encoding='utf-8', delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 
 class Logger:
     """
@@ -29,36 +71,110 @@ class Logger:
         
         self._initialized = True
         
-        # 创建日志目录
+        # 日志目录在首次写日志时创建
         log_dir = "reports/logs"
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # 生成日志文件名（按日期）
-        log_file = f"{log_dir}/test_{datetime.now().strftime('%Y%m%d')}.log"
-        
-        # 配置日志格式
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        date_format = '%Y-%m-%d %H:%M:%S'
+
+        # 生成日志文件名（按日期，并行执行时每个worker单独一个文件）
+        self.log_file = f"{log_dir}/test_{datetime.now().strftime('%Y%m%d')}.log"
+        if is_xdist_worker():
+            self.log_file = f"{log_dir}/test_{datetime.now().strftime('%Y%m%d')}_{get_worker_id()}.log"
         
         # 创建logger
         self.logger = logging.getLogger('AutoTest')
-        self.logger.setLevel(logging.INFO)
-        
-        # 避免重复添加handler
-        if not self.logger.handlers:
-            # 文件处理器
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setLevel(logging.INFO)
-            file_handler.setFormatter(logging.Formatter(log_format, date_format))
-            
-            # 控制台处理器
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-            console_handler.setFormatter(logging.Formatter(log_format, date_format))
-            
-            # 添加处理器
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+        # 保持向上传递，pytest的log_cli、caplog和HTML报告依赖root logger上的处理器
+        self.logger.propagate = True
+        self._listener = None
+        self._buffer = None
+        self._handlers = []
+        self._settings = dict(DEFAULT_SETTINGS)
+        self.configure()
+        atexit.register(self.shutdown)
+
+    def configure(self, settings=None):
+        """
+        按配置重建日志处理器
+        Args:
+            settings: config.yaml中的logging配置，未提供的项使用DEFAULT_SETTINGS
+        """
+        self._stop_listener()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        for handler in self._handlers:
+            handler.close()
+
+        self._settings = {**DEFAULT_SETTINGS, **(settings or {})}
+        level = logging.getLevelName(str(self._settings['level']).upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+        self.logger.setLevel(level)
+
+        # 配置日志格式（并行执行时带上worker id，便于合并后区分）
+        log_format = self._settings['format']
+        if is_xdist_worker():
+            log_format = log_format.replace('%(name)s', f'%(name)s[{get_worker_id()}]')
+        formatter = logging.Formatter(log_format, '%Y-%m-%d %H:%M:%S')
+
+        # 文件处理器（延迟打开）
+        file_handler = _LazyFileHandler(self.log_file) if self._settings['to_file'] else None
+        handlers = [file_handler] if file_handler else []
+        # 控制台处理器
+        if self._settings['console']:
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setLevel(level)
+            handler.setFormatter(formatter)
+        self._handlers = handlers
+
+        if not self._settings['async']:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+            return
+
+        # 异步模式：QueueHandler -> 后台QueueListener -> (MemoryHandler批量写文件, 控制台)
+        listener_handlers = handlers
+        if file_handler is not None:
+            self._buffer = MemoryHandler(
+                capacity=self._settings['buffer_size'],
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            self._buffer.setLevel(level)
+            listener_handlers = [self._buffer, *handlers[1:]]
+        log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, *listener_handlers, respect_handler_level=True)
+        self._listener.start()
+        self.logger.addHandler(_DeferredQueueHandler(log_queue))
+
+    def _stop_listener(self):
+        """停止后台线程，处理完队列中剩余的日志并写入文件"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._buffer is not None:
+            self._buffer.flush()
+            self._buffer.close()
+            self._buffer = None
+
+    def flush(self):
+        """
+        把已记录的日志全部写入文件（如合并各worker日志之前）
+        """
+        if self._listener is None:
+            for handler in self.logger.handlers:
+                handler.flush()
+            return
+        # 停止监听会先处理完队列中的日志，再重新启动
+        self._listener.stop()
+        if self._buffer is not None:
+            self._buffer.flush()
+        self._listener.start()
+
+    def shutdown(self):
+        """
+        关闭异步日志：写完剩余日志，之后的日志改为同步输出
+        """
+        if self._listener is not None:
+            self.configure({**self._settings, 'async': False})
     
     def get_logger(self):
         """
@@ -66,4 +182,4 @@ class Logger:
         Returns:
             配置好的logger
         """
-        return self.logger
\ No newline at end of file
+        return self.logger
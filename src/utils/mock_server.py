@@ -0,0 +1,496 @@
+# utils/mock_server.py
+"""
+本地模拟后端 - 在测试进程内启动的轻量HTTP服务
+实现登录、本周文献速递列表和文献详情的页面与接口，页面结构与线上环境的定位器保持一致，
+数据由test_data中的测试数据生成，可模拟上万篇文献的超长列表、网络延迟和接口错误，
+用于在没有真实环境时对页面对象做基准测试和回归测试
+"""
+import html
+import json
+import random
+import threading
+import time
+import uuid
+from fnmatch import fnmatch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 会话cookie名称
+SESSION_COOKIE = "mock_session"
+
+# 列表页 ?count= 允许的最大文献数量，详情页接受该范围内的任意序号
+MAX_LITERATURE_COUNT = 100000
+
+# 生成文献时使用的期刊、作者等素材，文本需要能被页面对象中的text=/正则/定位器匹配
+_JOURNALS = (
+    "ENVIRONMENTAL SCIENCE & TECHNOLOGY",
+    "ENVIRONMENTAL SCIENCE: WATER RESEARCH & TECHNOLOGY",
+    "ENVIRONMENTAL SCIENCE AND POLLUTION RESEARCH",
+    "ENVIRONMENTAL SCIENCE AND ECOTECHNOLOGY",
+)
+_AUTHORS = ("S. Rai", "L. Zhang", "M. Chen", "K. Tanaka", "A. Garcia")
+_TOPICS_CN = ("资源回收", "工业废水处理", "循环经济", "水处理")
+
+
+class LiteratureFactory:
+    """
+    文献数据生成器
+    第i篇文献只由序号和关键词决定，按需生成，不在内存中保存整个列表
+    """
+
+    def __init__(self, keywords=None, count=50):
+        """
+        初始化文献数据生成器
+        Args:
+            keywords: 关键词列表，来自测试数据的test_keywords
+            count: 默认文献数量
+        """
+        self.keywords = list(keywords or ["Water treatment"])
+        self.count = count
+
+    @staticmethod
+    def clamp_count(count):
+        """把列表数量限制在0~MAX_LITERATURE_COUNT之间"""
+        return max(0, min(count, MAX_LITERATURE_COUNT))
+
+    @staticmethod
+    def has(index):
+        """
+        序号是否有效
+        文献只由序号决定，列表页用 ?count= 展示的任何一篇都能打开详情，不受默认数量限制
+        Args:
+            index: 文献序号
+        Returns:
+            是否有效
+        """
+        return index is not None and 0 <= index < MAX_LITERATURE_COUNT
+
+    def get(self, index):
+        """
+        生成第index篇文献
+        Args:
+            index: 文献序号（从0开始）
+        Returns:
+            文献字典
+        """
+        keyword = self.keywords[index % len(self.keywords)]
+        topic_cn = _TOPICS_CN[index % len(_TOPICS_CN)]
+        author = _AUTHORS[index % len(_AUTHORS)]
+        return {
+            'id': index,
+            'title': f"{keyword}: case study {index + 1} on process optimization",
+            'title_cn': f"{topic_cn}案例研究 {index + 1}",
+            'author': f"{author} et al.",
+            'journal': _JOURNALS[index % len(_JOURNALS)],
+            'date': f"2026-01-{index % 28 + 1:02d}",
+            'impact_factor': f"IF: {5 + index % 70 / 10:.1f} Q1",
+            'citation_count': f"被引: {index * 7 % 300}",
+            'keyword': keyword,
+            'ai_interpretation': (
+                f"该研究围绕{topic_cn}展开，针对{keyword}提出了一种新的工艺优化方法，"
+                f"通过中试规模的实验验证了方案的可行性，并对运行成本和环境效益进行了系统评估。"
+            )
+        }
+
+    def page(self, offset=0, limit=None, count=None):
+        """
+        按分页生成文献
+        Args:
+            offset: 起始序号
+            limit: 最多返回数量，为空时返回到列表末尾
+            count: 列表总数，为空时使用默认数量
+        Returns:
+            文献字典的生成器
+        """
+        total = self.count if count is None else self.clamp_count(count)
+        end = total if limit is None else min(total, offset + limit)
+        return (self.get(index) for index in range(max(0, offset), end))
+
+
+class FaultProfile:
+    """
+    延迟和错误注入配置
+    随机数使用固定种子，同样的请求顺序得到同样的延迟和错误
+    """
+
+    def __init__(self, name="normal", latency_ms=0, jitter_ms=0, error_rate=0.0, error_status=500,
+                 error_paths=("/api/*",), seed=0):
+        """
+        初始化延迟和错误注入配置
+        Args:
+            name: 配置名称
+            latency_ms: 每个请求的固定延迟（毫秒）
+            jitter_ms: 在固定延迟上随机增加的延迟上限（毫秒）
+            error_rate: 返回错误的概率（0~1）
+            error_status: 错误时返回的HTTP状态码
+            error_paths: 允许注入错误的路径通配符
+            seed: 随机数种子
+        """
+        self.name = name
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_paths = tuple(error_paths or ())
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self):
+        """计算本次请求的延迟（秒）"""
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        return (self.latency_ms + jitter) / 1000
+
+    def should_fail(self, path):
+        """判断本次请求是否注入错误"""
+        if not self.error_rate or not any(fnmatch(path, pattern) for pattern in self.error_paths):
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+
+class MockBackend:
+    """
+    模拟后端服务
+    在后台线程中运行ThreadingHTTPServer，端口为0时自动分配空闲端口（xdist下各worker互不冲突）
+    """
+
+    def __init__(self, users, factory, fault_profile=None, host="127.0.0.1", port=0):
+        """
+        初始化模拟后端
+        Args:
+            users: {用户名: 密码}
+            factory: LiteratureFactory实例
+            fault_profile: FaultProfile实例
+            host: 监听地址
+            port: 监听端口，0表示自动分配
+        """
+        self.users = dict(users)
+        self.factory = factory
+        self.fault_profile = fault_profile or FaultProfile()
+        self.host = host
+        self.port = port
+        self.sessions = set()
+        self.request_count = 0
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, test_data, count=None, profile=None):
+        """
+        根据config.yaml的mock_backend配置和测试数据创建
+        Args:
+            config: Config对象
+            test_data: 测试数据字典（提供test_user/test_users和test_keywords）
+            count: 文献数量，覆盖配置文件
+            profile: 延迟和错误注入配置名称，覆盖配置文件
+        Returns:
+            MockBackend实例
+        """
+        mock_config = config.get('mock_backend', {})
+        profiles = mock_config.get('profiles', {})
+        profile = profile or mock_config.get('profile', 'normal')
+        if profile not in profiles:
+            raise ValueError(f"未定义的模拟后端配置: {profile}，可选: {', '.join(profiles)}")
+
+        accounts = test_data.get('test_users') or [test_data['test_user']]
+        return cls(
+            users={account['username']: str(account['password']) for account in accounts},
+            factory=LiteratureFactory(
+                keywords=test_data.get('test_keywords'),
+                count=count or mock_config.get('literature_count', 50)
+            ),
+            fault_profile=FaultProfile(profile, **(profiles[profile] or {})),
+            host=mock_config.get('host', "127.0.0.1"),
+            port=mock_config.get('port', 0)
+        )
+
+    @property
+    def base_url(self):
+        """模拟后端的访问地址"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """启动服务"""
+
+        class Handler(_MockRequestHandler):
+            backend = self
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-backend", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """停止服务"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def login(self, username, password):
+        """
+        校验账号并创建会话
+        Returns:
+            会话token，账号或密码错误时返回None
+        """
+        if self.users.get(username) != str(password):
+            return None
+        token = uuid.uuid4().hex
+        with self._lock:
+            self.sessions.add(token)
+        return token
+
+    def count_request(self):
+        """请求计数（用于基准测试统计）"""
+        with self._lock:
+            self.request_count += 1
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    """模拟后端的请求处理，backend由MockBackend.start()注入"""
+
+    backend = None
+
+    def log_message(self, format, *args):
+        """不输出访问日志，避免刷屏"""
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        """发送响应"""
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    def _send_json(self, status, payload, headers=None):
+        """发送JSON响应"""
+        self._send(status, json.dumps(payload, ensure_ascii=False), "application/json; charset=utf-8", headers)
+
+    def _is_logged_in(self):
+        """检查请求是否带有有效的会话cookie"""
+        for part in self.headers.get("Cookie", "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE and value in self.backend.sessions:
+                return True
+        return False
+
+    def _prepare(self):
+        """
+        统一处理计数、延迟和错误注入
+        Returns:
+            是否继续处理请求
+        """
+        backend = self.backend
+        backend.count_request()
+        delay = backend.fault_profile.delay()
+        if delay:
+            time.sleep(delay)
+        path = urlparse(self.path).path
+        if backend.fault_profile.should_fail(path):
+            self._send_json(backend.fault_profile.error_status, {'code': -1, 'message': "模拟服务异常"})
+            return False
+        return True
+
+    def do_GET(self):
+        """处理GET请求"""
+        if not self._prepare():
+            return
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path.rstrip("/") or "/"
+        factory = self.backend.factory
+
+        if path == "/login":
+            self._send(200, _render_login_page())
+            return
+
+        if path.startswith("/api/"):
+            if not self._is_logged_in():
+                self._send_json(401, {'code': 401, 'message': "未登录"})
+                return
+            if path == "/api/literature":
+                count = factory.clamp_count(_int_param(query, 'count', factory.count))
+                offset = _int_param(query, 'offset', 0)
+                limit = _int_param(query, 'limit', 20)
+                self._send_json(200, {'total': count, 'items': list(factory.page(offset, limit, count))})
+                return
+            index = _literature_index(path, "/api/literature/")
+            if factory.has(index):
+                self._send_json(200, factory.get(index))
+                return
+            self._send_json(404, {'code': 404, 'message': "文献不存在"})
+            return
+
+        if not self._is_logged_in():
+            self._send(302, "", headers={"Location": "/login"})
+            return
+        if path == "/":
+            count = factory.clamp_count(_int_param(query, 'count', factory.count))
+            self._send(200, _render_home_page(factory, count))
+            return
+        index = _literature_index(path, "/literature/")
+        if factory.has(index):
+            self._send(200, _render_detail_page(factory.get(index)))
+            return
+        self._send(404, "<h1>404 Not Found</h1>")
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        """处理POST请求（登录接口）"""
+        if not self._prepare():
+            return
+        if urlparse(self.path).path != "/api/login":
+            self._send_json(404, {'code': 404, 'message': "接口不存在"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {'code': 400, 'message': "请求格式错误"})
+            return
+
+        token = self.backend.login(payload.get('username', ''), payload.get('password', ''))
+        if token is None:
+            self._send_json(200, {'code': 1, 'message': "用户名或密码错误"})
+            return
+        self._send_json(
+            200,
+            {'code': 0, 'message': "登录成功"},
+            headers={"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"}
+        )
+
+
+def _int_param(query, name, default):
+    """读取整数查询参数"""
+    try:
+        return int(query[name][0])
+    except (KeyError, IndexError, ValueError):
+        return default
+
+
+def _literature_index(path, prefix):
+    """从 /literature/<序号> 形式的路径中取出序号"""
+    if not path.startswith(prefix):
+        return None
+    value = path[len(prefix):]
+    return int(value) if value.isdigit() else None
+
+
+# 页面模板：类名、id与pages中的定位器一致
+_PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html lang="zh-CN">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+{body}
+</body>
+</html>'''
+
+# 登录页：提交后调用/api/login，成功后跳转首页并在首页提示"登录成功"
+_LOGIN_BODY = '''<form id="login_form">
+  <input id="user_name_input" name="username" placeholder="用户名">
+  <input id="password_input" name="password" type="password" placeholder="密码">
+  <button type="submit" class="_submitBtn_191sl_225">登录</button>
+</form>
+<div class="_messageContent_co722_98" id="message"></div>
+<script>
+document.getElementById('login_form').addEventListener('submit', async (event) => {
+  event.preventDefault();
+  const response = await fetch('/api/login', {
+    method: 'POST',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify({
+      username: document.getElementById('user_name_input').value,
+      password: document.getElementById('password_input').value
+    })
+  });
+  const result = await response.json();
+  if (result.code === 0) {
+    sessionStorage.setItem('login_message', result.message);
+    location.href = '/';
+  } else {
+    document.getElementById('message').textContent = result.message;
+  }
+});
+</script>'''
+
+_HOME_SCRIPT = '''<script>
+const message = sessionStorage.getItem('login_message');
+if (message) {
+  document.getElementById('message').textContent = message;
+  sessionStorage.removeItem('login_message');
+}
+</script>'''
+
+
+def _render_login_page():
+    """渲染登录页"""
+    return _PAGE_TEMPLATE.format(title="登录", body=_LOGIN_BODY)
+
+
+def _render_item(item):
+    """渲染列表中的一篇文献"""
+    e = html.escape
+    return (
+        f'<div class="literature-item">'
+        f'<a href="/literature/{item["id"]}"><h4>{e(item["title"])}</h4></a>'
+        f'<div class="title-cn">{e(item["title_cn"])}</div>'
+        f'<span class="author">{e(item["author"])}</span>'
+        f'<span class="journal">{e(item["journal"])}</span>'
+        f'<span class="date">{item["date"]}</span>'
+        f'<span class="impact-factor">{item["impact_factor"]}</span>'
+        f'<span class="keyword">命中关键词: {e(item["keyword"])}</span>'
+        f'</div>'
+    )
+
+
+def _render_home_page(factory, count):
+    """渲染首页（本周文献速递列表）"""
+    items = "\n".join(_render_item(item) for item in factory.page(count=count))
+    body = (
+        f'<header><span class="font-bold tracking-tight">智库</span></header>\n'
+        f'<div class="_messageContent_co722_98" id="message"></div>\n'
+        f'<section><h3>本周文献速递</h3><span class="total">共 {count} 篇</span>\n'
+        f'<div class="literature-list">\n{items}\n</div></section>\n'
+        f'{_HOME_SCRIPT}'
+    )
+    return _PAGE_TEMPLATE.format(title="智库", body=body)
+
+
+def _render_detail_page(item):
+    """渲染文献详情页"""
+    e = html.escape
+    body = (
+        f'<article>'
+        f'<h1>{e(item["title"])}</h1>'
+        f'<div class="title-cn">{e(item["title_cn"])}</div>'
+        f'<p class="authors">{e(item["author"])}</p>'
+        f'<p class="journal">{e(item["journal"])}</p>'
+        f'<p class="date">{item["date"]}</p>'
+        f'<p class="impact-factor">{item["impact_factor"]}</p>'
+        f'<p class="citation">{item["citation_count"]}</p>'
+        f'<p class="keyword">命中关键词: {e(item["keyword"])}</p>'
+        f'<h3>AI解读</h3><div class="ai-interpretation">{e(item["ai_interpretation"])}</div>'
+        f'<div class="article-content">{e(item["ai_interpretation"])}</div>'
+        f'<div class="figures">Figure 1</div>'
+        f'<div class="supplementary">Table S1</div>'
+        f'</article>'
+    )
+    return _PAGE_TEMPLATE.format(title=e(item["title"]), body=body)
@@ -0,0 +1,128 @@
+# utils/performance.py
+"""
+页面性能指标 - 采集Navigation Timing、Paint Timing和LCP，并记录历史用于观察趋势
+预算（每个页面各指标的上限，毫秒）在测试数据YAML的performance_budgets中声明
+"""
+import json
+import os
+import time
+from utils.worker import worker_path
+
+# 采集的指标名称，单位均为毫秒（相对于导航开始）
+METRICS = (
+    'ttfb',
+    'dom_content_loaded',
+    'load',
+    'first_paint',
+    'first_contentful_paint',
+    'largest_contentful_paint'
+)
+
+# 页面内采集脚本
+# 导航指标只属于完整的文档加载：单页应用内的路由跳转不会产生新的navigation记录，
+# 此时navigation记录的地址与当前地址不一致，导航与绘制指标返回null；
+# LCP通过buffered的PerformanceObserver读取，不支持的浏览器（firefox/webkit）返回null
+PERFORMANCE_SCRIPT = '''() => new Promise((resolve) => {
+    const round = (value) => (value === undefined || value === null || value <= 0) ? null : Math.round(value);
+    const nav = performance.getEntriesByType('navigation')[0];
+    const sameDocument = !!nav && nav.name.split('#')[0] === location.href.split('#')[0];
+    const paints = {};
+    for (const entry of performance.getEntriesByType('paint')) {
+        paints[entry.name] = entry.startTime;
+    }
+    const metrics = {
+        url: location.href,
+        soft_navigation: !sameDocument,
+        ttfb: sameDocument ? round(nav.responseStart - nav.requestStart) : null,
+        dom_content_loaded: sameDocument ? round(nav.domContentLoadedEventEnd) : null,
+        load: sameDocument ? round(nav.loadEventEnd) : null,
+        first_paint: sameDocument ? round(paints['first-paint']) : null,
+        first_contentful_paint: sameDocument ? round(paints['first-contentful-paint']) : null,
+        largest_contentful_paint: null
+    };
+    if (!sameDocument || !PerformanceObserver.supportedEntryTypes.includes('largest-contentful-paint')) {
+        resolve(metrics);
+        return;
+    }
+    const observer = new PerformanceObserver((list) => {
+        const entries = list.getEntries();
+        metrics.largest_contentful_paint = round(entries[entries.length - 1].startTime);
+    });
+    observer.observe({type: 'largest-contentful-paint', buffered: true});
+    // buffered记录在下一个任务中送达
+    setTimeout(() => { observer.disconnect(); resolve(metrics); }, 50);
+})'''
+
+
+def check_budget(metrics, budget):
+    """
+    对比指标与预算
+    Args:
+        metrics: 采集到的指标字典
+        budget: {指标: 上限毫秒}
+    Returns:
+        {指标: {'measured': 实测值, 'budget': 预算, 'passed': 是否达标}}，
+        没有采集到的指标passed为None
+    """
+    result = {}
+    for name, limit in (budget or {}).items():
+        measured = metrics.get(name)
+        result[name] = {
+            'measured': measured,
+            'budget': limit,
+            'passed': None if measured is None else measured <= limit
+        }
+    return result
+
+
+class PerformanceHistory:
+    """
+    性能指标历史
+    每次断言追加一条JSONL记录，读取同一用例同一页面最近几次的指标作为趋势
+    """
+
+    def __init__(self, path=None, keep=10):
+        """
+        初始化性能指标历史
+        Args:
+            path: 历史文件路径，默认reports/performance/history.jsonl（并行时按worker区分）
+            keep: 趋势中保留的最近记录数
+        """
+        self.path = path or worker_path("reports/performance", "history.jsonl")
+        self.keep = keep
+
+    def trend(self, key):
+        """
+        读取最近的历史指标
+        Args:
+            key: 用例id与页面名称组成的key
+        Returns:
+            {指标: [由旧到新的实测值]}
+        """
+        records = []
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get('key') == key:
+                        records.append(record['metrics'])
+        records = records[-self.keep:]
+        return {name: [record.get(name) for record in records] for name in METRICS}
+
+    def record(self, key, metrics):
+        """
+        追加一条历史记录
+        Args:
+            key: 用例id与页面名称组成的key
+            metrics: 指标字典
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'key': key,
+                'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'metrics': {name: metrics.get(name) for name in METRICS}
+            }, ensure_ascii=False) + "\n")
@@ -0,0 +1,85 @@
+# utils/report_merge.py
+"""
+并行报告合并 - 在xdist主进程中汇总各worker的产物
+HTML报告由pytest-html在主进程统一生成，Allure结果由各worker写入同一目录，
+这里负责合并各worker的日志并补充Allure环境信息
+"""
+import glob
+import os
+import re
+from datetime import datetime
+
+# 日志记录行以时间戳开头，其余行（如异常堆栈）属于上一条记录
+_RECORD_START = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+
+
+def _read_records(path):
+    """按日志记录读取文件，多行记录合并为一条"""
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if _RECORD_START.match(line) or not records:
+                records.append(line)
+            else:
+                records[-1] += line
+    return records
+
+
+def _worker_logs(log_dir, date="*"):
+    """列出worker日志文件（不含合并结果）"""
+    return sorted(glob.glob(os.path.join(log_dir, f"test_{date}_gw*.log")))
+
+
+def clear_worker_logs(log_dir="reports/logs"):
+    """
+    删除之前执行留下的worker日志（worker日志为追加写入，需在worker启动前由主进程清理）
+    Args:
+        log_dir: 日志目录
+    Returns:
+        删除的文件数
+    """
+    worker_logs = _worker_logs(log_dir)
+    for path in worker_logs:
+        os.remove(path)
+    return len(worker_logs)
+
+
+def merge_worker_logs(log_dir="reports/logs", date=None):
+    """
+    将各worker的日志按时间合并为一个文件
+    会话开始时已调用clear_worker_logs，目录中的worker日志都属于本次执行
+    Args:
+        log_dir: 日志目录
+        date: 只合并该日期（YYYYMMDD）的worker日志，默认合并全部（执行跨越零点时也不会遗漏）
+    Returns:
+        合并后的文件路径（按今天的日期命名），没有worker日志时返回None
+    """
+    worker_logs = _worker_logs(log_dir, date or "*")
+    if not worker_logs:
+        return None
+
+    records = []
+    for path in worker_logs:
+        records.extend(_read_records(path))
+    # 时间戳精确到秒，稳定排序保证同一秒内各worker自身的顺序不变
+    records.sort(key=lambda record: record[:19])
+
+    merged_path = os.path.join(log_dir, f"test_{date or datetime.now().strftime('%Y%m%d')}_merged.log")
+    with open(merged_path, 'w', encoding='utf-8') as f:
+        f.writelines(records)
+    return merged_path
+
+
+def write_allure_environment(alluredir, properties):
+    """
+    写入Allure报告的环境信息（environment.properties）
+    Args:
+        alluredir: Allure结果目录
+        properties: 环境信息字典
+    """
+    if not alluredir:
+        return
+    os.makedirs(alluredir, exist_ok=True)
+    with open(os.path.join(alluredir, "environment.properties"), 'w', encoding='utf-8') as f:
+        for key, value in properties.items():
+            f.write(f"{key}={value}\n")
@@ -0,0 +1,253 @@
+# utils/retry.py
+"""
+失败重试 - 对失败原因分类，只重试基础设施类失败（网络超时、浏览器崩溃等）
+重试时只重建用例自身的function级fixture（上下文和页面），
+已启动的浏览器、登录状态缓存等会话级资源直接复用；每个用例的重试情况记录到统计文件
+"""
+import bdb
+import glob
+import json
+import os
+import re
+import pytest
+from utils.worker import worker_path
+
+# 失败分类
+CATEGORY_BROWSER_CRASH = "browser_crash"
+CATEGORY_SELECTOR_MISSING = "selector_missing"
+CATEGORY_NETWORK_TIMEOUT = "network_timeout"
+CATEGORY_ASSERTION = "assertion"
+CATEGORY_OTHER = "other"
+
+# 分类规则，按顺序匹配异常信息（异常类型和Playwright的报错内容，不匹配断言的自定义文字）
+_CATEGORY_RULES = (
+    (CATEGORY_BROWSER_CRASH, re.compile(
+        r"Target (page, context or browser )?(has been )?closed|Browser has been closed|"
+        r"browser has disconnected|Target crashed|Page crashed", re.I)),
+    (CATEGORY_SELECTOR_MISSING, re.compile(r"waiting for (locator|selector|get_by_)", re.I)),
+    (CATEGORY_NETWORK_TIMEOUT, re.compile(
+        r"net::ERR_|waiting for navigation|navigating to|waiting for load state|"
+        r"TimeoutError|Timeout \d+ms exceeded|ECONNRESET|ECONNREFUSED", re.I)),
+)
+
+# 统计文件名
+STATS_FILE = "retry_stats.jsonl"
+
+
+def classify_failure(report):
+    """
+    对失败报告分类
+    先看异常类型：AssertionError一律归为断言失败（即使断言信息中有"加载超时"等文字，
+    页面对象等待超时后返回False再由断言报错，属于被测页面的问题而非基础设施问题）；
+    其他异常再按异常信息匹配规则
+    Args:
+        report: pytest的TestReport
+    Returns:
+        失败分类
+    """
+    crash = getattr(getattr(report, 'longrepr', None), 'reprcrash', None)
+    text = (crash.message if crash is not None else report.longreprtext) or ""
+    lines = text.strip().splitlines()
+    exception_type = lines[0].split(":", 1)[0].strip().rsplit(".", 1)[-1] if lines else ""
+    if exception_type == "AssertionError":
+        return CATEGORY_ASSERTION
+    for category, pattern in _CATEGORY_RULES:
+        if pattern.search(text):
+            return category
+    return CATEGORY_OTHER
+
+
+class _FunctionScopeOnly:
+    """
+    作为pytest_runtest_teardown的nextitem传入：pytest拆除不在nextitem.listchain()中的节点，
+    因此只拆除用例节点本身（function级fixture），保留会话、模块和类级的fixture，供重试直接复用
+    """
+
+    def __init__(self, item):
+        self._chain = item.listchain()[:-1]
+
+    def listchain(self):
+        return list(self._chain)
+
+
+class RetryPolicy:
+    """
+    重试策略
+    """
+
+    def __init__(self, max_retries=1, retry_on=(CATEGORY_NETWORK_TIMEOUT, CATEGORY_BROWSER_CRASH),
+                 stats_dir="reports/retry"):
+        """
+        初始化重试策略
+        Args:
+            max_retries: 最多重试次数，0表示不重试
+            retry_on: 允许重试的失败分类
+            stats_dir: 重试统计目录
+        """
+        self.max_retries = max_retries
+        self.retry_on = set(retry_on or ())
+        self.stats_dir = stats_dir
+
+    @classmethod
+    def from_config(cls, config, max_retries=None):
+        """
+        根据config.yaml的retry配置创建
+        Args:
+            config: Config对象
+            max_retries: 命令行指定的重试次数，优先于配置文件
+        Returns:
+            RetryPolicy实例
+        """
+        retry_config = config.get('retry', {})
+        return cls(
+            max_retries=retry_config.get('max_retries', 1) if max_retries is None else max_retries,
+            retry_on=retry_config.get('retry_on', (CATEGORY_NETWORK_TIMEOUT, CATEGORY_BROWSER_CRASH)),
+            stats_dir=retry_config.get('stats_dir', "reports/retry")
+        )
+
+    def should_retry(self, category, attempt):
+        """
+        是否重试
+        Args:
+            category: 失败分类
+            attempt: 已执行的次数
+        Returns:
+            是否重试
+        """
+        return attempt <= self.max_retries and category in self.retry_on
+
+    def record(self, entry):
+        """
+        追加一条用例的重试统计（并行执行时每个worker一个文件）
+        Args:
+            entry: 统计字典
+        """
+        with open(worker_path(self.stats_dir, STATS_FILE), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def load_stats(self):
+        """
+        读取本次执行所有worker的重试统计
+        Returns:
+            统计字典列表
+        """
+        entries = []
+        for path in glob.glob(os.path.join(self.stats_dir, "**", STATS_FILE), recursive=True):
+            with open(path, 'r', encoding='utf-8') as f:
+                entries.extend(json.loads(line) for line in f if line.strip())
+        return entries
+
+    def clear_stats(self):
+        """删除上一次执行的统计文件"""
+        for path in glob.glob(os.path.join(self.stats_dir, "**", STATS_FILE), recursive=True):
+            os.remove(path)
+
+
+def supports_retry(item):
+    """
+    当前pytest版本是否支持在同一会话内重试该用例
+    重试需要为用例重建fixture请求，pytest没有公开的接口，只能调用Function._initrequest；
+    pytest升级后该方法不存在时不重试，用例按pytest默认流程执行
+    Args:
+        item: pytest用例
+    Returns:
+        是否支持
+    """
+    return callable(getattr(item, "_initrequest", None))
+
+
+def _reset_fixture_request(item):
+    """重建用例的fixture请求，setup时重新创建function级fixture（唯一用到的pytest内部接口）"""
+    item._initrequest()
+
+
+def _run_phase(item, when, **kwargs):
+    """
+    执行用例的一个阶段（setup/call/teardown）并生成报告
+    只通过pytest公开的hook和CallInfo完成，与pytest自身的执行流程一致
+    Args:
+        item: pytest用例
+        when: 阶段名称
+        kwargs: 传给阶段hook的参数（teardown的nextitem）
+    Returns:
+        TestReport
+    """
+    hook = getattr(item.ihook, f"pytest_runtest_{when}")
+    reraise = (pytest.exit.Exception,)
+    if not item.config.getoption("usepdb", False):
+        reraise += (KeyboardInterrupt,)
+    call = pytest.CallInfo.from_call(lambda: hook(item=item, **kwargs), when=when, reraise=reraise)
+    report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+    # --pdb等交互调试（跳过和xfail不进入）
+    if (call.excinfo is not None and not hasattr(report, "wasxfail")
+            and not call.excinfo.errisinstance((pytest.skip.Exception, bdb.BdbQuit))):
+        item.ihook.pytest_exception_interact(node=item, call=call, report=report)
+    return report
+
+
+def run_test_with_retries(item, nextitem, policy, failed_selector=None):
+    """
+    执行单个用例（setup/call/teardown），基础设施类失败时在同一会话内重试
+    与pytest的runtestprotocol流程一致，区别是可能重试时teardown只拆除function级fixture；
+    被重试的失败报告标记为rerun，最后一次执行的报告作为用例结果
+    Args:
+        item: pytest用例
+        nextitem: 下一个用例
+        policy: RetryPolicy
+        failed_selector: 返回当前用例最近一次失败的元素选择器的函数（用于统计不稳定的选择器）
+    Returns:
+        统计字典
+    """
+    ihook = item.ihook
+    attempts = []
+    attempt = 1
+    while True:
+        item.execution_count = attempt
+        if attempt > 1:
+            _reset_fixture_request(item)
+        try:
+            reports = [_run_phase(item, "setup")]
+            if reports[0].passed:
+                reports.append(_run_phase(item, "call"))
+
+            failure = next((report for report in reports if report.failed), None)
+            category = classify_failure(failure) if failure else None
+            retry = failure is not None and policy.should_retry(category, attempt)
+            if failure is not None:
+                crash = getattr(failure.longrepr, 'reprcrash', None)
+                lines = (crash.message if crash else failure.longreprtext or "").strip().splitlines()
+                attempts.append({
+                    'attempt': attempt,
+                    'when': failure.when,
+                    'category': category,
+                    'selector': failed_selector() if failed_selector else None,
+                    'message': lines[0][:300] if lines else ""
+                })
+
+            teardown_target = _FunctionScopeOnly(item) if retry else nextitem
+            if item.session.shouldfail or item.session.shouldstop:
+                teardown_target, retry = None, False
+            reports.append(_run_phase(item, "teardown", nextitem=teardown_target))
+        finally:
+            # 与pytest一样，执行完释放用例持有的fixture值
+            item.funcargs = None
+
+        if retry:
+            for report in reports:
+                if report.failed:
+                    report.outcome = "rerun"
+        for report in reports:
+            ihook.pytest_runtest_logreport(report=report)
+        if not retry:
+            break
+        attempt += 1
+
+    entry = {
+        'nodeid': item.nodeid,
+        'attempts': attempt,
+        'outcome': "failed" if any(report.failed for report in reports) else "passed",
+        'failures': attempts
+    }
+    if attempts:
+        policy.record(entry)
+    return entry
@@ -0,0 +1,209 @@
+# utils/route_profiles.py
+"""
+网络路由配置 - 按用例拦截断言用不到的资源（图片、字体、第三方统计等）
+配置在config.yaml的routing中，用例通过 @pytest.mark.routing("名称") 选择，
+并统计每个用例拦截的请求数和估算节省的流量
+"""
+from fnmatch import fnmatch
+from urllib.parse import urlparse
+
+# 请求处理方式
+ACTION_CONTINUE = "continue"
+ACTION_BLOCK = "block"
+ACTION_STUB = "stub"
+
+
+class RouteStats:
+    """单个用例的请求统计"""
+
+    def __init__(self, profile_name):
+        self.profile_name = profile_name
+        self.requests = 0
+        self.blocked = 0
+        self.stubbed = 0
+        self.bytes_saved = 0
+        self.by_type = {}
+
+    def record(self, action, resource_type, estimated_bytes):
+        """记录一次请求的处理结果"""
+        self.requests += 1
+        if action == ACTION_CONTINUE:
+            return
+        if action == ACTION_BLOCK:
+            self.blocked += 1
+        else:
+            self.stubbed += 1
+        self.bytes_saved += estimated_bytes
+        self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+
+    def summary(self):
+        """
+        统计摘要
+        Returns:
+            统计字典
+        """
+        return {
+            'profile': self.profile_name,
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'stubbed': self.stubbed,
+            'requests_saved': self.blocked + self.stubbed,
+            'estimated_bytes_saved': self.bytes_saved,
+            'saved_by_type': dict(self.by_type)
+        }
+
+
+class RouteProfile:
+    """
+    路由配置
+    拦截指定资源类型、URL模式或第三方请求，对指定URL返回空响应，其余请求正常放行
+    """
+
+    def __init__(self, name, block_resource_types=(), block_url_patterns=(), stub_url_patterns=(),
+                 block_third_party=False, estimated_bytes=None, first_party_hosts=()):
+        """
+        初始化路由配置
+        Args:
+            name: 配置名称
+            block_resource_types: 拦截的资源类型，如image/font/media/stylesheet
+            block_url_patterns: 拦截的URL通配符模式
+            stub_url_patterns: 返回204空响应的URL通配符模式（如统计上报接口）
+            block_third_party: 是否拦截非被测站点域名的请求
+            estimated_bytes: 各资源类型被拦截时估算节省的字节数
+            first_party_hosts: 视为被测站点自身的主机名通配符（如 *.zhibenai.com），
+                               被测站点主机及其子域名总是视为站点自身
+        """
+        self.name = name
+        self.block_resource_types = set(block_resource_types or ())
+        self.block_url_patterns = tuple(block_url_patterns or ())
+        self.stub_url_patterns = tuple(stub_url_patterns or ())
+        self.block_third_party = block_third_party
+        self.estimated_bytes = estimated_bytes or {}
+        self.first_party_hosts = tuple(first_party_hosts or ())
+
+    @classmethod
+    def from_config(cls, config, name=None):
+        """
+        根据config.yaml的routing配置创建
+        Args:
+            config: Config对象
+            name: 配置名称，默认使用routing.default
+        Returns:
+            RouteProfile实例
+        """
+        routing_config = config.get('routing', {})
+        name = name or routing_config.get('default', 'full')
+        profiles = routing_config.get('profiles', {})
+        if name not in profiles:
+            raise ValueError(f"未定义的路由配置: {name}，可选: {', '.join(profiles)}")
+        return cls(
+            name,
+            estimated_bytes=routing_config.get('estimated_bytes'),
+            first_party_hosts=routing_config.get('first_party_hosts'),
+            **(profiles[name] or {})
+        )
+
+    @property
+    def is_passthrough(self):
+        """是否不拦截任何请求"""
+        return not (self.block_resource_types or self.block_url_patterns
+                    or self.stub_url_patterns or self.block_third_party)
+
+    def is_first_party(self, host, site_host):
+        """
+        请求主机是否属于被测站点
+        不按"最后两级域名"猜测主域名（*.com.cn、*.edu.cn等会把无关站点归为同一站点），
+        只认被测站点主机及其子域名和first_party_hosts中配置的主机
+        Args:
+            host: 请求的主机名
+            site_host: 被测站点的主机名
+        Returns:
+            是否属于被测站点
+        """
+        host = host.lower()
+        site_host = site_host.lower()
+        if host == site_host or host.endswith(f".{site_host}"):
+            return True
+        return any(fnmatch(host, pattern.lower()) for pattern in self.first_party_hosts)
+
+    def decide(self, url, resource_type, base_url):
+        """
+        决定请求的处理方式
+        Args:
+            url: 请求地址
+            resource_type: Playwright的资源类型
+            base_url: 被测站点地址
+        Returns:
+            ACTION_CONTINUE / ACTION_BLOCK / ACTION_STUB
+        """
+        if any(fnmatch(url, pattern) for pattern in self.stub_url_patterns):
+            return ACTION_STUB
+        if resource_type in self.block_resource_types:
+            return ACTION_BLOCK
+        if any(fnmatch(url, pattern) for pattern in self.block_url_patterns):
+            return ACTION_BLOCK
+        if self.block_third_party:
+            host = urlparse(url).hostname or ""
+            site_host = urlparse(base_url).hostname or ""
+            if url.startswith("http") and not self.is_first_party(host, site_host):
+                return ACTION_BLOCK
+        return ACTION_CONTINUE
+
+    def _estimate(self, resource_type):
+        """估算被拦截资源的大小"""
+        return self.estimated_bytes.get(resource_type, self.estimated_bytes.get('other', 0))
+
+    def apply(self, context, base_url):
+        """
+        在同步BrowserContext上注册路由
+        Args:
+            context: Playwright的同步BrowserContext
+            base_url: 被测站点地址
+        Returns:
+            RouteStats，用例结束后读取统计
+        """
+        stats = RouteStats(self.name)
+        if self.is_passthrough:
+            context.on("request", lambda request: stats.record(ACTION_CONTINUE, request.resource_type, 0))
+            return stats
+
+        def handle(route, request):
+            action = self.decide(request.url, request.resource_type, base_url)
+            stats.record(action, request.resource_type, self._estimate(request.resource_type))
+            if action == ACTION_BLOCK:
+                route.abort("blockedbyclient")
+            elif action == ACTION_STUB:
+                route.fulfill(status=204, body="")
+            else:
+                # fallback而不是continue_，交给其他已注册的路由（如HAR回放）继续处理
+                route.fallback()
+
+        context.route("**/*", handle)
+        return stats
+
+    async def apply_async(self, context, base_url):
+        """
+        在异步BrowserContext上注册路由，规则与apply相同
+        Args:
+            context: Playwright的异步BrowserContext
+            base_url: 被测站点地址
+        Returns:
+            RouteStats
+        """
+        stats = RouteStats(self.name)
+        if self.is_passthrough:
+            context.on("request", lambda request: stats.record(ACTION_CONTINUE, request.resource_type, 0))
+            return stats
+
+        async def handle(route, request):
+            action = self.decide(request.url, request.resource_type, base_url)
+            stats.record(action, request.resource_type, self._estimate(request.resource_type))
+            if action == ACTION_BLOCK:
+                await route.abort("blockedbyclient")
+            elif action == ACTION_STUB:
+                await route.fulfill(status=204, body="")
+            else:
+                await route.fallback()
+
+        await context.route("**/*", handle)
+        return stats
@@ -0,0 +1,72 @@
+# utils/sleep_lint.py
+"""
+固定等待检查工具 - 找出测试代码中残留的固定时长等待
+page.wait_for_timeout()、time.sleep() 只会拖慢用例并掩盖时序问题，
+应改用BasePage提供的 wait_until_ready / wait_for_url_change / wait_for_response 等事件驱动等待
+
+用法：python -m utils.sleep_lint [路径 ...]   （默认检查 test_cases/）
+"""
+import ast
+import os
+import sys
+
+# 视为固定等待的函数名
+SLEEP_CALLS = ('wait_for_timeout', 'sleep')
+
+
+def find_fixed_sleeps(path):
+    """
+    检查单个Python文件中的固定等待调用
+    Args:
+        path: 文件路径
+    Returns:
+        [(文件路径, 行号, 调用代码), ...]
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    findings = []
+    for node in ast.walk(ast.parse(source, filename=path)):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        if name in SLEEP_CALLS:
+            findings.append((path, node.lineno, ast.get_source_segment(source, node)))
+    return findings
+
+
+def lint_paths(paths):
+    """
+    检查目录或文件列表
+    Args:
+        paths: 目录或文件路径列表
+    Returns:
+        所有检查结果
+    """
+    findings = []
+    for path in paths:
+        if os.path.isfile(path):
+            findings.extend(find_fixed_sleeps(path))
+            continue
+        for root, _, files in os.walk(path):
+            for file_name in sorted(files):
+                if file_name.endswith('.py'):
+                    findings.extend(find_fixed_sleeps(os.path.join(root, file_name)))
+    return findings
+
+
+def main(argv=None):
+    """命令行入口，发现固定等待时返回1"""
+    paths = (argv if argv is not None else sys.argv[1:]) or ['test_cases']
+    findings = lint_paths(paths)
+    for path, lineno, code in findings:
+        print(f"{path}:{lineno}: 固定等待 {code}")
+    if findings:
+        print(f"共发现 {len(findings)} 处固定等待，请改用事件驱动的等待方法")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# utils/tracing.py
+"""
+Playwright追踪 - 为每个用例录制trace（操作、DOM快照、网络、控制台），失败后可用
+playwright show-trace 回放，不必手动重跑
+每个用例对应上下文中的一个trace chunk，只有需要保留时才导出文件
+"""
+import os
+import re
+from datetime import datetime
+from utils.worker import worker_path
+
+# 运行模式
+MODE_OFF = "off"
+MODE_ON = "on"
+MODE_RETAIN_ON_FAILURE = "retain-on-failure"
+MODE_ON_FIRST_RETRY = "on-first-retry"
+MODES = (MODE_OFF, MODE_ON, MODE_RETAIN_ON_FAILURE, MODE_ON_FIRST_RETRY)
+
+
+class TraceRecorder:
+    """
+    trace录制
+    off: 不录制；on: 全部保留；retain-on-failure: 全部录制，只保留失败用例；
+    on-first-retry: 只在用例第一次重试时录制并保留
+    """
+
+    def __init__(self, mode=MODE_RETAIN_ON_FAILURE, directory="reports/traces", screenshots=True,
+                 snapshots=True, sources=False):
+        """
+        初始化trace录制
+        Args:
+            mode: off/on/retain-on-failure/on-first-retry
+            directory: trace文件目录
+            screenshots: 是否录制操作过程截图
+            snapshots: 是否录制DOM快照
+            sources: 是否包含测试源码
+        """
+        if mode not in MODES:
+            raise ValueError(f"未知的trace模式: {mode}，可选: {', '.join(MODES)}")
+        self.mode = mode
+        self.directory = directory
+        self.screenshots = screenshots
+        self.snapshots = snapshots
+        self.sources = sources
+
+    @classmethod
+    def from_config(cls, config, mode=None):
+        """
+        根据config.yaml的tracing配置创建，并行执行时每个worker使用独立的目录
+        Args:
+            config: Config对象
+            mode: 命令行指定的模式，优先于配置文件
+        Returns:
+            TraceRecorder实例
+        """
+        tracing_config = config.get('tracing', {})
+        return cls(
+            mode=mode or tracing_config.get('mode', MODE_RETAIN_ON_FAILURE),
+            directory=tracing_config.get('dir', "reports/traces"),
+            screenshots=tracing_config.get('screenshots', True),
+            snapshots=tracing_config.get('snapshots', True),
+            sources=tracing_config.get('sources', False)
+        )
+
+    def should_record(self, attempt=1):
+        """
+        本次执行是否录制
+        Args:
+            attempt: 第几次执行（1为首次，大于1为重试）
+        Returns:
+            是否录制
+        """
+        if self.mode == MODE_OFF:
+            return False
+        if self.mode == MODE_ON_FIRST_RETRY:
+            return attempt == 2
+        return True
+
+    def start(self, context, title, attempt=1):
+        """
+        开始录制用例的trace chunk
+        Args:
+            context: Playwright的BrowserContext
+            title: trace标题（用例nodeid）
+            attempt: 第几次执行
+        Returns:
+            是否开始录制
+        """
+        if not self.should_record(attempt):
+            return False
+        context.tracing.start(screenshots=self.screenshots, snapshots=self.snapshots, sources=self.sources)
+        context.tracing.start_chunk(title=title)
+        return True
+
+    def stop(self, context, title, failed):
+        """
+        结束录制，按模式决定是否导出trace文件
+        不保留时直接丢弃chunk，不产生导出和写盘开销
+        Args:
+            context: Playwright的BrowserContext
+            title: trace标题（用例nodeid）
+            failed: 用例是否失败
+        Returns:
+            trace文件路径，未保留时返回None
+        """
+        path = None
+        if self.mode != MODE_RETAIN_ON_FAILURE or failed:
+            safe_name = re.sub(r"[^\w.-]+", "_", title).strip("_")
+            path = worker_path(self.directory, f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
+            context.tracing.stop_chunk(path=path)
+        else:
+            context.tracing.stop_chunk()
+        context.tracing.stop()
+        return path if path and os.path.exists(path) else None
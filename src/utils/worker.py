@@ -0,0 +1,49 @@
+# utils/worker.py
+"""
+并行执行工具 - 识别当前pytest-xdist worker
+为日志、截图、登录缓存等提供按worker隔离的命名空间
+"""
+import os
+
+# 非并行运行（或xdist主进程）时的worker名称
+MASTER = "master"
+
+
+def get_worker_id():
+    """
+    获取当前worker id
+    Returns:
+        xdist worker id（如gw0），非并行运行时返回master
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", MASTER)
+
+
+def get_worker_index():
+    """
+    获取当前worker序号
+    Returns:
+        gw3返回3，非并行运行时返回0
+    """
+    worker_id = get_worker_id()
+    if worker_id == MASTER:
+        return 0
+    return int(worker_id.lstrip("gw") or 0)
+
+
+def is_xdist_worker():
+    """当前进程是否为xdist worker"""
+    return get_worker_id() != MASTER
+
+
+def worker_path(base_dir, *parts):
+    """
+    生成按worker隔离的路径，非并行运行时保持原路径不变
+    Args:
+        base_dir: 基础目录，如reports/screenshots
+        parts: 目录下的子路径
+    Returns:
+        路径字符串（目录会自动创建）
+    """
+    directory = os.path.join(base_dir, get_worker_id()) if is_xdist_worker() else base_dir
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, *parts)